@@ -0,0 +1,174 @@
+"""Generate synthetic skill repositories for benchmarking.
+
+Usage:
+    python -m benchmarks.generate /tmp/bench-repo --skills 10000
+"""
+
+import random
+from pathlib import Path
+from typing import Dict
+
+import click
+import yaml
+
+WORDS = (
+    "analysis atom batch cache chemistry data debug deploy docs energy export format "
+    "graph install kernel lab model notebook numpy optimize parse pipeline plot "
+    "profile python query render report review schema search simulate skill table "
+    "test token trace validate vector workflow yaml"
+).split()
+TOOLS = ["Bash", "Read", "Write", "Edit", "Glob", "Grep", "WebFetch", "WebSearch"]
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    """Return a pseudo-random sentence."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + "."
+
+
+def _paragraphs(rng: random.Random, size: int) -> str:
+    """Return markdown body text of roughly size bytes."""
+    parts = []
+    total = 0
+    section = 0
+    while total < size:
+        if section % 4 == 0:
+            heading = f"## Section {section // 4 + 1}: {rng.choice(WORDS).title()}\n\n"
+            parts.append(heading)
+            total += len(heading)
+        paragraph = " ".join(_sentence(rng) for _ in range(5)) + "\n\n"
+        parts.append(paragraph)
+        total += len(paragraph)
+        section += 1
+    return "".join(parts)
+
+
+def _category_path(index: int, categories: int, depth: int) -> Path:
+    """Return the (possibly nested) category directory for a skill index."""
+    path = Path(f"category-{index % categories:03d}")
+    for level in range(1, depth):
+        path = path / f"group-{(index // categories + level) % 4}"
+    return path
+
+
+def generate_repository(
+    root: Path,
+    skills: int = 100,
+    commands: int = 20,
+    categories: int = 10,
+    depth: int = 1,
+    references: int = 3,
+    body_bytes: int = 4096,
+    seed: int = 0,
+) -> Dict:
+    """
+    Generate a synthetic skills repository.
+
+    Args:
+        root: Directory to create the repository in
+        skills: Number of skills to generate
+        commands: Number of commands to generate
+        categories: Number of top-level skill categories
+        depth: Category nesting depth (1 = skills/<category>/<skill>)
+        references: Reference files per skill
+        body_bytes: Approximate SKILL.md body size in bytes
+        seed: Random seed, so the same arguments produce the same tree
+
+    Returns:
+        Dictionary describing what was generated
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    total_bytes = 0
+
+    for i in range(skills):
+        name = f"skill-{i:05d}"
+        skill_dir = root / "skills" / _category_path(i, categories, depth) / name
+        (skill_dir / "references").mkdir(parents=True, exist_ok=True)
+
+        tools = sorted(rng.sample(TOOLS, rng.randint(1, 4)))
+        frontmatter = yaml.safe_dump(
+            {"name": name, "description": _sentence(rng, 20), "allowed-tools": tools},
+            sort_keys=False,
+        )
+        links = "".join(f"- [Reference {j}](references/topic-{j}.md)\n" for j in range(references))
+        content = (
+            f"---\n{frontmatter}---\n\n# {name}\n\n{_sentence(rng)}\n\n"
+            f"## References\n\n{links}\n{_paragraphs(rng, body_bytes)}"
+        )
+        (skill_dir / "SKILL.md").write_text(content)
+        total_bytes += len(content)
+
+        for j in range(references):
+            reference = f"# Topic {j}\n\n{_paragraphs(rng, body_bytes // 2)}"
+            (skill_dir / "references" / f"topic-{j}.md").write_text(reference)
+            total_bytes += len(reference)
+
+    for i in range(commands):
+        cmd_dir = root / "commands" / f"category-{i % categories:03d}"
+        cmd_dir.mkdir(parents=True, exist_ok=True)
+        content = (
+            f"---\ndescription: {_sentence(rng, 8)}\n---\n\n"
+            f"# Command {i}\n\nRun with $ARGUMENTS.\n\n{_sentence(rng)}\n"
+        )
+        (cmd_dir / f"command-{i:05d}.md").write_text(content)
+        total_bytes += len(content)
+
+    _write_agents(root)
+
+    return {
+        "path": str(root),
+        "skills": skills,
+        "commands": commands,
+        "categories": categories,
+        "depth": depth,
+        "references": references,
+        "body_bytes": body_bytes,
+        "total_bytes": total_bytes,
+    }
+
+
+def _write_agents(root: Path):
+    """Write a minimal .ai agent specification so export can run."""
+    agents_dir = root / ".ai" / "agents"
+    agents_dir.mkdir(parents=True, exist_ok=True)
+    agents = {
+        "version": "1.0",
+        "capabilities": {"benchmark": {"description": "Synthetic benchmark capability"}},
+        "roles": {"bench": {"default-capabilities": ["benchmark"], "policies": "- Be fast"}},
+        "agents": [{"id": "default", "name": "Benchmark Agent", "role": "bench"}],
+    }
+    with open(agents_dir / "agents.yaml", "w") as f:
+        yaml.safe_dump(agents, f, sort_keys=False)
+
+    policies_dir = root / ".ai" / "policies"
+    policies_dir.mkdir(parents=True, exist_ok=True)
+    (policies_dir / "global.md").write_text("# Global Policies\n\n- Benchmark policy\n")
+
+
+@click.command()
+@click.argument("path", type=click.Path(file_okay=False))
+@click.option("--skills", default=100, show_default=True, help="Number of skills")
+@click.option("--commands", default=20, show_default=True, help="Number of commands")
+@click.option("--categories", default=10, show_default=True, help="Top-level categories")
+@click.option("--depth", default=1, show_default=True, help="Category nesting depth")
+@click.option("--references", default=3, show_default=True, help="Reference files per skill")
+@click.option("--body-bytes", default=4096, show_default=True, help="SKILL.md body size")
+@click.option("--seed", default=0, show_default=True, help="Random seed")
+def main(path, skills, commands, categories, depth, references, body_bytes, seed):
+    """Generate a synthetic skills repository at PATH."""
+    summary = generate_repository(
+        Path(path),
+        skills=skills,
+        commands=commands,
+        categories=categories,
+        depth=depth,
+        references=references,
+        body_bytes=body_bytes,
+        seed=seed,
+    )
+    click.echo(yaml.safe_dump(summary, sort_keys=False), nl=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Run end-to-end benchmarks against synthetic repositories.
+
+Usage:
+    python -m benchmarks.run --sizes 100,1000
+    python -m benchmarks.run --save-baseline
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run --no-compare --output results.json
+"""
+
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+from click.testing import CliRunner
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.generate import generate_repository
+from cli.config import Config
+from cli.main import cli
+from cli.profiling import profiler
+
+console = Console()
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+RESULTS_VERSION = 1
+
+
+# CLI arguments of each scenario; {work} is replaced by a scratch directory
+SCENARIOS = {
+    "list": ["list", "--source", "repository"],
+    "search": ["search", "analysis"],
+    "info": ["info", "skill-00000"],
+    "install --all": ["install", "--all", "--platform", "claude", "--force"],
+    "validate": ["validate", "--format", "jsonl"],
+    "stats": ["stats", "--format", "json"],
+    "export": ["export", "--platform", "codex", "--output", "{work}/AGENTS.md"],
+}
+
+
+def run_scenario(scenario: List[str], home: Path, repeat: int) -> Dict:
+    """
+    Time one scenario several times.
+
+    Args:
+        scenario: CLI arguments from SCENARIOS
+        home: HOME directory holding the skillz config and install roots
+        repeat: Number of timed runs
+
+    Returns:
+        Dictionary with median/min wall time and per-phase timings of the
+        median run
+    """
+    runner = CliRunner(env={"HOME": str(home), "SKILLZ_TRACE": None})
+    timings = []
+    phases = []
+
+    for _ in range(repeat):
+        profiler.reset()
+        profiler.enable()
+        start = time.perf_counter()
+        try:
+            args = [arg.replace("{work}", str(home)) for arg in scenario]
+            result = runner.invoke(cli, args, catch_exceptions=False)
+            if result.exit_code != 0:
+                raise RuntimeError(f"'{' '.join(args)}' failed:\n{result.output}")
+        finally:
+            profiler.enabled = False
+        timings.append((time.perf_counter() - start) * 1000)
+        phases.append(profiler.summary())
+
+    median = statistics.median(timings)
+    median_run = min(range(repeat), key=lambda i: abs(timings[i] - median))
+    return {
+        "median_ms": round(median, 3),
+        "min_ms": round(min(timings), 3),
+        "runs": repeat,
+        "phases": {
+            phase["name"]: {
+                "ms": round(phase["total_ms"], 3),
+                "calls": phase["calls"],
+                "files": phase["files"],
+                "bytes": phase["bytes"],
+            }
+            for phase in phases[median_run]
+        },
+    }
+
+
+def run_benchmarks(
+    sizes: List[int],
+    scenarios: List[str],
+    repeat: int = 3,
+    references: int = 3,
+    body_bytes: int = 4096,
+) -> Dict:
+    """Generate a repository per size and time every scenario against it."""
+    results = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": {},
+    }
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix="skillz-bench-") as tmp:
+            tmp_path = Path(tmp)
+            start = time.perf_counter()
+            summary = generate_repository(
+                tmp_path / "repo",
+                skills=size,
+                commands=max(1, size // 10),
+                categories=max(1, min(50, size // 20)),
+                depth=2,
+                references=references,
+                body_bytes=body_bytes,
+            )
+            summary["generate_ms"] = round((time.perf_counter() - start) * 1000, 3)
+
+            home = tmp_path / "home"
+            Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(
+                tmp_path / "repo"
+            )
+
+            size_results = {"repository": summary, "scenarios": {}}
+            for name in scenarios:
+                console.print(f"[dim]{size} skills: {name}[/dim]")
+                size_results["scenarios"][name] = run_scenario(SCENARIOS[name], home, repeat)
+            results["sizes"][str(size)] = size_results
+
+    return results
+
+
+def compare(results: Dict, baseline: Dict, threshold: float, min_delta_ms: float) -> List[Dict]:
+    """
+    Compare results with a baseline.
+
+    A scenario regresses when its median exceeds the baseline median by more
+    than threshold (a fraction) and by more than min_delta_ms, so noise in
+    very fast scenarios does not fail the run.
+
+    Returns:
+        One row per scenario present in both results and baseline
+    """
+    rows = []
+    for size, size_results in results["sizes"].items():
+        base_size = baseline.get("sizes", {}).get(size)
+        if not base_size:
+            continue
+        for name, current in size_results["scenarios"].items():
+            base = base_size["scenarios"].get(name)
+            if not base:
+                continue
+            ratio = current["median_ms"] / base["median_ms"] if base["median_ms"] else 1.0
+            delta = current["median_ms"] - base["median_ms"]
+            rows.append(
+                {
+                    "size": size,
+                    "scenario": name,
+                    "baseline_ms": base["median_ms"],
+                    "current_ms": current["median_ms"],
+                    "ratio": ratio,
+                    "regressed": ratio > 1 + threshold and delta > min_delta_ms,
+                }
+            )
+    return rows
+
+
+def _print_results(results: Dict, comparison: Optional[List[Dict]]):
+    """Print a table of scenario timings, with baseline ratios if available."""
+    ratios = {(row["size"], row["scenario"]): row for row in comparison or []}
+
+    table = Table(title="Benchmark Results")
+    table.add_column("Skills", justify="right")
+    table.add_column("Scenario", style="cyan")
+    table.add_column("Median (ms)", justify="right", style="green")
+    table.add_column("Slowest phases", style="dim")
+    if comparison is not None:
+        table.add_column("vs baseline", justify="right")
+
+    for size, size_results in results["sizes"].items():
+        for name, current in size_results["scenarios"].items():
+            slowest = sorted(current["phases"].items(), key=lambda p: -p[1]["ms"])[:3]
+            row = [
+                size,
+                name,
+                f"{current['median_ms']:.1f}",
+                ", ".join(f"{phase} {data['ms']:.1f}" for phase, data in slowest),
+            ]
+            if comparison is not None:
+                match = ratios.get((size, name))
+                if not match:
+                    row.append("-")
+                elif match["regressed"]:
+                    row.append(f"[red]{match['ratio']:.2f}x[/red]")
+                else:
+                    row.append(f"{match['ratio']:.2f}x")
+            table.add_row(*row)
+
+    console.print(table)
+
+
+@click.command()
+@click.option("--sizes", default="100,1000", show_default=True, help="Comma-separated skill counts")
+@click.option(
+    "--scenario",
+    "scenarios",
+    multiple=True,
+    type=click.Choice(list(SCENARIOS)),
+    help="Scenario to run (repeatable, default: all)",
+)
+@click.option("--repeat", default=3, show_default=True, help="Timed runs per scenario")
+@click.option("--references", default=3, show_default=True, help="Reference files per skill")
+@click.option("--body-bytes", default=4096, show_default=True, help="SKILL.md body size")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write results JSON here")
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False),
+    default=str(DEFAULT_BASELINE),
+    show_default=True,
+    help="Baseline results to compare against",
+)
+@click.option("--save-baseline", is_flag=True, help="Store these results as the new baseline")
+@click.option("--no-compare", is_flag=True, help="Only time the scenarios, without a baseline")
+@click.option(
+    "--threshold",
+    default=0.25,
+    show_default=True,
+    help="Allowed slowdown before failing, as a fraction of the baseline",
+)
+@click.option(
+    "--min-delta-ms",
+    default=5.0,
+    show_default=True,
+    help="Ignore regressions smaller than this many milliseconds",
+)
+def main(
+    sizes,
+    scenarios,
+    repeat,
+    references,
+    body_bytes,
+    output,
+    baseline,
+    save_baseline,
+    no_compare,
+    threshold,
+    min_delta_ms,
+):
+    """
+    Benchmark skillz commands end to end and per phase.
+
+    Results are compared with the baseline and the run fails if a scenario
+    regressed. A missing baseline is an error, so that a regression check
+    cannot silently pass; use --save-baseline to record one, or --no-compare
+    to only time the scenarios.
+    """
+    baseline_path = Path(baseline)
+    if not (save_baseline or no_compare or baseline_path.exists()):
+        console.print(
+            f"[red]Error: Baseline {baseline_path} not found; "
+            "record one with --save-baseline or pass --no-compare[/red]"
+        )
+        sys.exit(2)
+
+    size_list = [int(size) for size in sizes.split(",") if size.strip()]
+    results = run_benchmarks(
+        size_list,
+        list(scenarios) or list(SCENARIOS),
+        repeat=repeat,
+        references=references,
+        body_bytes=body_bytes,
+    )
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2) + "\n")
+
+    if save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2) + "\n")
+        _print_results(results, None)
+        console.print(f"[green]Baseline saved to {baseline_path}[/green]")
+        return
+
+    comparison = None
+    if not no_compare:
+        comparison = compare(
+            results, json.loads(baseline_path.read_text()), threshold, min_delta_ms
+        )
+    _print_results(results, comparison)
+    if comparison == []:
+        console.print(f"[red]Error: No scenario of these results is in {baseline_path}[/red]")
+        sys.exit(2)
+
+    regressions = [row for row in comparison or [] if row["regressed"]]
+    if regressions:
+        console.print(f"[red]{len(regressions)} scenario(s) regressed beyond {threshold:.0%}[/red]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
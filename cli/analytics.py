@@ -0,0 +1,110 @@
+"""Repository statistics for ``skillz stats``.
+
+Everything is computed from catalog records in one pass, after
+``Catalog.scan_stats`` has sized every item with a single walk.
+"""
+
+import statistics
+from collections import Counter
+from typing import Dict, Iterable, List, Sequence
+
+from cli.catalog import Catalog, CatalogRecord
+from cli.locations import probe
+
+NO_TOOLS = "(unspecified)"
+
+
+def summarize(records: Iterable[CatalogRecord]) -> Dict:
+    """
+    Aggregate counts, sizes and token estimates of records.
+
+    Returns:
+        Dictionary with overall totals and medians, per-category rows
+        sorted by category, and the allowed-tools distribution
+    """
+    categories: Dict[str, Dict] = {}
+    sizes: Dict[str, List[int]] = {}
+    tools: Counter = Counter()
+    all_sizes: List[int] = []
+    all_tokens: List[int] = []
+
+    for record in records:
+        stats = record.stats
+        row = categories.get(record.category)
+        if row is None:
+            row = categories[record.category] = {
+                "category": record.category,
+                "skills": 0,
+                "commands": 0,
+                "bytes": 0,
+                "tokens": 0,
+            }
+            sizes[record.category] = []
+        row["skills" if record.type == "skill" else "commands"] += 1
+        row["bytes"] += stats.bytes
+        row["tokens"] += stats.body_tokens
+        sizes[record.category].append(stats.bytes)
+        all_sizes.append(stats.bytes)
+        all_tokens.append(stats.body_tokens)
+
+        if record.type == "skill":
+            allowed = record.allowed_tools
+            if isinstance(allowed, list):
+                tools.update(allowed)
+            else:
+                tools[allowed or NO_TOOLS] += 1
+
+    rows = []
+    for category in sorted(categories):
+        row = categories[category]
+        row["median_bytes"] = int(statistics.median(sizes[category]))
+        rows.append(row)
+
+    return {
+        "skills": sum(row["skills"] for row in rows),
+        "commands": sum(row["commands"] for row in rows),
+        "bytes": sum(all_sizes),
+        "tokens": sum(all_tokens),
+        "median_bytes": int(statistics.median(all_sizes)) if all_sizes else 0,
+        "median_tokens": int(statistics.median(all_tokens)) if all_tokens else 0,
+        "categories": rows,
+        "allowed_tools": dict(tools.most_common()),
+    }
+
+
+def repository_stats(catalog: Catalog, largest: int = 10) -> Dict:
+    """Summarize a repository catalog, including its largest files."""
+    largest_files = catalog.scan_stats(largest)
+    summary = summarize(catalog.skill_records() + catalog.command_records())
+    summary["largest_files"] = [{"path": path, "bytes": size} for path, size in largest_files]
+    return summary
+
+
+def install_footprint(catalogs: Sequence[Catalog]) -> List[Dict]:
+    """
+    Count and size the items installed in each location.
+
+    Locations are scanned concurrently.
+
+    Args:
+        catalogs: Catalogs of install locations
+
+    Returns:
+        One row per location that has installed items
+    """
+    rows = []
+    probe(catalogs, lambda catalog: catalog.scan_stats(largest=0))
+    for catalog in catalogs:
+        skills = catalog.skill_records()
+        commands = catalog.command_records()
+        if not skills and not commands:
+            continue
+        rows.append(
+            {
+                "location": catalog.location,
+                "skills": len(skills),
+                "commands": len(commands),
+                "bytes": sum(record.stats.bytes for record in skills + commands),
+            }
+        )
+    return rows
@@ -0,0 +1,173 @@
+"""Persistent build cache for incremental export."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+
+class BuildCache:
+    """
+    File digests and output fingerprints remembered between runs.
+
+    Digests and parsed catalog metadata (frontmatter, heading indexes) are
+    keyed by path and invalidated by (mtime_ns, size), so an unchanged file
+    is never read again. Outputs remember the fingerprint of the inputs they
+    were generated from and their own stat signature, which lets ``skillz
+    export`` skip regenerating a file whose inputs and contents are both
+    unchanged.
+
+    The cache is an optimization only: a missing, corrupt or unwritable
+    cache file behaves like an empty cache.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize a cache stored at path, or an in-memory cache if path is None."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._files: Dict[str, List] = {}
+        self._outputs: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        self._files = data.get("files", {})
+        self._outputs = data.get("outputs", {})
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            data = {"version": self.VERSION, "files": self._files, "outputs": self._outputs}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".build-cache-")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except OSError:
+                return
+            self._dirty = False
+
+    def digest(self, path: Path, frontmatter_only: bool = False) -> str:
+        """
+        Return a digest of a file's content, or of its frontmatter only.
+
+        Missing files digest to 'missing' so that creating them changes
+        the fingerprint.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return "missing"
+        key = f"{path}#fm" if frontmatter_only else str(path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = self._files.get(key)
+        if cached and cached[:2] == signature:
+            return cached[2]
+
+        content = path.read_bytes()
+        if frontmatter_only:
+            match = FRONTMATTER_PATTERN.match(content.decode("utf-8", errors="replace"))
+            content = match.group(1).encode() if match else b""
+        value = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            self._files[key] = signature + [value]
+            self._dirty = True
+        return value
+
+    def metadata(self, path: Path, load: Callable[[Path], Dict], kind: str = "meta") -> Dict:
+        """
+        Return load(path), reusing the result of an earlier run while the file is unchanged.
+
+        load must return a JSON-serializable dict. Each kind of metadata is
+        cached separately. Missing files are loaded every time and never
+        cached.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return load(path)
+        key = f"{path}#{kind}"
+        signature = [stat.st_mtime_ns, stat.st_size]
+        cached = self._files.get(key)
+        if cached and cached[:2] == signature:
+            return cached[2]
+
+        value = load(path)
+        with self._lock:
+            self._files[key] = signature + [value]
+            self._dirty = True
+        return value
+
+    def is_fresh(self, output: Path, fingerprint: str) -> bool:
+        """
+        True if output was generated from fingerprint and has not changed since.
+
+        Extra files recorded with the output (export shards) must be unchanged too.
+        """
+        entry = self._outputs.get(str(output))
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return False
+        try:
+            return all(
+                stats == _signature(Path(path))
+                for path, stats in [(str(output), entry.get("stat"))] + entry.get("files", [])
+            )
+        except OSError:
+            return False
+
+    def output_files(self, output: Path) -> List[Path]:
+        """Extra files recorded with output by the last export."""
+        entry = self._outputs.get(str(output), {})
+        return [Path(path) for path, _ in entry.get("files", [])]
+
+    def output_report(self, output: Path) -> Dict:
+        """Report recorded with output by the last export (for example elided items)."""
+        return self._outputs.get(str(output), {}).get("report", {})
+
+    def record_output(
+        self,
+        output: Path,
+        fingerprint: str,
+        files: Sequence[Path] = (),
+        report: Optional[Dict] = None,
+    ) -> None:
+        """
+        Remember that output, and any extra files, now hold the result for fingerprint.
+
+        A JSON-serializable report is kept with it, so that runs which skip
+        regenerating the output can show the same report.
+        """
+        entry = {
+            "fingerprint": fingerprint,
+            "stat": _signature(output),
+            "files": [[str(path), _signature(path)] for path in files],
+            "report": report or {},
+        }
+        with self._lock:
+            self._outputs[str(output)] = entry
+            self._dirty = True
+
+
+def _signature(path: Path) -> List[int]:
+    """Return the [mtime_ns, size] signature of a file."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
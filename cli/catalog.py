@@ -0,0 +1,594 @@
+"""Repository catalog of skills and commands."""
+
+import heapq
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from cli.buildcache import BuildCache
+from cli.gitindex import GitIndex
+from cli.profiling import profiler
+from cli.sections import Section, index_sections
+from cli.utils import find_command_files, find_skill_directories
+from cli.validator import CommandValidator, SkillValidator
+
+# Token estimates use the common ~4 characters per token rule of thumb.
+CHARS_PER_TOKEN = 4
+
+
+class ItemStats(NamedTuple):
+    """Size of a skill or command, as it affects an agent's context budget."""
+
+    files: int
+    bytes: int
+    body_bytes: int
+    body_tokens: int
+    references: int
+
+
+class CatalogRecord:
+    """
+    Compact record of one skill or command.
+
+    Records use ``__slots__`` so large catalogs do not pay for a dict per
+    item, and the repeated category and location strings are interned so
+    every record in a category shares one string. The markdown body is
+    read from disk on first access only, and so is the listing of a skill's
+    files, which both its size statistics and its link checks are built from.
+
+    Records also support read-only mapping access (``record["name"]``,
+    ``record.get("description")``) for code written against the plain
+    dictionaries skillz used to pass around.
+    """
+
+    __slots__ = (
+        "name",
+        "description",
+        "path",
+        "relpath",
+        "category",
+        "location",
+        "_body",
+        "_body_size",
+        "_stats",
+        "_listing",
+    )
+
+    type = ""
+    _FIELDS: Tuple[str, ...] = ("name", "description", "path", "relpath", "category", "location")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        path: Path,
+        relpath: Optional[str] = None,
+        category: str = "",
+        location: str = "repository",
+    ):
+        """
+        Initialize a record.
+
+        Args:
+            name: Item name (skill directory name or command file stem)
+            description: Description from the frontmatter
+            path: Skill directory or command file
+            relpath: Path shown in listings and exports (default: str(path))
+            category: Top-level category directory, or '' if uncategorized
+            location: 'repository' or '<target>/<platform>' for installed items
+        """
+        self.name = name
+        self.description = description
+        self.path = path
+        self.relpath = relpath if relpath is not None else str(path)
+        self.category = sys.intern(category)
+        self.location = sys.intern(location)
+        self._body: Optional[str] = None
+        self._body_size: Optional[Tuple[int, int]] = None
+        self._stats: Optional[ItemStats] = None
+        self._listing: Optional[Dict[str, int]] = None
+
+    @property
+    def source_file(self) -> Path:
+        """The markdown file holding the frontmatter and body."""
+        return self.path
+
+    @property
+    def body(self) -> str:
+        """Markdown body without frontmatter, read on first access."""
+        if self._body is None:
+            try:
+                content = self.source_file.read_text()
+            except OSError:
+                content = ""
+            self._body = CommandValidator._remove_frontmatter(content)
+        return self._body
+
+    @property
+    def listing(self) -> Dict[str, int]:
+        """
+        Everything below a skill directory, listed on first access.
+
+        Maps the skill-relative POSIX path of every file to its size, and of
+        every directory to -1. Commands and missing skills have an empty
+        listing.
+        """
+        if self._listing is None:
+            self._set_listing(_list_tree(self.path) if self.path.is_dir() else {})
+        return self._listing
+
+    @property
+    def stats(self) -> ItemStats:
+        """Size statistics of the item, computed on first access."""
+        if self._stats is None:
+            if self.path.is_dir():
+                self.listing
+            else:
+                self._set_stats(1, _file_size(self.path), 0)
+        return self._stats
+
+    def _set_listing(self, listing: Dict[str, int]) -> None:
+        """Store the listing of a skill directory and the stats it gives."""
+        self._listing = listing
+        files = total = references = 0
+        for path, size in listing.items():
+            if size >= 0:
+                files += 1
+                total += size
+                references += path.startswith("references/")
+        self._set_stats(files, total, references)
+
+    def _set_stats(self, files: int, total: int, references: int) -> None:
+        """Store stats from directory totals and the body size."""
+        if self._body_size is None:
+            self._body_size = (len(self.body), len(self.body.encode()))
+        chars, body_bytes = self._body_size
+        self._stats = ItemStats(
+            files=files,
+            bytes=total,
+            body_bytes=body_bytes,
+            body_tokens=-(-chars // CHARS_PER_TOKEN),
+            references=references,
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the name, description and relative path as a plain dict."""
+        return {"name": self.name, "description": self.description, "path": self.relpath}
+
+    def _replace(self, **changes) -> "CatalogRecord":
+        """Return a copy of the record with some fields replaced."""
+        fields = {field: getattr(self, field) for field in self._FIELDS}
+        fields.update(changes)
+        return type(self)(**fields)
+
+    def __getitem__(self, key: str):
+        if key == "type":
+            return self.type
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        """Return the value for key, or default if the record has no such field."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _key(self) -> Tuple:
+        return tuple(getattr(self, field) for field in self._FIELDS)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.path, self.location))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r}, location={self.location!r})"
+
+
+class SkillRecord(CatalogRecord):
+    """A skill in the repository or an install location."""
+
+    __slots__ = ("allowed_tools",)
+
+    type = "skill"
+    _FIELDS = CatalogRecord._FIELDS + ("allowed_tools",)
+
+    def __init__(self, *args, allowed_tools: Union[str, List[str], None] = None, **kwargs):
+        """Initialize a skill record; see CatalogRecord for the shared fields."""
+        super().__init__(*args, **kwargs)
+        if isinstance(allowed_tools, list):
+            allowed_tools = [sys.intern(str(tool)) for tool in allowed_tools]
+        self.allowed_tools = allowed_tools
+
+    @property
+    def source_file(self) -> Path:
+        """The skill's SKILL.md."""
+        return self.path / "SKILL.md"
+
+
+class CommandRecord(CatalogRecord):
+    """A command in the repository or an install location."""
+
+    __slots__ = ()
+
+    type = "command"
+
+
+class Catalog:
+    """
+    Index of the skills and commands available in a repository.
+
+    The repository is scanned lazily, once per catalog, so callers that look
+    up many items (for example ``skillz batch``) share a single walk instead
+    of searching the tree for every name. Frontmatter is parsed only when
+    records are requested, and each file is parsed at most once. With a
+    BuildCache, parsed frontmatter is also reused across runs until the
+    file changes.
+
+    A catalog can also index an install location by passing its skills and
+    commands directories and a location label such as ``personal/claude``.
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        skills_dir: Optional[Path] = None,
+        commands_dir: Optional[Path] = None,
+        location: str = "repository",
+        cache: Optional[BuildCache] = None,
+        index: Optional[GitIndex] = None,
+    ):
+        """
+        Initialize a catalog for the repository at repo_path.
+
+        With a GitIndex, skills and commands are found from the changes git
+        reports since the last scan instead of by walking the repository.
+        """
+        self.repo_path = repo_path
+        self.cache = cache
+        self.index = index
+        self.skills_dir = skills_dir if skills_dir is not None else repo_path / "skills"
+        self.commands_dir = commands_dir if commands_dir is not None else repo_path / "commands"
+        self.location = location
+        self._skills: Optional[Dict[str, Path]] = None
+        self._commands: Optional[Dict[str, Path]] = None
+        self._indexed: Optional[Tuple[List[Path], List[Path]]] = None
+        self._skill_records: Dict[str, SkillRecord] = {}
+        self._command_records: Dict[str, CommandRecord] = {}
+        self._sections: Dict[Path, Dict[str, List[Section]]] = {}
+
+    @property
+    def skills(self) -> Dict[str, Path]:
+        """Mapping of skill name to skill directory."""
+        if self._skills is None:
+            skills = {}
+            indexed = self._index_scan()
+            found = indexed[0] if indexed else find_skill_directories(self.skills_dir)
+            for skill_path in found:
+                skills.setdefault(skill_path.name, skill_path)
+            self._skills = skills
+        return self._skills
+
+    @property
+    def commands(self) -> Dict[str, Path]:
+        """Mapping of command name to command file."""
+        if self._commands is None:
+            commands = {}
+            indexed = self._index_scan()
+            found = indexed[1] if indexed else find_command_files(self.commands_dir)
+            for cmd_path in found:
+                commands.setdefault(cmd_path.stem, cmd_path)
+            self._commands = commands
+        return self._commands
+
+    def scan(self) -> None:
+        """Scan the repository now instead of on first lookup."""
+        self.skills
+        self.commands
+
+    def _index_scan(self) -> Optional[Tuple[List[Path], List[Path]]]:
+        """Skill directories and command files from the git index, scanned once."""
+        if self.index is None:
+            return None
+        if self._indexed is None:
+            self._indexed = self.index.scan()
+            if self._indexed is None:
+                # Not a git checkout: walk the trees from now on
+                self.index = None
+        return self._indexed
+
+    def find_skill(self, name: str) -> Optional[Path]:
+        """Find a skill directory by name."""
+        return self.skills.get(name)
+
+    def find_command(self, name: str) -> Optional[Path]:
+        """Find a command file by name."""
+        return self.commands.get(name)
+
+    def detect_type(self, name: str) -> Optional[str]:
+        """Detect whether name is a skill or command."""
+        if name in self.skills:
+            return "skill"
+        if name in self.commands:
+            return "command"
+        return None
+
+    def get_skill(self, name: str) -> Optional[SkillRecord]:
+        """Get the record for a skill, parsing its frontmatter on first use."""
+        record = self._skill_records.get(name)
+        if record is None and name in self.skills:
+            skill_path = self.skills[name]
+            metadata = self._metadata(skill_path / "SKILL.md", SkillValidator)
+            record = SkillRecord(
+                name,
+                metadata["description"],
+                skill_path,
+                relpath=self._relpath(skill_path),
+                category=_category(skill_path, self.skills_dir),
+                location=self.location,
+                allowed_tools=metadata["allowed-tools"],
+            )
+            record._body_size = tuple(metadata["body"])
+            self._skill_records[name] = record
+        return record
+
+    def get_command(self, name: str) -> Optional[CommandRecord]:
+        """Get the record for a command, parsing its frontmatter on first use."""
+        record = self._command_records.get(name)
+        if record is None and name in self.commands:
+            cmd_path = self.commands[name]
+            metadata = self._metadata(cmd_path, CommandValidator)
+            record = CommandRecord(
+                name,
+                metadata["description"],
+                cmd_path,
+                relpath=self._relpath(cmd_path),
+                category=_category(cmd_path, self.commands_dir),
+                location=self.location,
+            )
+            record._body_size = tuple(metadata["body"])
+            self._command_records[name] = record
+        return record
+
+    def in_category(self, record: CatalogRecord, category: str) -> bool:
+        """
+        True if the path of record below its directory starts with category.
+
+        Skills match on their own directory and commands on the directory
+        holding them, so nested categories such as ``data/ml`` match too.
+        """
+        if record.type == "skill":
+            relative = _relative(record.path, self.skills_dir)
+        else:
+            relative = _relative(record.path.parent, self.commands_dir)
+        return (relative or "").startswith(category)
+
+    def skill_records(self) -> List[SkillRecord]:
+        """Records for every skill, sorted by name."""
+        return [self.get_skill(name) for name in sorted(self.skills)]
+
+    def command_records(self) -> List[CommandRecord]:
+        """Records for every command, sorted by name."""
+        return [self.get_command(name) for name in sorted(self.commands)]
+
+    def sections(self, name: str) -> Optional[Dict[str, List[Section]]]:
+        """
+        Heading index of a skill's or command's markdown files.
+
+        A skill indexes SKILL.md first, then its other markdown files (such
+        as references) in path order; a command indexes its own file. With a
+        BuildCache, each file is indexed again only after it changes.
+
+        Returns:
+            Sections keyed by file path relative to the item (POSIX), or None
+            if no such item exists
+        """
+        path = self.find_skill(name) or self.find_command(name)
+        if path is None:
+            return None
+        if path in self._sections:
+            return self._sections[path]
+
+        if path.is_dir():
+            files = [
+                (_relative(file, path).replace(os.sep, "/"), file) for file in _markdown_files(path)
+            ]
+        else:
+            files = [(path.name, path)]
+        index = {}
+        for relpath, file in files:
+            if self.cache is None:
+                index[relpath] = index_sections(file)
+            else:
+                rows = self.cache.metadata(file, _read_sections, kind="sections")["sections"]
+                index[relpath] = [Section(*row) for row in rows]
+        self._sections[path] = index
+        return index
+
+    def scan_stats(self, largest: int = 10) -> List[Tuple[str, int]]:
+        """
+        Compute the stats of every skill and command with one walk of the catalog.
+
+        The skills directory is walked once and every file is attributed to
+        the skill directory that contains it, so no skill is walked on its
+        own. If the catalog has not been scanned yet, the same walk also
+        discovers the skills. Listings and stats are stored on the records,
+        making later ``record.stats`` lookups and link checks free.
+
+        Args:
+            largest: Number of largest files to return
+
+        Returns:
+            The largest files as (relative path, bytes), largest first
+        """
+        listings: Dict[str, Dict[str, int]] = {}
+        sizes: List[Tuple[int, str]] = []
+
+        def record_file(path: str, size: int) -> None:
+            if largest:
+                if len(sizes) < largest:
+                    heapq.heappush(sizes, (size, path))
+                elif size > sizes[0][0]:
+                    heapq.heapreplace(sizes, (size, path))
+
+        with profiler.span("discovery", path=self.skills_dir):
+            stack = [(str(self.skills_dir), None, "")]
+            while stack:
+                directory, listing, prefix = stack.pop()
+                try:
+                    with os.scandir(directory) as it:
+                        entries = list(it)
+                except OSError:
+                    continue
+                if any(entry.name == "SKILL.md" for entry in entries):
+                    listing, prefix = {}, ""
+                    listings[directory] = listing
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if listing is not None:
+                            listing[prefix + entry.name] = -1
+                        stack.append((entry.path, listing, f"{prefix}{entry.name}/"))
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    record_file(entry.path, size)
+                    if listing is not None:
+                        listing[prefix + entry.name] = size
+
+        if self._skills is None:
+            skills: Dict[str, Path] = {}
+            # Same order as sorting Paths, without building one per directory
+            for path in sorted(listings, key=lambda path: path.split(os.sep)):
+                skill_path = Path(path)
+                skills.setdefault(skill_path.name, skill_path)
+            self._skills = skills
+            profiler.count("discovery", files=len(listings))
+
+        for name, path in self.skills.items():
+            self.get_skill(name)._set_listing(listings.get(str(path), {}))
+        for name, path in self.commands.items():
+            size = _file_size(path)
+            record_file(str(path), size)
+            self.get_command(name)._set_stats(1, size, 0)
+
+        return [(self._relpath(Path(path)), size) for size, path in sorted(sizes, reverse=True)]
+
+    def _metadata(self, path: Path, validator) -> Dict:
+        """Return the catalog fields of a markdown file, from the cache when unchanged."""
+        if self.cache is None:
+            return _read_metadata(path, validator)
+        return self.cache.metadata(path, lambda path: _read_metadata(path, validator))
+
+    def _relpath(self, path: Path) -> str:
+        """Return path relative to the catalog root, or absolute if outside it."""
+        return _relative(path, self.repo_path) or str(path)
+
+
+def _read_metadata(path: Path, validator) -> Dict:
+    """
+    Read the catalog fields of a markdown file as a JSON-serializable dict.
+
+    Returns the description, allowed-tools and the body size as [chars, bytes].
+    Unreadable files and invalid frontmatter give empty fields.
+    """
+    try:
+        content = path.read_text()
+    except (OSError, ValueError):
+        content = ""
+    try:
+        metadata = validator._parse_frontmatter(content)
+    except Exception:
+        metadata = None
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    tools = metadata.get("allowed-tools")
+    if isinstance(tools, list):
+        tools = [str(tool) for tool in tools]
+    elif not isinstance(tools, str):
+        tools = None
+    body = CommandValidator._remove_frontmatter(content)
+    return {
+        "description": _description(metadata),
+        "allowed-tools": tools,
+        "body": [len(body), len(body.encode())],
+    }
+
+
+def _read_sections(path: Path) -> Dict:
+    """Index the headings of a markdown file as a JSON-serializable dict."""
+    return {"sections": [list(section) for section in index_sections(path)]}
+
+
+def _markdown_files(skill_path: Path) -> List[Path]:
+    """Return SKILL.md followed by the other markdown files of a skill, in path order."""
+    files = []
+    for root, dirs, names in os.walk(skill_path):
+        dirs.sort()
+        files.extend(Path(root, name) for name in sorted(names) if name.endswith(".md"))
+    skill_file = skill_path / "SKILL.md"
+    return [skill_file] + [file for file in files if file != skill_file]
+
+
+def _description(metadata: Dict) -> str:
+    """Return the frontmatter description as a string ('' if missing)."""
+    description = metadata.get("description")
+    return description if isinstance(description, str) else ""
+
+
+def _list_tree(path: Path) -> Dict[str, int]:
+    """List a skill directory like ``scan_stats`` does: file sizes and -1 for directories."""
+    listing: Dict[str, int] = {}
+    with profiler.span("discovery", path=path):
+        stack = [(str(path), "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    listing[prefix + entry.name] = -1
+                    stack.append((entry.path, f"{prefix}{entry.name}/"))
+                    continue
+                try:
+                    listing[prefix + entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+    return listing
+
+
+def _file_size(path: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _relative(path: Path, base: Path) -> Optional[str]:
+    """
+    Return path relative to base, or None if it is not below base.
+
+    String prefix matching is used instead of Path.relative_to, which is
+    slow enough to matter on catalogs with many thousands of items.
+    """
+    prefix = os.path.join(str(base), "")
+    text = str(path)
+    return text[len(prefix) :] if text.startswith(prefix) else None
+
+
+def _category(path: Path, base: Path) -> str:
+    """Return the category directory of an item below base, or '' if top-level."""
+    parts = (_relative(path, base) or "").split(os.sep)
+    return parts[0] if len(parts) > 1 else ""
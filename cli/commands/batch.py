@@ -0,0 +1,331 @@
+"""Batch command for running many operations in one process."""
+
+import json
+import shlex
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from cli.commands.install import install as install_command
+from cli.commands.uninstall import uninstall as uninstall_command
+from cli.config import Config
+from cli.core import Installer, SkillRepository, SkillzError
+
+console = Console()
+
+OPERATIONS = {
+    "install": install_command,
+    "uninstall": uninstall_command,
+}
+STATUS_STYLES = {"ok": "green", "planned": "blue", "skipped": "yellow", "error": "red"}
+
+
+@click.command()
+@click.argument("file", type=click.File("r"))
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of independent operations to run in parallel",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Report format",
+)
+@click.option("--dry-run", is_flag=True, help="Preview without making changes")
+@click.pass_context
+def batch(ctx, file, jobs, output_format, dry_run):
+    """
+    Run many install and uninstall operations in one process.
+
+    FILE contains one operation per line, either as command arguments
+    (install python-ase --platform claude) or as a JSON object
+    ({"op": "install", "name": "python-ase", "platform": "claude"}).
+    Use - to read from standard input. Blank lines and lines starting
+    with # are ignored.
+
+    All operations share one configuration and repository scan. Operations
+    on different items run in parallel; operations on the same item run in
+    file order. Batch mode never prompts: existing items are skipped unless
+    --force is given, and uninstalls do not ask for confirmation.
+    """
+    verbose = ctx.obj.get("verbose", False)
+    with _Pipeline(Config(), dry_run=dry_run) as pipeline:
+        results = []
+        groups: Dict[str, List[Dict]] = {}
+        for operation in _parse_operations(file):
+            if "error" in operation:
+                results.append(_result(operation, "error", operation["error"]))
+                continue
+            try:
+                actions = pipeline.plan(operation)
+            except ValueError as e:
+                results.append(_result(operation, "error", str(e)))
+                continue
+            for action in actions:
+                groups.setdefault(action["name"], []).append(action)
+
+        if verbose and output_format == "table":
+            actions_count = sum(len(group) for group in groups.values())
+            console.print(f"Running {actions_count} operation(s) on {len(groups)} item(s)")
+
+        pipeline.snapshot([action for group in groups.values() for action in group])
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for group_results in executor.map(pipeline.run_group, groups.values()):
+                results.extend(group_results)
+
+    results.sort(key=lambda r: (r["line"], r["name"] or ""))
+
+    if output_format == "json":
+        report = {"results": results, "summary": _summarize(results)}
+        click.echo(json.dumps(report, indent=2))
+    else:
+        _print_report(results)
+
+    if any(r["status"] == "error" for r in results):
+        ctx.exit(1)
+
+
+def _parse_operations(lines: Iterable[str]) -> List[Dict]:
+    """Parse batch lines into operations with click-validated parameters."""
+    operations = []
+    for line_no, raw_line in enumerate(lines, start=1):
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        operation = {"line": line_no, "op": None, "params": {}}
+        try:
+            if line.startswith("{"):
+                args = _json_to_args(json.loads(line))
+            else:
+                args = shlex.split(line)
+            operation["op"], operation["params"] = _parse_args(args)
+        except json.JSONDecodeError as e:
+            operation["error"] = f"Invalid JSON: {e}"
+        except click.ClickException as e:
+            operation["error"] = e.format_message()
+        except ValueError as e:
+            operation["error"] = str(e)
+        operations.append(operation)
+
+    return operations
+
+
+def _json_to_args(obj: Dict) -> List[str]:
+    """Convert a JSON operation into the equivalent command arguments."""
+    if not isinstance(obj, dict):
+        raise ValueError("JSON operation must be an object")
+
+    obj = dict(obj)
+    args = [str(obj.pop("op", ""))]
+    name = obj.pop("name", None)
+    if name:
+        args.append(str(name))
+    for key, value in obj.items():
+        option = f"--{key.replace('_', '-')}"
+        if value is True:
+            args.append(option)
+        elif value not in (False, None):
+            args.extend([option, str(value)])
+    return args
+
+
+def _parse_args(args: List[str]) -> Tuple[str, Dict]:
+    """Parse operation arguments using the matching command's options."""
+    if not args or not args[0]:
+        raise ValueError("Missing operation")
+
+    op, rest = args[0], args[1:]
+    command = OPERATIONS.get(op)
+    if command is None:
+        raise ValueError(
+            f"Unknown operation '{op}' (expected one of: {', '.join(sorted(OPERATIONS))})"
+        )
+
+    if "--help" in rest:
+        raise ValueError("--help is not supported in batch files")
+    try:
+        sub_ctx = command.make_context(op, list(rest))
+    except click.exceptions.Exit:
+        # Eager options such as --help stop parsing without an error
+        raise ValueError(f"Operation '{op}' exited without running")
+    return op, dict(sub_ctx.params)
+
+
+class _Pipeline:
+    """Shared configuration, repository and installer for a batch run."""
+
+    def __init__(self, config: Config, dry_run: bool = False):
+        self.config = config
+        self.dry_run = dry_run
+        self._repository: Optional[SkillRepository] = None
+        self.installer = Installer(config=config)
+
+    def __enter__(self) -> "_Pipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.installer.close()
+
+    @property
+    def repository(self) -> SkillRepository:
+        """Source repository, opened on first use."""
+        if self._repository is None:
+            try:
+                self._repository = SkillRepository.from_config(self.config)
+            except SkillzError as e:
+                raise ValueError(str(e))
+            self.installer.repository = self._repository
+        return self._repository
+
+    def plan(self, operation: Dict) -> List[Dict]:
+        """Resolve an operation into concrete per-item actions."""
+        params = operation["params"]
+        base = {
+            "line": operation["line"],
+            "op": operation["op"],
+            "target": params["target"],
+            "platform": params["platform"],
+            "force": params["force"],
+            "dry_run": self.dry_run or params["dry_run"],
+        }
+
+        if operation["op"] == "uninstall":
+            names = params["names"]
+            if (
+                len(names) != 1
+                or any(char in names[0] for char in "*?[")
+                or params["uninstall_all"]
+                or params["category"]
+                or "all" in (params["target"], params["platform"])
+            ):
+                raise ValueError(
+                    "Batch uninstall takes exactly one NAME; "
+                    "use one line per item instead of patterns or --all"
+                )
+            return [dict(base, name=names[0], type=params["item_type"])]
+
+        name = params["name"]
+        if params["install_all"] and name:
+            raise ValueError("Cannot specify both NAME and --all")
+        if not params["install_all"] and not name:
+            raise ValueError("Must specify either NAME or --all")
+
+        catalog = self.repository.catalog
+        if params["install_all"]:
+            items = [("skill", n) for n in catalog.skills]
+            items += [("command", n) for n in catalog.commands]
+        else:
+            item_type = params["item_type"] or catalog.detect_type(name)
+            if not item_type:
+                raise ValueError(f"Could not find skill or command '{name}'")
+            items = [(item_type, name)]
+
+        return [dict(base, name=item_name, type=item_type) for item_type, item_name in items]
+
+    def snapshot(self, actions: List[Dict]) -> None:
+        """Snapshot the install roots that actions change, unless they are dry runs."""
+        roots = {
+            root: None
+            for action in actions
+            if not action["dry_run"]
+            for root in self.installer.roots(action["target"], action["platform"])
+        }
+        if roots:
+            self.installer.snapshot(roots, "batch")
+
+    def run_group(self, actions: List[Dict]) -> List[Dict]:
+        """Run the actions for one item sequentially, in file order."""
+        results = []
+        for action in actions:
+            if action["op"] == "install":
+                outcome = self.installer.install(
+                    action["name"],
+                    action["target"],
+                    action["platform"],
+                    item_type=action["type"],
+                    force=action["force"],
+                    dry_run=action["dry_run"],
+                )
+            else:
+                outcome = self.installer.uninstall(
+                    action["name"],
+                    action["target"],
+                    action["platform"],
+                    item_type=action["type"],
+                    dry_run=action["dry_run"],
+                )
+            action["type"] = outcome.type
+            results.append(_result(action, outcome.status, outcome.message))
+        return results
+
+
+def _result(action: Dict, status: str, message: str) -> Dict:
+    """Build a per-operation result record."""
+    params = action.get("params", {})
+    return {
+        "line": action["line"],
+        "op": action["op"],
+        "type": action.get("type", params.get("item_type")),
+        "name": action.get("name", params.get("name") or next(iter(params.get("names", ())), None)),
+        "target": action.get("target", params.get("target")),
+        "platform": action.get("platform", params.get("platform")),
+        "status": status,
+        "message": message,
+    }
+
+
+def _summarize(results: List[Dict]) -> Dict[str, int]:
+    """Count results by status."""
+    summary = {status: 0 for status in STATUS_STYLES}
+    for result in results:
+        summary[result["status"]] += 1
+    summary["total"] = len(results)
+    return summary
+
+
+def _print_report(results: List[Dict]):
+    """Print a table of per-operation results."""
+    if not results:
+        console.print("[yellow]No operations found[/yellow]")
+        return
+
+    table = Table(title="Batch Results")
+    table.add_column("Line", justify="right", style="dim")
+    table.add_column("Operation", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Location", style="yellow")
+    table.add_column("Status")
+    table.add_column("Details", style="white")
+
+    for result in results:
+        style = STATUS_STYLES[result["status"]]
+        location = ""
+        if result["target"]:
+            location = f"{result['target']}/{result['platform']}"
+        table.add_row(
+            str(result["line"]),
+            result["op"] or "",
+            result["name"] or "",
+            location,
+            f"[{style}]{result['status']}[/{style}]",
+            result["message"],
+        )
+
+    console.print(table)
+
+    summary = _summarize(results)
+    console.print(
+        f"\n{summary['ok']} succeeded, {summary['planned']} planned, "
+        f"{summary['skipped']} skipped, {summary['error']} failed"
+    )
@@ -0,0 +1,141 @@
+"""Garbage collection command for skillz."""
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from cli.commands.info import _format_size
+from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.gc import DUPLICATE, RENAMED, find_garbage
+from cli.locations import install_locations
+from cli.utils import confirm_action
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--target",
+    "-t",
+    type=click.Choice(["personal", "project", "all"]),
+    default="all",
+    help="Target location (personal, project or all)",
+)
+@click.option(
+    "--platform",
+    "-p",
+    default="all",
+    help="Target platform (claude, codex, gemini, opencode, copilot, mcp, or all)",
+)
+@click.option("--type", "item_type", type=click.Choice(["skill", "command"]), help="Item type")
+@click.option(
+    "--unmanaged",
+    is_flag=True,
+    help="Also remove items skillz did not install (for example skills written by hand)",
+)
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@click.option("--dry-run", is_flag=True, help="List what would be removed")
+@click.pass_context
+def gc(ctx, target, platform, item_type, unmanaged, force, dry_run):
+    """
+    Remove installed items the repository no longer has.
+
+    Every install location is rescanned and compared with the repository.
+    Items whose name is not in the repository are orphans; if their content
+    matches a repository item under another name they were renamed, and
+    duplicates if that name is installed next to them. All of them are
+    removed in parallel after one confirmation.
+
+    Only items skillz installed are removed. Items it finds on disk but
+    never installed are listed separately and kept unless --unmanaged is
+    given.
+    """
+    verbose = ctx.obj.get("verbose", False)
+    config = Config()
+
+    repo_path = config.get_repository_path()
+    if not repo_path or not repo_path.exists():
+        console.print("[red]Error: Repository path not configured or does not exist.[/red]")
+        console.print("Run: skillz config set repository <path>")
+        raise click.Abort()
+
+    repository = SkillRepository.from_config(config, repo_path)
+    targets = None if target == "all" else [target]
+    platforms = None if platform == "all" else [platform]
+
+    with Installer(repository, config) as installer:
+        catalogs = install_locations(config, targets, platforms)
+        installer.state.reconcile_all(catalogs)
+        installed = installer.state.items(catalogs, item_type or "all")
+        garbage = find_garbage(
+            repository.skills() + repository.commands(),
+            installed,
+            cache=repository.cache,
+            jobs=installer.jobs,
+            is_managed=installer.state.is_managed,
+        )
+
+        kept = [item for item in garbage if not item.managed and not unmanaged]
+        garbage = [item for item in garbage if item.managed or unmanaged]
+        if kept:
+            _print_garbage(kept, title="Not installed by skillz (kept)")
+            console.print(
+                f"[yellow]Kept {len(kept)} item(s) skillz did not install; "
+                "use --unmanaged to remove them too[/yellow]"
+            )
+        if not garbage:
+            count = len(installed)
+            console.print(f"[green]Nothing to collect in {count} installed item(s)[/green]")
+            return
+
+        _print_garbage(garbage)
+        total = _format_size(sum(item.record.stats.bytes for item in garbage))
+        if dry_run:
+            console.print(f"[blue]Would reclaim {total}[/blue]")
+            return
+        if not force and not confirm_action(
+            f"Remove {len(garbage)} items ({total})?", default=False
+        ):
+            console.print("[yellow]Garbage collection cancelled[/yellow]")
+            return
+
+        results = installer.uninstall_records([item.record for item in garbage])
+        snapshot = installer.last_snapshot
+
+    failed = [result for result in results if not result.ok]
+    for result in results:
+        if not result.ok:
+            console.print(f"[red]{result.message}[/red]")
+        elif verbose:
+            console.print(f"[dim]{result.message}[/dim]")
+
+    removed = [result for result in results if result.status == "ok"]
+    reclaimed = _format_size(sum(result.bytes for result in removed))
+    console.print(f"[green]Removed {len(removed)} item(s), reclaimed {reclaimed}[/green]")
+    if snapshot:
+        console.print(f"[dim]Saved snapshot {snapshot.id}; undo with: skillz rollback[/dim]")
+    if failed:
+        console.print(f"[red]Failed to remove {len(failed)} item(s)[/red]")
+        ctx.exit(1)
+
+
+def _print_garbage(garbage, title="Garbage"):
+    """Print garbage items and why they are garbage."""
+    table = Table(title=title)
+    table.add_column("Type", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Location", style="yellow")
+    table.add_column("Reason")
+    table.add_column("Size", justify="right")
+    for item in garbage:
+        reason = item.reason
+        if item.reason == RENAMED:
+            reason = f"renamed to {item.replacement}"
+        elif item.reason == DUPLICATE:
+            reason = f"duplicate of {item.replacement}"
+        record = item.record
+        table.add_row(
+            record.type, record.name, record.location, reason, _format_size(record.stats.bytes)
+        )
+    console.print(table)
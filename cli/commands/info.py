@@ -1,18 +1,24 @@
 """Info command for skillz."""
 
+import os
 from pathlib import Path
+from typing import List, Optional, Set, Tuple
 
 import click
 from rich.console import Console
 from rich.markdown import Markdown
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 
 from cli.config import Config
-from cli.validator import CommandValidator, SkillValidator
+from cli.locations import find_installed, install_locations
+from cli.validator import CommandValidator, SkillValidator, _summarize
 
 console = Console()
 
+PREVIEW_LINES = 30
+
 
 @click.command()
 @click.argument("name")
@@ -24,12 +30,21 @@ console = Console()
     help="Where to look for the item",
 )
 @click.option("--show-content", is_flag=True, help="Display full content")
+@click.option(
+    "--lines",
+    "-n",
+    type=click.IntRange(min=0),
+    help="Print this many lines of content as plain text instead of a rendered preview",
+)
+@click.option("--pager", is_flag=True, help="Page the full content as plain text")
 @click.pass_context
-def info(ctx, name, item_type, source, show_content):
+def info(ctx, name, item_type, source, show_content, lines, pager):
     """
     Display detailed information about a skill or command.
 
-    NAME is the name of the skill or command to inspect.
+    NAME is the name of the skill or command to inspect. By default the
+    first lines of content are rendered as markdown; use --lines or --pager
+    for plain text, which displays instantly however long the item is.
     """
     verbose = ctx.obj.get("verbose", False)
     config = Config()
@@ -47,8 +62,12 @@ def info(ctx, name, item_type, source, show_content):
         item_path, detected_type = _find_in_repository(repo_path, name, item_type)
 
     else:  # installed
-        # Try to find in installed locations
-        item_path, detected_type = _find_installed(config, name, item_type)
+        # Check every target and platform at once
+        found = find_installed(install_locations(config), name, item_type)
+        if found:
+            item_path, detected_type = found[0].path, found[0].type
+            locations = ", ".join(f"{item.location} ({item.type})" for item in found)
+            console.print(f"[bold]Installed in:[/bold] {locations}")
 
     if not item_path:
         console.print(f"[red]Error: '{name}' not found[/red]")
@@ -56,9 +75,9 @@ def info(ctx, name, item_type, source, show_content):
 
     # Display information based on type
     if detected_type == "skill":
-        _display_skill_info(item_path, show_content, verbose)
+        _display_skill_info(item_path, show_content, verbose, lines, pager)
     else:
-        _display_command_info(item_path, show_content, verbose)
+        _display_command_info(item_path, show_content, verbose, lines, pager)
 
 
 def _find_in_repository(repo_path: Path, name: str, item_type: str):
@@ -82,37 +101,24 @@ def _find_in_repository(repo_path: Path, name: str, item_type: str):
     return None, None
 
 
-def _find_installed(config: Config, name: str, item_type: str):
-    """Find item in installed locations."""
-    # Try personal and project locations
-    for target in ["personal", "project"]:
-        # Try skill
-        if not item_type or item_type == "skill":
-            skills_dir = config.get_skills_dir(target, "claude")
-            skill_path = skills_dir / name
-            if skill_path.exists() and (skill_path / "SKILL.md").exists():
-                return skill_path, "skill"
-
-        # Try command
-        if not item_type or item_type == "command":
-            commands_dir = config.get_commands_dir(target, "claude")
-            cmd_path = commands_dir / f"{name}.md"
-            if cmd_path.exists():
-                return cmd_path, "command"
-
-    return None, None
-
-
-def _display_skill_info(skill_path: Path, show_content: bool, verbose: bool):
+def _display_skill_info(
+    skill_path: Path,
+    show_content: bool,
+    verbose: bool,
+    lines: Optional[int] = None,
+    pager: bool = False,
+):
     """Display information about a skill."""
     skill_file = skill_path / "SKILL.md"
 
-    # Validate skill
-    valid, errors = SkillValidator.validate_skill_directory(skill_path)
+    # One read of SKILL.md and one scan of the directory serve both the
+    # display and validation
+    content = skill_file.read_text()
+    tree, index = _scan_tree(skill_path)
+    valid, errors = _summarize(SkillValidator.check_skill_file(skill_file, content, index))
 
     # Parse metadata
-    content = skill_file.read_text()
-    metadata = SkillValidator._parse_frontmatter(content)
+    metadata = SkillValidator._parse_frontmatter(content) or {}
 
     # Display metadata panel
     metadata_text = f"[bold cyan]Name:[/bold cyan] {metadata.get('name', 'N/A')}\n"
@@ -137,57 +143,36 @@ def _display_skill_info(skill_path: Path, show_content: bool, verbose: bool):
 
     console.print(Panel(metadata_text, title="Skill Information", border_style="cyan"))
 
-    # List files in skill directory
+    # List every file in the skill directory, nested under its subdirectory
     console.print("\n[bold]Files:[/bold]")
     files_table = Table(show_header=True, header_style="bold")
     files_table.add_column("File", style="cyan")
     files_table.add_column("Size", justify="right")
     files_table.add_column("Type")
 
-    for file_path in sorted(skill_path.iterdir()):
-        if file_path.is_file():
-            size = file_path.stat().st_size
-            size_str = _format_size(size)
-            file_type = _get_file_type(file_path)
-            files_table.add_row(file_path.name, size_str, file_type)
+    for depth, name, size, is_dir in tree:
+        label = "  " * depth + (f"{name}/" if is_dir else name)
+        file_type = "Directory" if is_dir else _get_file_type(name)
+        files_table.add_row(escape(label), _format_size(size), file_type)
 
     console.print(files_table)
 
-    # Show content preview or full content
-    if show_content:
-        console.print("\n[bold]Full Content:[/bold]")
-        console.print(Markdown(content))
-    else:
-        console.print("\n[bold]Content Preview:[/bold]")
-        lines = content.split("\n")
-
-        # Skip frontmatter
-        start_idx = 0
-        if content.startswith("---"):
-            end_marker = content.find("---", 3)
-            if end_marker != -1:
-                start_idx = content[: end_marker + 3].count("\n")
-
-        # Show first 30 lines
-        preview_lines = lines[start_idx : start_idx + 30]
-        preview = "\n".join(preview_lines)
-
-        console.print(Markdown(preview))
+    _display_content(content, show_content, lines, pager)
 
-        if len(lines) > start_idx + 30:
-            console.print(
-                f"\n[dim]... ({len(lines) - start_idx - 30} more lines) "
-                f"Use --show-content to see full content[/dim]"
-            )
 
-
-def _display_command_info(cmd_path: Path, show_content: bool, verbose: bool):
+def _display_command_info(
+    cmd_path: Path,
+    show_content: bool,
+    verbose: bool,
+    lines: Optional[int] = None,
+    pager: bool = False,
+):
     """Display information about a command."""
     # Validate command
-    valid, errors = CommandValidator.validate_command_file(cmd_path)
+    content = cmd_path.read_text()
+    valid, errors = _summarize(CommandValidator.check_command_file(cmd_path, content))
 
     # Parse metadata
-    content = cmd_path.read_text()
     metadata = CommandValidator._parse_frontmatter(content) or {}
 
     # Display metadata panel
@@ -219,32 +204,95 @@ def _display_command_info(cmd_path: Path, show_content: bool, verbose: bool):
 
     console.print(Panel(metadata_text, title="Command Information", border_style="cyan"))
 
-    # Show content
-    if show_content:
-        console.print("\n[bold]Full Content:[/bold]")
-        console.print(Markdown(content))
-    else:
-        console.print("\n[bold]Content Preview:[/bold]")
-        lines = content.split("\n")
+    _display_content(content, show_content, lines, pager)
 
-        # Skip frontmatter if present
-        start_idx = 0
-        if content.startswith("---"):
-            end_marker = content.find("---", 3)
-            if end_marker != -1:
-                start_idx = content[: end_marker + 3].count("\n")
 
-        # Show first 30 lines
-        preview_lines = lines[start_idx : start_idx + 30]
-        preview = "\n".join(preview_lines)
+def _display_content(content: str, show_content: bool, lines: Optional[int], pager: bool):
+    """
+    Show the content of an item.
 
-        console.print(Markdown(preview))
+    --pager streams the whole file to the pager and --lines prints the first
+    lines of the body as plain text; neither renders markdown, so both are
+    instant however long the file is. Otherwise the full content or a
+    preview is rendered as markdown.
+    """
+    if pager:
+        click.echo_via_pager(content.splitlines(keepends=True))
+        return
 
-        if len(lines) > start_idx + 30:
-            console.print(
-                f"\n[dim]... ({len(lines) - start_idx - 30} more lines) "
-                f"Use --show-content to see full content[/dim]"
-            )
+    if show_content:
+        console.print("\n[bold]Full Content:[/bold]")
+        console.print(Markdown(content))
+        return
+
+    console.print("\n[bold]Content Preview:[/bold]")
+    body = content[_body_start(content) :]
+    count = PREVIEW_LINES if lines is None else lines
+    preview = body.split("\n", count)
+    remaining = 0
+    if len(preview) > count:
+        remaining = preview.pop().count("\n") + 1
+
+    if lines is None:
+        console.print(Markdown("\n".join(preview)))
+    elif preview:
+        click.echo("\n".join(preview))
+
+    if remaining:
+        console.print(
+            f"\n[dim]... ({remaining} more lines) "
+            f"Use --show-content, --lines or --pager to see more[/dim]"
+        )
+
+
+def _body_start(content: str) -> int:
+    """Return the offset of the first line after the frontmatter (0 if there is none)."""
+    if content.startswith("---"):
+        end_marker = content.find("---", 3)
+        if end_marker != -1:
+            newline = content.find("\n", end_marker)
+            return len(content) if newline == -1 else newline + 1
+    return 0
+
+
+def _scan_tree(root: Path) -> Tuple[List[Tuple[int, str, int, bool]], Set[str]]:
+    """
+    List everything below root in a single recursive os.scandir pass.
+
+    Returns:
+        Tuple of (rows, index). Rows are (depth, name, size, is_dir) in
+        display order, each directory followed by its contents and sized by
+        their total. Index holds the root-relative POSIX path of every entry,
+        in the form SkillValidator.check_links expects.
+    """
+    rows = []
+    index = set()
+
+    def walk(path: str, prefix: str, depth: int) -> int:
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return 0
+
+        total = 0
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+                size = 0 if is_dir else entry.stat().st_size
+            except OSError:
+                continue
+            index.add(prefix + entry.name)
+            row = len(rows)
+            rows.append((depth, entry.name, size, is_dir))
+            if is_dir and not entry.is_symlink():
+                size = walk(entry.path, f"{prefix}{entry.name}/", depth + 1)
+                rows[row] = (depth, entry.name, size, is_dir)
+            total += size
+        return total
+
+    walk(str(root), "", 0)
+    return rows, index
 
 
 def _format_size(size_bytes: int) -> str:
@@ -256,9 +304,9 @@ def _format_size(size_bytes: int) -> str:
     return f"{size_bytes:.1f} TB"
 
 
-def _get_file_type(file_path: Path) -> str:
-    """Get file type description."""
-    suffix = file_path.suffix.lower()
+def _get_file_type(name: str) -> str:
+    """Get file type description from a file name."""
+    suffix = os.path.splitext(name)[1].lower()
     types = {
         ".md": "Markdown",
         ".py": "Python",
@@ -6,14 +6,9 @@ import click
 from rich.console import Console
 
 from cli.config import Config
-from cli.utils import (
-    confirm_action,
-    copy_directory,
-    copy_file,
-    find_command_files,
-    find_skill_directories,
-)
-from cli.validator import CommandValidator, SkillValidator
+from cli.core import Installer, SkillRepository
+from cli.roots import resolver
+from cli.utils import confirm_action
 
 console = Console()
 
@@ -64,136 +59,91 @@ def install(ctx, name, target, platform, item_type, force, dry_run, install_all)
             console.print("Run: skillz config set repository <path>")
             raise click.Abort()
 
-    # Handle --all flag
-    if install_all:
-        _install_all_items(repo_path, config, target, platform, force, dry_run, verbose)
-        return
+    # The installer saves the catalog cache when it is closed
+    repository = SkillRepository.from_config(config, repo_path)
+    with Installer(repository, config) as installer:
+        # Handle --all flag
+        if install_all:
+            failed = _install_all_items(installer, target, platform, force, dry_run, verbose)
+            if failed:
+                ctx.exit(1)
+            return
 
-    # Determine item type if not specified
-    if not item_type:
-        item_type = _detect_item_type(repo_path, name)
+        # Determine item type if not specified
         if not item_type:
-            console.print(f"[red]Error: Could not find skill or command '{name}'[/red]")
-            raise click.Abort()
-
-    # Find source
-    if item_type == "skill":
-        source_path = _find_skill(repo_path, name)
-        if not source_path:
-            console.print(f"[red]Error: Skill '{name}' not found in repository[/red]")
+            item_type = repository.catalog.detect_type(name)
+            if not item_type:
+                console.print(f"[red]Error: Could not find skill or command '{name}'[/red]")
+                raise click.Abort()
+
+        # Find source
+        record = repository.get(name, item_type)
+        if not record:
+            console.print(
+                f"[red]Error: {item_type.capitalize()} '{name}' not found in repository[/red]"
+            )
             raise click.Abort()
 
-        # Validate skill
-        valid, errors = SkillValidator.validate_skill_directory(source_path)
-        if not valid:
-            console.print("[red]Error: Invalid skill:[/red]")
-            for error in errors:
-                console.print(f"  - {error}")
+        # Validate
+        issues = repository.check(record)
+        if any(issue.is_error for issue in issues):
+            console.print(f"[red]Error: Invalid {item_type}:[/red]")
+            for issue in issues:
+                console.print(f"  - {issue.message}")
             raise click.Abort()
+        for issue in issues:
+            console.print(f"[yellow]Warning: {issue.message}[/yellow]")
 
         # Get destination
-        dest_dir = config.get_skills_dir(target, platform)
-        dest_path = dest_dir / name
-
-    else:  # command
-        source_path = _find_command(repo_path, name)
-        if not source_path:
-            console.print(f"[red]Error: Command '{name}' not found in repository[/red]")
-            raise click.Abort()
+        dest_path = installer.destination(record, target, platform)
 
-        # Validate command
-        valid, errors = CommandValidator.validate_command_file(source_path)
-        if not valid:
-            console.print("[red]Error: Invalid command:[/red]")
-            for error in errors:
-                console.print(f"  - {error}")
-            raise click.Abort()
+        if verbose:
+            console.print(f"Source: {record.path}")
+            console.print(f"Destination: {dest_path}")
 
-        # Get destination
-        dest_dir = config.get_commands_dir(target, platform)
-        dest_path = dest_dir / source_path.name
-
-    if verbose:
-        console.print(f"Source: {source_path}")
-        console.print(f"Destination: {dest_path}")
-
-    # Check if already exists
-    if dest_path.exists() and not force:
-        if not confirm_action(
-            f"{item_type.capitalize()} '{name}' already exists. Overwrite?", default=False
-        ):
-            console.print("[yellow]Installation cancelled[/yellow]")
+        # Check if already exists
+        if dest_path.exists() and not force:
+            if not confirm_action(
+                f"{item_type.capitalize()} '{name}' already exists. Overwrite?", default=False
+            ):
+                console.print("[yellow]Installation cancelled[/yellow]")
+                return
+
+        # Dry run
+        if dry_run:
+            console.print(f"[blue]Would install {item_type} '{name}' to {dest_path}[/blue]")
             return
 
-    # Dry run
-    if dry_run:
-        console.print(f"[blue]Would install {item_type} '{name}' to {dest_path}[/blue]")
-        return
-
-    # Install
-    dest_dir.mkdir(parents=True, exist_ok=True)
-
-    if item_type == "skill":
-        success = copy_directory(source_path, dest_path, force=True)
-    else:
-        success = copy_file(source_path, dest_path, force=True)
-
-    if success:
-        console.print(f"[green]Successfully installed {item_type} '{name}'[/green]")
-    else:
-        console.print(f"[red]Failed to install {item_type} '{name}'[/red]")
-
-
-def _detect_item_type(repo_path: Path, name: str) -> str:
-    """Detect whether name is a skill or command."""
-    if _find_skill(repo_path, name):
-        return "skill"
-    if _find_command(repo_path, name):
-        return "command"
-    return None
-
-
-def _find_skill(repo_path: Path, name: str) -> Path:
-    """Find a skill by name in repository."""
-    skills_dir = repo_path / "skills"
-    if not skills_dir.exists():
-        return None
-
-    # Search for skill directory
-    for skill_path in skills_dir.rglob("SKILL.md"):
-        if skill_path.parent.name == name:
-            return skill_path.parent
-
-    return None
-
-
-def _find_command(repo_path: Path, name: str) -> Path:
-    """Find a command by name in repository."""
-    commands_dir = repo_path / "commands"
-    if not commands_dir.exists():
-        return None
-
-    # Search for command file
-    for cmd_path in commands_dir.rglob("*.md"):
-        if cmd_path.stem == name:
-            return cmd_path
-
-    return None
+        # Install
+        result = installer.install(name, target, platform, item_type=item_type, force=True)
+        if result.ok:
+            console.print(f"[green]Successfully installed {item_type} '{name}'[/green]")
+        else:
+            console.print(f"[red]{result.message}[/red]")
+            console.print(f"[red]Failed to install {item_type} '{name}'[/red]")
 
 
 def _install_all_items(
-    repo_path: Path,
-    config: Config,
+    installer: Installer,
     target: str,
     platform: str,
     force: bool,
     dry_run: bool,
     verbose: bool,
-):
-    """Install all skills and commands from repository."""
-    # Discovery phase
-    skills = _discover_all_skills(repo_path)
-    commands = _discover_all_commands(repo_path)
+) -> int:
+    """
+    Install all skills and commands from repository.
+
+    Invalid items and copy failures are reported and skipped so that one bad
+    item does not stop the rest.
+
+    Returns:
+        Number of items that failed to install
+    """
+    # Discovery phase; one walk of the catalog lists every skill for validation
+    skills = installer.repository.skills()
+    commands = installer.repository.commands()
+    installer.repository.catalog.scan_stats(largest=0)
 
     console.print(f"Found {len(skills)} skills and {len(commands)} commands")
 
@@ -202,133 +152,100 @@ def _install_all_items(
         console.print("[blue]Would install the following items:[/blue]")
 
         console.print(f"\nSkills ({len(skills)}):")
-        for skill_path in skills:
-            dest = config.get_skills_dir(target, platform) / skill_path.name
-            status = "exists" if dest.exists() else "new"
-            if dest.exists() and force:
-                status += " (overwrite)"
-            console.print(f"  - {skill_path.name} [{status}]")
+        for record in skills:
+            status = _preview_status(installer, record, target, platform, force)
+            console.print(f"  - {record.name} \\[{status}]")
 
         console.print(f"\nCommands ({len(commands)}):")
-        for cmd_path in commands:
-            dest = config.get_commands_dir(target, platform) / cmd_path.name
-            status = "exists" if dest.exists() else "new"
-            if dest.exists() and force:
-                status += " (overwrite)"
-            console.print(f"  - {cmd_path.stem} [{status}]")
-
-        return
-
-    # Installation phase - skills first
-    for skill_path in skills:
-        name = skill_path.name
-        dest_dir = config.get_skills_dir(target, platform)
-        dest_path = dest_dir / name
-
-        # Skip if already exists and not forced
-        if dest_path.exists() and not force:
-            console.print(f"[yellow]Skipping skill '{name}' (already installed)[/yellow]")
-            continue
+        for record in commands:
+            status = _preview_status(installer, record, target, platform, force)
+            console.print(f"  - {record.name} \\[{status}]")
+
+        return 0
+
+    # Installation phase - skills first, then commands
+    snapshot = installer.snapshot(
+        installer.roots(target, platform), f"install --all {target}/{platform}"
+    )
+    failed = warned = warnings = 0
+    for item_type, records in (("skill", skills), ("command", commands)):
+        for record in records:
+            name = record.name
+            dest_path = installer.destination(record, target, platform)
+
+            # Skip if already exists and not forced
+            if dest_path.exists() and not force:
+                console.print(f"[yellow]Skipping {item_type} '{name}' (already installed)[/yellow]")
+                continue
+
+            is_reinstall = dest_path.exists()
+            result = installer.install(name, target, platform, item_type=item_type, force=True)
+            if result.errors:
+                console.print(f"[red]Error: Invalid {item_type} '{name}'[/red]")
+                for error in result.errors:
+                    console.print(f"  - {error}")
+                failed += 1
+                continue
+            if not result.ok:
+                console.print(f"[red]{result.message}[/red]")
+                console.print(f"[red]Failed to install {item_type} '{name}'[/red]")
+                failed += 1
+                continue
 
-        # Validate
-        valid, errors = SkillValidator.validate_skill_directory(skill_path)
-        if not valid:
-            console.print(f"[red]Error: Invalid skill '{name}'[/red]")
-            for error in errors:
-                console.print(f"  - {error}")
-            raise click.Abort()
-
-        # Install
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        is_reinstall = dest_path.exists() and force
-        success = copy_directory(skill_path, dest_path, force=True)
-        if success:
             if is_reinstall:
-                console.print(f"[green]Reinstalled skill '{name}'[/green]")
+                console.print(f"[green]Reinstalled {item_type} '{name}'[/green]")
             else:
-                console.print(f"[green]Installed skill '{name}'[/green]")
-        else:
-            console.print(f"[red]Failed to install skill '{name}'[/red]")
-            raise click.Abort()
-
-    # Installation phase - commands
-    for cmd_path in commands:
-        name = cmd_path.stem
-        dest_dir = config.get_commands_dir(target, platform)
-        dest_path = dest_dir / cmd_path.name
-
-        # Skip if already exists and not forced
-        if dest_path.exists() and not force:
-            console.print(f"[yellow]Skipping command '{name}' (already installed)[/yellow]")
-            continue
-
-        # Validate
-        valid, errors = CommandValidator.validate_command_file(cmd_path)
-        if not valid:
-            console.print(f"[red]Error: Invalid command '{name}'[/red]")
-            for error in errors:
-                console.print(f"  - {error}")
-            raise click.Abort()
-
-        # Install
-        dest_dir.mkdir(parents=True, exist_ok=True)
-        is_reinstall = dest_path.exists() and force
-        success = copy_file(cmd_path, dest_path, force=True)
-        if success:
-            if is_reinstall:
-                console.print(f"[green]Reinstalled command '{name}'[/green]")
-            else:
-                console.print(f"[green]Installed command '{name}'[/green]")
-        else:
-            console.print(f"[red]Failed to install command '{name}'[/red]")
-            raise click.Abort()
-
-
-def _discover_all_skills(repo_path: Path) -> list:
-    """Discover all skills in repository."""
-    skills_dir = repo_path / "skills"
-    if not skills_dir.exists():
-        return []
-
-    return list(find_skill_directories(skills_dir))
-
-
-def _discover_all_commands(repo_path: Path) -> list:
-    """Discover all commands in repository."""
-    commands_dir = repo_path / "commands"
-    if not commands_dir.exists():
-        return []
-
-    return list(find_command_files(commands_dir))
+                console.print(f"[green]Installed {item_type} '{name}'[/green]")
+            if result.warnings:
+                warned += 1
+                warnings += len(result.warnings)
+                if verbose:
+                    for warning in result.warnings:
+                        console.print(f"  [yellow]Warning: {warning}[/yellow]")
+
+    if warned:
+        console.print(
+            f"[yellow]{warnings} warning(s) in {warned} installed item(s); "
+            "run 'skillz validate' for details[/yellow]"
+        )
+    if failed:
+        console.print(
+            f"[red]Failed to install {failed} item(s); run 'skillz validate' for details[/red]"
+        )
+    if snapshot:
+        console.print(f"[dim]Saved snapshot {snapshot.id}; undo with: skillz rollback[/dim]")
+    return failed
+
+
+def _preview_status(installer: Installer, record, target: str, platform: str, force: bool) -> str:
+    """Describe what installing a record would do, for dry-run previews."""
+    dest = installer.destination(record, target, platform)
+    status = "exists" if dest.exists() else "new"
+    if dest.exists() and force:
+        status += " (overwrite)"
+    return status
 
 
 def _setup_default_config(config: Config) -> Path:
     """Detect and setup default config if in a valid repository.
 
-    Walks up from the current working directory to find a directory
-    that looks like a skillz repository (contains both ``skills`` and
-    ``commands`` subdirectories).
+    Looks for the nearest directory above the working directory that looks
+    like a skillz repository (contains both ``skills`` and ``commands``
+    subdirectories), without leaving the current checkout or filesystem.
 
     Returns the repository path if setup was successful, None otherwise.
     """
-    cwd = Path.cwd()
+    candidate = resolver.repository_root()
+    if candidate is None:
+        return None
 
-    # Walk up the directory tree: cwd, parents[0], parents[1], ...
-    candidates = [cwd] + list(cwd.parents)
-    for candidate in candidates:
-        if _is_valid_repo(candidate):
-            console.print("[yellow]Repository path not configured.[/yellow]")
-            console.print(f"Detected repository: {candidate}")
+    console.print("[yellow]Repository path not configured.[/yellow]")
+    console.print(f"Detected repository: {candidate}")
 
-            # Prompt user for confirmation
-            if confirm_action("Use this directory as the repository?", default=True):
-                config.set_repository_path(candidate)
-                console.print(f"[green]Repository path set to: {candidate}[/green]")
-                return candidate
+    # Prompt user for confirmation
+    if confirm_action("Use this directory as the repository?", default=True):
+        config.set_repository_path(candidate)
+        console.print(f"[green]Repository path set to: {candidate}[/green]")
+        return candidate
 
     return None
-
-
-def _is_valid_repo(path: Path) -> bool:
-    """Check if a directory is a valid skillz repository."""
-    return (path / "skills").exists() and (path / "commands").exists()
@@ -1,14 +1,13 @@
 """List command for skillz."""
 
-from pathlib import Path
-
 import click
 from rich.console import Console
 from rich.table import Table
 
 from cli.config import Config
-from cli.utils import find_command_files, find_skill_directories
-from cli.validator import CommandValidator, SkillValidator
+from cli.core import SkillRepository
+from cli.locations import install_locations
+from cli.state import InstallState
 
 console = Console()
 
@@ -26,15 +25,22 @@ console = Console()
     "--platform",
     "-p",
     default="claude",
-    help="Filter by platform (claude, codex, gemini, opencode, copilot, mcp)",
+    help="Filter by platform (claude, codex, gemini, opencode, copilot, mcp, or all)",
 )
 @click.option("--category", "-c", help="Filter by category")
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Rescan install locations and fix the installed-items database",
+)
 @click.pass_context
-def list_skills(ctx, item_type, source, target, platform, category):
+def list_skills(ctx, item_type, source, target, platform, category, verify):
     """
     List available skills and commands.
 
     By default, lists all items from both repository and installed locations.
+    Installed items come from the database that install and uninstall keep
+    up to date; use --verify after changing install directories by hand.
     """
     verbose = ctx.obj.get("verbose", False)
     config = Config()
@@ -46,19 +52,33 @@ def list_skills(ctx, item_type, source, target, platform, category):
     if source in ["repository", "all"]:
         repo_path = config.get_repository_path()
         if repo_path and repo_path.exists():
+            repository = SkillRepository.from_config(config, repo_path)
             if item_type in ["skill", "all"]:
-                items.extend(_list_repository_skills(repo_path, category, verbose))
+                items.extend(repository.skills(category))
             if item_type in ["command", "all"]:
-                items.extend(_list_repository_commands(repo_path, category, verbose))
+                items.extend(repository.commands(category))
+            repository.save_cache()
 
     # From installed
     if source in ["installed", "all"]:
-        targets = [target] if target else ["personal", "project"]
-        for tgt in targets:
-            if item_type in ["skill", "all"]:
-                items.extend(_list_installed_skills(config, tgt, platform, verbose))
-            if item_type in ["command", "all"]:
-                items.extend(_list_installed_commands(config, tgt, platform, verbose))
+        catalogs = install_locations(
+            config,
+            targets=[target] if target else None,
+            platforms=None if platform == "all" else [platform],
+        )
+        state = InstallState(config.get_state_path())
+        if verify:
+            for result in state.reconcile_all(catalogs):
+                if result.changed:
+                    console.print(
+                        f"[yellow]Reconciled {result.location}: {len(result.added)} added, "
+                        f"{len(result.removed)} removed, {len(result.updated)} updated[/yellow]"
+                    )
+                    if verbose:
+                        for label in result.added + result.removed + result.updated:
+                            console.print(f"  - {label}")
+        items.extend(state.items(catalogs, item_type))
+        state.close()
 
     # Display results
     if not items:
@@ -73,139 +93,6 @@ def list_skills(ctx, item_type, source, target, platform, category):
     table.add_column("Description", style="white")
 
     for item in items:
-        table.add_row(
-            item["type"],
-            item["name"],
-            item["location"],
-            item.get("description", "")[:80],
-        )
+        table.add_row(item.type, item.name, item.location, item.description[:80])
 
     console.print(table)
-
-
-def _list_repository_skills(repo_path: Path, category: str, verbose: bool):
-    """List skills from repository."""
-    items = []
-    skills_dir = repo_path / "skills"
-    if not skills_dir.exists():
-        return items
-
-    for skill_path in find_skill_directories(skills_dir):
-        # Filter by category
-        if category:
-            rel_path = skill_path.relative_to(skills_dir)
-            if not str(rel_path).startswith(category):
-                continue
-
-        # Parse skill
-        skill_file = skill_path / "SKILL.md"
-        metadata = _parse_skill_metadata(skill_file)
-
-        items.append(
-            {
-                "type": "skill",
-                "name": skill_path.name,
-                "location": "repository",
-                "description": metadata.get("description", ""),
-                "path": str(skill_path),
-            }
-        )
-
-    return items
-
-
-def _list_repository_commands(repo_path: Path, category: str, verbose: bool):
-    """List commands from repository."""
-    items = []
-    commands_dir = repo_path / "commands"
-    if not commands_dir.exists():
-        return items
-
-    for cmd_path in find_command_files(commands_dir):
-        # Filter by category
-        if category:
-            rel_path = cmd_path.relative_to(commands_dir)
-            if not str(rel_path.parent).startswith(category):
-                continue
-
-        # Parse command
-        metadata = _parse_command_metadata(cmd_path)
-
-        items.append(
-            {
-                "type": "command",
-                "name": cmd_path.stem,
-                "location": "repository",
-                "description": metadata.get("description", ""),
-                "path": str(cmd_path),
-            }
-        )
-
-    return items
-
-
-def _list_installed_skills(config: Config, target: str, platform: str, verbose: bool):
-    """List installed skills."""
-    items = []
-    skills_dir = config.get_skills_dir(target, platform)
-
-    if not skills_dir.exists():
-        return items
-
-    for skill_path in find_skill_directories(skills_dir):
-        skill_file = skill_path / "SKILL.md"
-        metadata = _parse_skill_metadata(skill_file)
-
-        items.append(
-            {
-                "type": "skill",
-                "name": skill_path.name,
-                "location": f"{target}/{platform}",
-                "description": metadata.get("description", ""),
-                "path": str(skill_path),
-            }
-        )
-
-    return items
-
-
-def _list_installed_commands(config: Config, target: str, platform: str, verbose: bool):
-    """List installed commands."""
-    items = []
-    commands_dir = config.get_commands_dir(target, platform)
-
-    if not commands_dir.exists():
-        return items
-
-    for cmd_path in find_command_files(commands_dir):
-        metadata = _parse_command_metadata(cmd_path)
-
-        items.append(
-            {
-                "type": "command",
-                "name": cmd_path.stem,
-                "location": f"{target}/{platform}",
-                "description": metadata.get("description", ""),
-                "path": str(cmd_path),
-            }
-        )
-
-    return items
-
-
-def _parse_skill_metadata(skill_file: Path):
-    """Parse metadata from SKILL.md."""
-    try:
-        frontmatter = SkillValidator._parse_frontmatter(skill_file.read_text())
-        return frontmatter or {}
-    except Exception:
-        return {}
-
-
-def _parse_command_metadata(cmd_file: Path):
-    """Parse metadata from command file."""
-    try:
-        frontmatter = CommandValidator._parse_frontmatter(cmd_file.read_text())
-        return frontmatter or {}
-    except Exception:
-        return {}
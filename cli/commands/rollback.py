@@ -0,0 +1,121 @@
+"""Rollback command for skillz."""
+
+import time
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from cli.config import Config
+from cli.core import Installer
+from cli.locations import install_locations
+from cli.snapshots import list_snapshots
+from cli.utils import confirm_action
+
+console = Console()
+
+
+@click.command()
+@click.argument("snapshot_id", metavar="[SNAPSHOT]", required=False)
+@click.option(
+    "--target",
+    "-t",
+    type=click.Choice(["personal", "project", "all"]),
+    default="all",
+    help="Target location (personal, project or all)",
+)
+@click.option(
+    "--platform",
+    "-p",
+    default="all",
+    help="Target platform (claude, codex, gemini, opencode, copilot, mcp, or all)",
+)
+@click.option("--list", "list_only", is_flag=True, help="List snapshots instead of rolling back")
+@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@click.option("--dry-run", is_flag=True, help="Preview without making changes")
+@click.pass_context
+def rollback(ctx, snapshot_id, target, platform, list_only, force, dry_run):
+    """
+    Restore install directories from a snapshot.
+
+    Snapshots are taken automatically before install --all, batch runs,
+    multi-item uninstalls and gc. SNAPSHOT is a snapshot id or a unique
+    prefix of one (default: the newest snapshot). The state being replaced
+    is saved as a new snapshot, so a rollback can be rolled back too.
+    """
+    _ = ctx.obj.get("verbose", False)  # Reserved for future use
+    config = Config()
+
+    targets = None if target == "all" else [target]
+    platforms = None if platform == "all" else [platform]
+    roots = [
+        root
+        for catalog in install_locations(config, targets, platforms)
+        for root in (catalog.skills_dir, catalog.commands_dir)
+    ]
+    found = list_snapshots(roots, config.get_snapshot_dir())
+
+    if list_only:
+        _print_snapshots(found)
+        return
+    if not found:
+        console.print("[red]Error: No snapshots found[/red]")
+        raise click.Abort()
+
+    if snapshot_id:
+        matches = [snapshot for snapshot in found if snapshot.id.startswith(snapshot_id)]
+        if len(matches) != 1:
+            problem = "not found" if not matches else "is ambiguous"
+            console.print(f"[red]Error: Snapshot '{snapshot_id}' {problem}[/red]")
+            raise click.Abort()
+        snapshot = matches[0]
+    else:
+        snapshot = found[0]
+
+    console.print(f"Snapshot {snapshot.id} ({snapshot.operation}, {_format_time(snapshot)}):")
+    for root in snapshot.roots:
+        console.print(f"  - {root}")
+    if dry_run:
+        console.print(f"[blue]Would restore {len(snapshot.roots)} install root(s)[/blue]")
+        return
+    if not force and not confirm_action(
+        f"Restore {len(snapshot.roots)} install root(s) from snapshot {snapshot.id}?",
+        default=False,
+    ):
+        console.print("[yellow]Rollback cancelled[/yellow]")
+        return
+
+    with Installer(config=config) as installer:
+        try:
+            undo = installer.rollback(snapshot)
+        except OSError as e:
+            console.print(f"[red]Error rolling back: {e}[/red]")
+            ctx.exit(1)
+
+    console.print(f"[green]Rolled back to snapshot {snapshot.id}[/green]")
+    console.print(f"[dim]Saved the replaced state as snapshot {undo.id}[/dim]")
+
+
+def _format_time(snapshot) -> str:
+    """Local creation time of a snapshot."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(snapshot.created_at))
+
+
+def _print_snapshots(found):
+    """Print snapshots, newest first."""
+    if not found:
+        console.print("[yellow]No snapshots found[/yellow]")
+        return
+    table = Table(title="Snapshots")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Created")
+    table.add_column("Operation", style="green")
+    table.add_column("Roots", overflow="fold")
+    for snapshot in found:
+        table.add_row(
+            snapshot.id,
+            _format_time(snapshot),
+            snapshot.operation,
+            "\n".join(str(root) for root in snapshot.roots),
+        )
+    console.print(table)
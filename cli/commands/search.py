@@ -1,14 +1,11 @@
 """Search command for skillz."""
 
-from pathlib import Path
-
 import click
 from rich.console import Console
 from rich.table import Table
 
 from cli.config import Config
-from cli.utils import find_command_files, find_skill_directories
-from cli.validator import CommandValidator, SkillValidator
+from cli.core import SkillRepository
 
 console = Console()
 
@@ -32,45 +29,9 @@ def search(ctx, query, item_type):
         console.print("[yellow]Warning: Repository path not configured[/yellow]")
         return
 
-    # Collect matches
-    matches = []
-
-    # Search skills
-    if item_type in ["skill", "all"]:
-        skills_dir = repo_path / "skills"
-        if skills_dir.exists():
-            for skill_path in find_skill_directories(skills_dir):
-                skill_file = skill_path / "SKILL.md"
-                metadata = _parse_skill_metadata(skill_file)
-
-                # Check if query matches name or description
-                if _matches_query(query, skill_path.name, metadata.get("description", "")):
-                    matches.append(
-                        {
-                            "type": "skill",
-                            "name": skill_path.name,
-                            "description": metadata.get("description", ""),
-                            "path": str(skill_path.relative_to(repo_path)),
-                        }
-                    )
-
-    # Search commands
-    if item_type in ["command", "all"]:
-        commands_dir = repo_path / "commands"
-        if commands_dir.exists():
-            for cmd_path in find_command_files(commands_dir):
-                metadata = _parse_command_metadata(cmd_path)
-
-                # Check if query matches name or description
-                if _matches_query(query, cmd_path.stem, metadata.get("description", "")):
-                    matches.append(
-                        {
-                            "type": "command",
-                            "name": cmd_path.stem,
-                            "description": metadata.get("description", ""),
-                            "path": str(cmd_path.relative_to(repo_path)),
-                        }
-                    )
+    repository = SkillRepository.from_config(config, repo_path)
+    matches = repository.search(query, item_type)
+    repository.save_cache()
 
     # Display results
     if not matches:
@@ -84,36 +45,7 @@ def search(ctx, query, item_type):
     table.add_column("Path", style="dim")
 
     for match in matches:
-        table.add_row(
-            match["type"],
-            match["name"],
-            match["description"][:80],
-            match["path"],
-        )
+        table.add_row(match.type, match.name, match.description[:80], match.relpath)
 
     console.print(table)
     console.print(f"\n[green]Found {len(matches)} result(s)[/green]")
-
-
-def _matches_query(query: str, name: str, description: str) -> bool:
-    """Check if query matches name or description."""
-    query_lower = query.lower()
-    return query_lower in name.lower() or query_lower in description.lower()
-
-
-def _parse_skill_metadata(skill_file: Path):
-    """Parse metadata from SKILL.md."""
-    try:
-        frontmatter = SkillValidator._parse_frontmatter(skill_file.read_text())
-        return frontmatter or {}
-    except Exception:
-        return {}
-
-
-def _parse_command_metadata(cmd_file: Path):
-    """Parse metadata from command file."""
-    try:
-        frontmatter = CommandValidator._parse_frontmatter(cmd_file.read_text())
-        return frontmatter or {}
-    except Exception:
-        return {}
@@ -0,0 +1,75 @@
+"""Show command for skillz."""
+
+import click
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from cli.commands.info import _format_size
+from cli.config import Config
+from cli.core import SkillRepository, SkillzError
+
+console = Console()
+
+
+@click.command()
+@click.argument("target")
+@click.pass_context
+def show(ctx, target):
+    """
+    Print one section of a skill or command.
+
+    TARGET is NAME[/FILE][#HEADING]. HEADING is a heading's text or anchor,
+    looked up in SKILL.md and then in the skill's other markdown files, or
+    only in FILE (e.g. references/methods-writing.md) if given. Only the
+    bytes of that section are read. Without HEADING, the sections are listed.
+
+    \b
+    Examples:
+      skillz show scientific-writing#methods
+      skillz show scientific-writing/references/methods-writing.md#statistics
+    """
+    _ = ctx.obj.get("verbose", False)  # Reserved for future use
+    config = Config()
+
+    repo_path = config.get_repository_path()
+    if not repo_path or not repo_path.exists():
+        console.print("[red]Error: Repository path not configured or does not exist.[/red]")
+        console.print("Run: skillz config set repository <path>")
+        raise click.Abort()
+
+    item, _, heading = target.partition("#")
+    name, _, file = item.partition("/")
+    repository = SkillRepository.from_config(config, repo_path)
+    try:
+        index = repository.sections(name)
+        if file and file not in index:
+            raise SkillzError(f"No markdown file '{file}' in {name}")
+        if heading:
+            text = repository.read_section(name, heading, file or None)
+    except SkillzError as e:
+        console.print(f"[red]Error: {escape(str(e))}[/red]")
+        raise click.Abort()
+    finally:
+        repository.save_cache()
+
+    if heading:
+        click.echo(text, nl=not text.endswith("\n"))
+        return
+
+    table = Table(title=f"Sections of {name}")
+    table.add_column("File", style="cyan", overflow="fold")
+    table.add_column("Section")
+    table.add_column("Anchor", style="green", overflow="fold")
+    table.add_column("Size", justify="right")
+    for relpath, sections in index.items():
+        if file and relpath != file:
+            continue
+        for section in sections:
+            table.add_row(
+                escape(relpath),
+                escape("  " * (section.level - 1) + section.title),
+                escape(f"#{section.anchor}"),
+                _format_size(section.size),
+            )
+    console.print(table)
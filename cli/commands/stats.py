@@ -0,0 +1,119 @@
+"""Stats command for skillz."""
+
+import json
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from cli.analytics import install_footprint, repository_stats
+from cli.commands.info import _format_size
+from cli.config import Config
+from cli.core import SkillRepository
+from cli.locations import install_locations
+
+console = Console()
+
+
+@click.command()
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Report format",
+)
+@click.option(
+    "--top",
+    type=click.IntRange(min=0),
+    default=10,
+    show_default=True,
+    help="Number of largest files to list",
+)
+@click.pass_context
+def stats(ctx, output_format, top):
+    """
+    Show repository statistics.
+
+    Reports counts, sizes and token estimates per category, the largest
+    files, how often each tool appears in allowed-tools, and how much is
+    installed for each platform.
+    """
+    _ = ctx.obj.get("verbose", False)  # Reserved for future use
+    config = Config()
+
+    repo_path = config.get_repository_path()
+    if not repo_path or not repo_path.exists():
+        console.print("[red]Error: Repository path not configured or does not exist.[/red]")
+        console.print("Run: skillz config set repository <path>")
+        raise click.Abort()
+
+    repository = SkillRepository.from_config(config, repo_path)
+    report = repository_stats(repository.catalog, largest=top)
+    repository.save_cache()
+    report["installed"] = install_footprint(install_locations(config))
+
+    if output_format == "json":
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    _print_report(report)
+
+
+def _print_report(report):
+    """Print the statistics as rich tables."""
+    console.print(
+        f"[bold]{report['skills']} skills, {report['commands']} commands[/bold] - "
+        f"{_format_size(report['bytes'])}, ~{report['tokens']:,} body tokens "
+        f"(median {_format_size(report['median_bytes'])}, "
+        f"~{report['median_tokens']:,} tokens per item)"
+    )
+
+    table = Table(title="Categories")
+    table.add_column("Category", style="cyan")
+    table.add_column("Skills", justify="right")
+    table.add_column("Commands", justify="right")
+    table.add_column("Size", justify="right", style="green")
+    table.add_column("Median", justify="right")
+    table.add_column("Tokens", justify="right")
+    for row in report["categories"]:
+        table.add_row(
+            row["category"] or "(none)",
+            str(row["skills"]),
+            str(row["commands"]),
+            _format_size(row["bytes"]),
+            _format_size(row["median_bytes"]),
+            f"{row['tokens']:,}",
+        )
+    console.print(table)
+
+    if report["largest_files"]:
+        table = Table(title="Largest Files")
+        table.add_column("File", style="cyan")
+        table.add_column("Size", justify="right", style="green")
+        for row in report["largest_files"]:
+            table.add_row(row["path"], _format_size(row["bytes"]))
+        console.print(table)
+
+    if report["allowed_tools"]:
+        table = Table(title="Allowed Tools")
+        table.add_column("Tool", style="cyan")
+        table.add_column("Skills", justify="right")
+        for tool, count in report["allowed_tools"].items():
+            table.add_row(tool, str(count))
+        console.print(table)
+
+    if report["installed"]:
+        table = Table(title="Installed")
+        table.add_column("Location", style="cyan")
+        table.add_column("Skills", justify="right")
+        table.add_column("Commands", justify="right")
+        table.add_column("Size", justify="right", style="green")
+        for row in report["installed"]:
+            table.add_row(
+                row["location"],
+                str(row["skills"]),
+                str(row["commands"]),
+                _format_size(row["bytes"]),
+            )
+        console.print(table)
@@ -1,93 +1,185 @@
 """Uninstall command for skillz."""
 
-import shutil
+from fnmatch import fnmatchcase
 
 import click
 from rich.console import Console
+from rich.table import Table
 
+from cli.catalog import CommandRecord, SkillRecord
+from cli.commands.info import _format_size
 from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.locations import find_installed, install_locations
 from cli.utils import confirm_action
 
 console = Console()
 
+PATTERN_CHARS = "*?["
+
 
 @click.command()
-@click.argument("name")
+@click.argument("names", nargs=-1)
 @click.option(
     "--target",
     "-t",
-    type=click.Choice(["personal", "project"]),
+    type=click.Choice(["personal", "project", "all"]),
     default="personal",
-    help="Target location (personal or project)",
+    help="Target location (personal, project or all)",
 )
 @click.option(
     "--platform",
     "-p",
     default="claude",
-    help="Target platform (claude, codex, gemini, opencode, copilot, mcp)",
+    help="Target platform (claude, codex, gemini, opencode, copilot, mcp, or all)",
 )
 @click.option("--type", "item_type", type=click.Choice(["skill", "command"]), help="Item type")
+@click.option("--category", "-c", help="Only items in this repository category")
+@click.option("--all", "uninstall_all", is_flag=True, help="Uninstall every installed item")
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation")
 @click.option("--dry-run", is_flag=True, help="Preview without making changes")
 @click.pass_context
-def uninstall(ctx, name, target, platform, item_type, force, dry_run):
+def uninstall(ctx, names, target, platform, item_type, category, uninstall_all, force, dry_run):
     """
-    Uninstall a skill or command.
+    Uninstall skills and commands.
 
-    NAME is the name of the skill or command to uninstall.
+    NAMES are the names of the items to uninstall, or glob patterns such as
+    'opentrons-*' (quote them so the shell does not expand them). Use --all
+    to uninstall everything, or --category to uninstall the items of a
+    repository category. The whole plan is confirmed once and items are
+    removed in parallel.
     """
     verbose = ctx.obj.get("verbose", False)
     config = Config()
 
-    # Try to find the item
-    found_items = []
-
-    if not item_type or item_type == "skill":
-        skills_dir = config.get_skills_dir(target, platform)
-        skill_path = skills_dir / name
-        if skill_path.exists() and (skill_path / "SKILL.md").exists():
-            found_items.append(("skill", skill_path))
-
-    if not item_type or item_type == "command":
-        commands_dir = config.get_commands_dir(target, platform)
-        # Try both with and without .md extension
-        cmd_path = commands_dir / f"{name}.md" if not name.endswith(".md") else commands_dir / name
-        if cmd_path.exists():
-            found_items.append(("command", cmd_path))
-
-    if not found_items:
-        console.print(f"[red]Error: '{name}' not found in {target} for {platform}[/red]")
+    if uninstall_all and names:
+        console.print("[red]Error: Cannot specify both NAMES and --all[/red]")
         raise click.Abort()
-
-    if len(found_items) > 1:
-        console.print("[yellow]Multiple items found. Please specify --type[/yellow]")
-        for item_type, path in found_items:
-            console.print(f"  - {item_type}: {path}")
+    if not names and not uninstall_all and not category:
+        console.print("[red]Error: Specify NAMES, --category or --all[/red]")
         raise click.Abort()
 
-    item_type, item_path = found_items[0]
-
-    if verbose:
-        console.print(f"Found {item_type}: {item_path}")
-
-    # Confirmation
-    if not force:
-        if not confirm_action(f"Uninstall {item_type} '{name}'?", default=False):
-            console.print("[yellow]Uninstall cancelled[/yellow]")
-            return
-
-    # Dry run
+    targets = None if target == "all" else [target]
+    platforms = None if platform == "all" else [platform]
+
+    with Installer(config=config) as installer:
+        records = installer.installed(targets, platforms, item_type or "all")
+        if names:
+            records = [r for r in records if any(fnmatchcase(r.name, n) for n in names)]
+            records += _find_unrecorded(config, records, names, targets, platforms, item_type)
+        if category:
+            records = _in_category(config, records, category)
+
+        if not records:
+            if len(names) == 1 and not category:
+                console.print(
+                    f"[red]Error: '{names[0]}' not found in {target} for {platform}[/red]"
+                )
+            else:
+                console.print("[red]Error: No installed items match[/red]")
+            raise click.Abort()
+
+        single = len(names) == 1 and not _is_pattern(names[0]) and not category
+        if single and not item_type and len({record.type for record in records}) > 1:
+            console.print("[yellow]Multiple items found. Please specify --type[/yellow]")
+            for record in records:
+                console.print(f"  - {record.type}: {record.path}")
+            raise click.Abort()
+
+        # Size every item before asking, so the plan shows what will be reclaimed
+        total = sum(installer.executor.map(lambda record: record.stats.bytes, records))
+
+        if verbose or len(records) > 1:
+            _print_plan(records)
+
+        if len(records) == 1:
+            record = records[0]
+            prompt = f"Uninstall {record.type} '{record.name}' ({_format_size(total)})?"
+        else:
+            prompt = f"Uninstall {len(records)} items ({_format_size(total)})?"
+        if not force and not dry_run:
+            if not confirm_action(prompt, default=False):
+                console.print("[yellow]Uninstall cancelled[/yellow]")
+                return
+
+        results = installer.uninstall_records(records, dry_run=dry_run)
+        snapshot = installer.last_snapshot
+
+    failed = [result for result in results if not result.ok]
+    for result in results:
+        if not result.ok:
+            console.print(f"[red]{result.message}[/red]")
+        elif dry_run:
+            console.print(
+                f"[blue]Would uninstall {result.type} '{result.name}' from {result.path}[/blue]"
+            )
+        elif result.status == "skipped" or verbose:
+            console.print(f"[dim]{result.message}[/dim]")
+
+    removed = [result for result in results if result.status in ("ok", "planned")]
+    reclaimed = _format_size(sum(result.bytes for result in removed))
     if dry_run:
-        console.print(f"[blue]Would uninstall {item_type} '{name}' from {item_path}[/blue]")
-        return
+        console.print(f"[blue]Would reclaim {reclaimed}[/blue]")
+    elif len(results) == 1 and removed:
+        console.print(
+            f"[green]Successfully uninstalled {removed[0].type} '{removed[0].name}' "
+            f"(reclaimed {reclaimed})[/green]"
+        )
+    elif removed:
+        console.print(f"[green]Uninstalled {len(removed)} item(s), reclaimed {reclaimed}[/green]")
+    if snapshot:
+        console.print(f"[dim]Saved snapshot {snapshot.id}; undo with: skillz rollback[/dim]")
+    if failed:
+        console.print(f"[red]Failed to uninstall {len(failed)} item(s)[/red]")
+        ctx.exit(1)
+
+
+def _is_pattern(name: str) -> bool:
+    """True if name is a glob pattern rather than an item name."""
+    return any(char in name for char in PATTERN_CHARS)
+
+
+def _find_unrecorded(config, records, names, targets, platforms, item_type):
+    """
+    Probe install locations for exact names the state database does not know.
 
-    # Uninstall
-    try:
-        if item_path.is_dir():
-            shutil.rmtree(item_path)
-        else:
-            item_path.unlink()
-        console.print(f"[green]Successfully uninstalled {item_type} '{name}'[/green]")
-    except Exception as e:
-        console.print(f"[red]Error uninstalling {item_type}: {e}[/red]")
+    Covers items copied into a location by hand after it was first listed.
+    """
+    known = {record.path for record in records}
+    catalogs = install_locations(config, targets, platforms)
+    found = []
+    for name in names:
+        if _is_pattern(name):
+            continue
+        for item in find_installed(catalogs, name, item_type):
+            if item.path in known:
+                continue
+            record_class = SkillRecord if item.type == "skill" else CommandRecord
+            found.append(record_class(item.name, "", item.path, location=item.location))
+    return found
+
+
+def _in_category(config, records, category):
+    """Keep the records whose repository item is in category."""
+    repo_path = config.get_repository_path()
+    if not repo_path or not repo_path.exists():
+        console.print("[red]Error: --category needs a configured repository[/red]")
         raise click.Abort()
+    repository = SkillRepository.from_config(config, repo_path)
+    members = {
+        (r.type, r.name) for r in repository.skills(category) + repository.commands(category)
+    }
+    repository.save_cache()
+    return [record for record in records if (record.type, record.name) in members]
+
+
+def _print_plan(records):
+    """Print the items that will be uninstalled."""
+    table = Table(title="Uninstall Plan")
+    table.add_column("Type", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Location", style="yellow")
+    table.add_column("Size", justify="right")
+    for record in records:
+        table.add_row(record.type, record.name, record.location, _format_size(record.stats.bytes))
+    console.print(table)
@@ -0,0 +1,109 @@
+"""Validate command for skillz."""
+
+import sys
+
+import click
+from rich.console import Console
+from rich.markup import escape
+
+from cli.config import Config
+from cli.core import SkillRepository
+from cli.reports import REPORT_FORMATS
+from cli.roots import resolver
+
+console = Console()
+
+SEVERITY_STYLES = {"error": "red", "warning": "yellow"}
+
+
+@click.command()
+@click.argument("names", nargs=-1)
+@click.option("--type", "item_type", type=click.Choice(["skill", "command", "all"]), default="all")
+@click.option("--category", "-c", help="Only validate items in this category")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["text", "jsonl", "sarif"]),
+    default="text",
+    help="Report format (jsonl and sarif are streamed to stdout)",
+)
+@click.option(
+    "--max-errors",
+    type=click.IntRange(min=1),
+    help="Stop after this many errors",
+)
+@click.option("--fail-fast", is_flag=True, help="Stop at the first invalid item")
+@click.pass_context
+def validate(ctx, names, item_type, category, output_format, max_errors, fail_fast):
+    """
+    Validate skills and commands in the repository.
+
+    NAMES limits validation to those items (default: every item). Without a
+    configured repository, the repository checkout containing the current
+    directory is validated. Issues are reported as each file is checked.
+    Exits with status 1 if any errors were found.
+    """
+    verbose = ctx.obj.get("verbose", False)
+    config = Config()
+
+    # Like export, fall back to the repository checkout we are in
+    repo_path = config.get_repository_path() or resolver.repository_root()
+    if not repo_path or not repo_path.exists():
+        console.print("[red]Error: Repository path not configured or does not exist.[/red]")
+        console.print("Run: skillz config set repository <path>")
+        raise click.Abort()
+
+    repository = SkillRepository.from_config(config, repo_path)
+    records = []
+    if item_type in ("skill", "all"):
+        records.extend(repository.skills(category))
+    if item_type in ("command", "all"):
+        records.extend(repository.commands(category))
+    if not names:
+        # One walk of the catalog lists every skill for the size and link checks
+        repository.catalog.scan_stats(largest=0)
+    repository.save_cache()
+    if names:
+        missing = set(names) - {record.name for record in records}
+        if missing:
+            console.print(f"[red]Error: Not found: {', '.join(sorted(missing))}[/red]")
+            raise click.Abort()
+        records = [record for record in records if record.name in names]
+
+    if fail_fast:
+        max_errors = 1
+    report = REPORT_FORMATS[output_format](sys.stdout) if output_format != "text" else None
+
+    checked = errors = warnings = 0
+    if report:
+        report.start()
+    for record, issues in repository.check_all(records):
+        checked += 1
+        for issue in issues:
+            if report:
+                report.emit(issue)
+            else:
+                style = SEVERITY_STYLES.get(issue.severity, "white")
+                location = f"{issue.file}:{issue.line}" if issue.line else issue.file
+                console.print(
+                    f"{escape(location)}: [{style}]{issue.severity}[/{style}] "
+                    f"{escape(issue.message)} [dim]\\[{issue.rule}][/dim]"
+                )
+        errors += sum(issue.is_error for issue in issues)
+        warnings += sum(not issue.is_error for issue in issues)
+        if verbose and not report and not issues:
+            console.print(f"[green]{record.type} '{record.name}' is valid[/green]")
+        if max_errors and errors >= max_errors:
+            break
+    if report:
+        report.finish()
+
+    if not report:
+        stopped = f" (stopped after {errors} error(s))" if checked < len(records) else ""
+        style = "red" if errors else "green"
+        console.print(
+            f"[{style}]Checked {checked} of {len(records)} item(s): "
+            f"{errors} error(s), {warnings} warning(s){stopped}[/{style}]"
+        )
+    if errors:
+        ctx.exit(1)
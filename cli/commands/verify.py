@@ -0,0 +1,156 @@
+"""Verify command for skillz."""
+
+import json
+from fnmatch import fnmatchcase
+
+import click
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.integrity import NONE
+
+console = Console()
+
+
+@click.command()
+@click.argument("names", nargs=-1)
+@click.option(
+    "--target",
+    "-t",
+    type=click.Choice(["personal", "project", "all"]),
+    default="all",
+    help="Target location (personal, project or all)",
+)
+@click.option(
+    "--platform",
+    "-p",
+    default="all",
+    help="Target platform (claude, codex, gemini, opencode, copilot, mcp, or all)",
+)
+@click.option("--type", "item_type", type=click.Choice(["skill", "command"]), help="Item type")
+@click.option(
+    "--repository",
+    "use_repository",
+    is_flag=True,
+    help="Compare with the repository instead of the install manifests",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Number of files to hash in parallel",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["table", "json"]),
+    default="table",
+    help="Report format",
+)
+@click.pass_context
+def verify(ctx, names, target, platform, item_type, use_repository, jobs, output_format):
+    """
+    Check installed items for modified, missing or added files.
+
+    NAMES are item names or glob patterns (default: every installed item).
+    Each item is compared with the manifest recorded when skillz installed
+    it, or with the repository when it has none. Files whose size and
+    modification time are unchanged are not read. Exits with status 1 if
+    any item drifted.
+    """
+    verbose = ctx.obj.get("verbose", False)
+    config = Config()
+
+    repo_path = config.get_repository_path()
+    repository = None
+    if repo_path and repo_path.exists():
+        # The installer saves the catalog cache when it is closed
+        repository = SkillRepository.from_config(config, repo_path)
+    elif use_repository:
+        console.print("[red]Error: Repository path not configured or does not exist.[/red]")
+        console.print("Run: skillz config set repository <path>")
+        raise click.Abort()
+
+    targets = None if target == "all" else [target]
+    platforms = None if platform == "all" else [platform]
+
+    with Installer(repository, config, jobs=jobs) as installer:
+        records = installer.installed(targets, platforms, item_type or "all")
+        if names:
+            records = [r for r in records if any(fnmatchcase(r.name, n) for n in names)]
+        drifts = installer.verify(records, use_repository=use_repository)
+
+    drifted = [drift for drift in drifts if drift.baseline != NONE and not drift.ok]
+    unverified = [drift for drift in drifts if drift.baseline == NONE]
+
+    if output_format == "json":
+        click.echo(json.dumps([_to_dict(drift) for drift in drifts], indent=2))
+    else:
+        _print_report(drifts if verbose else drifted + unverified)
+        files = sum(drift.files for drift in drifts)
+        hashed = sum(drift.hashed for drift in drifts)
+        color = "red" if drifted else "green"
+        console.print(
+            f"[{color}]Verified {len(drifts)} item(s), {files} file(s) ({hashed} hashed): "
+            f"{len(drifted)} drifted, {len(unverified)} without a baseline[/{color}]"
+        )
+
+    if drifted:
+        ctx.exit(1)
+
+
+def _status(drift) -> str:
+    """One-word status of a verification result."""
+    if drift.baseline == NONE:
+        return "unverified"
+    return "ok" if drift.ok else "drifted"
+
+
+def _to_dict(drift):
+    """JSON-serializable form of a verification result."""
+    record = drift.record
+    return {
+        "type": record.type,
+        "name": record.name,
+        "location": record.location,
+        "path": str(record.path),
+        "baseline": drift.baseline,
+        "status": _status(drift),
+        "modified": list(drift.modified),
+        "missing": list(drift.missing),
+        "added": list(drift.added),
+        "files": drift.files,
+        "hashed": drift.hashed,
+    }
+
+
+def _print_report(drifts):
+    """Print one row per item with the files that differ from its baseline."""
+    if not drifts:
+        return
+    table = Table(title="Integrity")
+    table.add_column("Type", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Location", style="yellow")
+    table.add_column("Status")
+    table.add_column("Changes", overflow="fold")
+    for drift in drifts:
+        changes = [f"modified {file}" for file in drift.modified]
+        changes += [f"missing {file}" for file in drift.missing]
+        changes += [f"added {file}" for file in drift.added]
+        status = _status(drift)
+        style = {"ok": "green", "drifted": "red"}.get(status, "yellow")
+        record = drift.record
+        table.add_row(
+            record.type,
+            record.name,
+            record.location,
+            f"[{style}]{status}[/{style}] ({drift.baseline})",
+            escape("\n".join(changes)),
+        )
+    console.print(table)
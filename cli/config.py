@@ -6,6 +6,9 @@ from typing import Dict, Optional
 
 import yaml
 
+from cli.profiling import profiler
+from cli.roots import resolver
+
 
 class Config:
     """Configuration manager for skillz."""
@@ -16,6 +19,15 @@ class Config:
         "project_skills_dir": ".opencode/skills",
         "project_commands_dir": ".opencode/command",
         "repository_path": None,  # Path to the local clone of skills repository
+        "cache_dir": "~/.cache/skillz",  # Build cache for incremental export
+        "state_db": "~/.local/state/skillz/state.db",  # Database of installed items
+        "snapshot_keep": 5,  # Snapshots kept per install root before bulk changes (0 disables)
+        # Skill size lint thresholds (0 disables a rule)
+        "lint": {
+            "max_skill_bytes": 262144,  # All files in the skill directory
+            "max_body_tokens": 5000,  # Estimated tokens of the SKILL.md body
+            "max_references": 10,  # Files under references/
+        },
         "default_target": "personal",  # personal or project
         # Default platform: opencode, claude, codex, gemini, copilot, mcp
         "default_platform": "opencode",
@@ -56,13 +68,16 @@ class Config:
 
     def _load_config(self) -> Dict:
         """Load configuration from file or use defaults."""
-        if self.config_path.exists():
-            with open(self.config_path) as f:
-                user_config = yaml.safe_load(f) or {}
+        with profiler.span("config", path=self.config_path):
+            if self.config_path.exists():
+                with open(self.config_path) as f:
+                    text = f.read()
+                profiler.count("config", files=1, bytes=len(text))
+                user_config = yaml.safe_load(text) or {}
                 # Deep merge with defaults
                 config = self._deep_merge(self.DEFAULT_CONFIG.copy(), user_config)
                 return config
-        return self.DEFAULT_CONFIG.copy()
+            return self.DEFAULT_CONFIG.copy()
 
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
         """Deep merge two dictionaries, with override taking precedence."""
@@ -90,7 +105,7 @@ class Config:
         else:  # project
             path = self.config["project_skills_dir"]
 
-        return Path(os.path.expanduser(path))
+        return self._resolve(path)
 
     def get_commands_dir(self, target: str = "personal", platform: str = "claude") -> Path:
         """Get the commands directory for a given target and platform."""
@@ -102,7 +117,25 @@ class Config:
         else:  # project
             path = self.config["project_commands_dir"]
 
-        return Path(os.path.expanduser(path))
+        return self._resolve(path)
+
+    def get_project_root(self) -> Path:
+        """
+        Get the root of the project containing the working directory.
+
+        This is the nearest parent holding the project skills or commands
+        directory, or else the nearest version-control root, or else the
+        working directory itself.
+        """
+        markers = (self.config["project_skills_dir"], self.config["project_commands_dir"])
+        return resolver.project_root([m for m in markers if not os.path.isabs(m)])
+
+    def _resolve(self, path: str) -> Path:
+        """Expand ~ in a configured directory; relative ones are relative to the project root."""
+        expanded = Path(os.path.expanduser(path))
+        if expanded.is_absolute():
+            return expanded
+        return self.get_project_root() / expanded
 
     def get_repository_path(self) -> Optional[Path]:
         """Get the repository path."""
@@ -111,6 +144,26 @@ class Config:
             return Path(os.path.expanduser(repo_path))
         return None
 
+    def get_cache_dir(self) -> Path:
+        """Get the directory for skillz build caches."""
+        return Path(os.path.expanduser(self.config["cache_dir"]))
+
+    def get_state_path(self) -> Path:
+        """Get the path of the installed-items database."""
+        return Path(os.path.expanduser(self.config["state_db"]))
+
+    def get_snapshot_dir(self) -> Path:
+        """Get the directory install snapshots are stored in, next to the state database."""
+        return self.get_state_path().parent / "snapshots"
+
+    def get_snapshot_keep(self) -> int:
+        """Get the number of install snapshots kept per install root."""
+        return int(self.config.get("snapshot_keep", self.DEFAULT_CONFIG["snapshot_keep"]))
+
+    def get_lint_thresholds(self) -> Dict[str, int]:
+        """Get the skill size lint thresholds."""
+        return dict(self.config["lint"])
+
     def set_repository_path(self, path: Path) -> None:
         """Set the repository path."""
         self.config["repository_path"] = str(path)
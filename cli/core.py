@@ -0,0 +1,1100 @@
+"""Embeddable Python API for skillz.
+
+The classes here are the library layer behind the CLI commands. They return
+typed records instead of printing, never prompt, and do not depend on click,
+so long-lived Python services can manage skills in-process::
+
+    from cli.core import Exporter, Installer, SkillRepository
+
+    repository = SkillRepository("/path/to/skillz")
+    with Installer(repository) as installer:
+        results = installer.install_all(platform="claude")
+    Exporter(repository).export("codex")
+
+A ``SkillRepository`` keeps its catalog and validation results between
+calls; call ``refresh()`` after the repository changes on disk.
+"""
+
+import contextlib
+import filecmp
+import functools
+import hashlib
+import io
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+import yaml
+
+from cli import __version__, snapshots
+from cli.buildcache import BuildCache
+from cli.catalog import Catalog, CatalogRecord, CommandRecord, SkillRecord
+from cli.config import Config
+from cli.gc import item_digest
+from cli.gitindex import GitIndex
+from cli.integrity import (
+    MANIFEST,
+    NONE,
+    REPOSITORY,
+    Drift,
+    FileEntry,
+    file_manifest,
+    list_files,
+    verify,
+)
+from cli.locations import install_locations
+from cli.profiling import profiler
+from cli.rendering import (
+    PLATFORMS,
+    Elision,
+    _build_payload,
+    _find_agent,
+    _fit_token_budget,
+    _get_default_output_path,
+    _render_platform,
+    _shard_by_category,
+    _write_platform,
+    _write_shard,
+)
+from cli.sections import Section, find_section, read_section
+from cli.snapshots import Snapshot
+from cli.state import InstallState
+from cli.templating import TemplateError, TemplateRenderer
+from cli.utils import tracked_copy2
+from cli.validator import CommandValidator, Issue, SkillValidator, _summarize
+
+Record = CatalogRecord
+
+
+class SkillzError(Exception):
+    """Error raised by the skillz library API."""
+
+    pass
+
+
+class AgentNotFoundError(SkillzError):
+    """Raised when an agent ID is not defined in agents.yaml."""
+
+    def __init__(self, agent_id: str, available: List[str]):
+        """Initialize with the missing agent ID and the IDs that do exist."""
+        super().__init__(f"Agent '{agent_id}' not found in agents.yaml")
+        self.agent_id = agent_id
+        self.available = available
+
+
+class OperationResult(NamedTuple):
+    """Outcome of installing or uninstalling one item."""
+
+    op: str
+    type: Optional[str]
+    name: str
+    target: str
+    platform: str
+    status: str  # ok, planned, skipped or error
+    path: Optional[Path]
+    message: str
+    errors: Tuple[str, ...] = ()
+    bytes: int = 0  # Size of the item, for uninstalls
+    warnings: Tuple[str, ...] = ()  # Lint warnings of an installed item
+
+    @property
+    def ok(self) -> bool:
+        """True unless the operation failed."""
+        return self.status != "error"
+
+
+class ExportResult(NamedTuple):
+    """Outcome of exporting one agent for one platform."""
+
+    platform: str
+    agent: str
+    path: Path
+    bytes: int
+    changed: bool = True
+    elided: Tuple[Elision, ...] = ()
+    shards: Tuple[Path, ...] = ()
+
+
+class SkillRepository:
+    """A skills repository with a cached catalog and validation results."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        lint: Optional[Dict[str, int]] = None,
+        cache_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize a repository rooted at path.
+
+        Args:
+            path: Repository root
+            lint: Skill size lint thresholds (default: the config file defaults)
+            cache_dir: Directory for the persistent catalog cache and git index
+                (default: none)
+        """
+        self.path = Path(path)
+        self.lint = lint if lint is not None else dict(Config.DEFAULT_CONFIG["lint"])
+        self.cache: Optional[BuildCache] = None
+        self.index: Optional[GitIndex] = None
+        if cache_dir:
+            self.cache = BuildCache(Path(cache_dir) / "catalog.json")
+            self.index = GitIndex(self.path, Path(cache_dir) / "catalog-git.json")
+        self._lock = threading.Lock()
+        self._validation: Dict[Tuple[Path, int, int], List[Issue]] = {}
+        self.catalog = Catalog(self.path, cache=self.cache, index=self.index)
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Config] = None, path: Optional[Union[str, Path]] = None
+    ) -> "SkillRepository":
+        """
+        Create a repository with the configured lint thresholds and cache directory.
+
+        Args:
+            config: Configuration (default: user config)
+            path: Repository root (default: the configured repository path)
+        """
+        config = config or Config()
+        repo_path = Path(path) if path else config.get_repository_path()
+        if not repo_path or not repo_path.exists():
+            raise SkillzError("Repository path not configured or does not exist")
+        return cls(repo_path, lint=config.get_lint_thresholds(), cache_dir=config.get_cache_dir())
+
+    def refresh(self) -> None:
+        """Drop cached catalog data so the next call rescans the repository."""
+        with self._lock:
+            self.catalog = Catalog(self.path, cache=self.cache, index=self.index)
+            self._validation.clear()
+
+    def save_cache(self) -> None:
+        """Persist the catalog cache and git index, if the repository has them."""
+        if self.cache is not None:
+            self.cache.save()
+        if self.index is not None:
+            self.index.save()
+
+    def skills(self, category: Optional[str] = None) -> List[SkillRecord]:
+        """List skills, optionally filtered by a category path prefix such as data/ml."""
+        records = self.catalog.skill_records()
+        if category:
+            records = [r for r in records if self.catalog.in_category(r, category)]
+        return records
+
+    def commands(self, category: Optional[str] = None) -> List[CommandRecord]:
+        """List commands, optionally filtered by a category path prefix such as data/ml."""
+        records = self.catalog.command_records()
+        if category:
+            records = [r for r in records if self.catalog.in_category(r, category)]
+        return records
+
+    def get(self, name: str, item_type: Optional[str] = None) -> Optional[Record]:
+        """Get a skill or command by name, preferring skills when type is not given."""
+        if item_type in (None, "skill"):
+            record = self.catalog.get_skill(name)
+            if record:
+                return record
+        if item_type in (None, "command"):
+            return self.catalog.get_command(name)
+        return None
+
+    def search(self, query: str, item_type: str = "all") -> List[Record]:
+        """Find items whose name or description contains query (case-insensitive)."""
+        query = query.lower()
+        records: List[Record] = []
+        if item_type in ("skill", "all"):
+            records.extend(self.catalog.skill_records())
+        if item_type in ("command", "all"):
+            records.extend(self.catalog.command_records())
+        return [r for r in records if query in r.name.lower() or query in r.description.lower()]
+
+    def sections(self, name: str) -> Dict[str, List[Section]]:
+        """
+        Heading index of a skill's or command's markdown files.
+
+        Returns:
+            Sections keyed by file path relative to the item, SKILL.md first
+
+        Raises:
+            SkillzError: If no such item exists
+        """
+        index = self.catalog.sections(name)
+        if index is None:
+            raise SkillzError(f"'{name}' not found")
+        return index
+
+    def read_section(self, name: str, heading: str, file: Optional[str] = None) -> str:
+        """
+        Read one section of an item, seeking directly to its bytes.
+
+        Args:
+            name: Skill or command name
+            heading: Anchor or heading text of the section
+            file: Markdown file relative to the item (default: search SKILL.md,
+                then the other files)
+
+        Raises:
+            SkillzError: If the item or section does not exist
+        """
+        found = find_section(self.sections(name), heading, file)
+        if found is None:
+            where = f"{name}/{file}" if file else name
+            raise SkillzError(f"No section '{heading}' in {where}")
+        relpath, section = found
+        path = self.catalog.find_skill(name)
+        path = path / relpath if path else self.catalog.find_command(name)
+        return read_section(path, section)
+
+    def validate(self, record: Record) -> Tuple[bool, List[str]]:
+        """
+        Validate a skill or command.
+
+        Results are cached until the SKILL.md or command file changes.
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        return _summarize(self.check(record))
+
+    def check(self, record: Record) -> List[Issue]:
+        """
+        Check a skill or command and return its issues.
+
+        Skills are also linted against the size thresholds. Issue files are
+        relative to the repository. Results are cached until the SKILL.md or
+        command file changes.
+        """
+        source_file = record.source_file
+        try:
+            stat = source_file.stat()
+            key = (source_file, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+
+        if key is not None and key in self._validation:
+            return self._validation[key]
+
+        if isinstance(record, SkillRecord):
+            # One listing of the skill gives both its link targets and its size stats
+            index = set(record.listing) if record.path.is_dir() else None
+            issues = SkillValidator.check_skill_directory(record.path, index)
+            if record.path.is_dir():
+                file = str(record.source_file)
+                issues += SkillValidator.check_stats(record.stats, self.lint, file)
+        else:
+            issues = CommandValidator.check_command_file(record.path)
+        issues = [issue._replace(file=self._relpath(issue.file)) for issue in issues]
+        if key is not None:
+            self._validation[key] = issues
+        return issues
+
+    def check_all(self, records: Iterable[Record]) -> Iterator[Tuple[Record, List[Issue]]]:
+        """
+        Check records one at a time, yielding (record, issues) as each finishes.
+
+        Stop iterating to stop checking; records after that are never read.
+        """
+        for record in records:
+            yield record, self.check(record)
+
+    def _relpath(self, file: str) -> str:
+        """Return file relative to the repository as a POSIX path, if it is inside it."""
+        try:
+            return Path(file).relative_to(self.path).as_posix()
+        except ValueError:
+            return file
+
+
+class Installer:
+    """Installs and uninstalls items, reusing one repository and thread pool."""
+
+    def __init__(
+        self,
+        repository: Optional[SkillRepository] = None,
+        config: Optional[Config] = None,
+        jobs: int = 4,
+        state: Optional[InstallState] = None,
+    ):
+        """
+        Initialize an installer.
+
+        Args:
+            repository: Source repository (required for installs)
+            config: Configuration for install locations (default: user config)
+            jobs: Worker threads used by bulk operations
+            state: Database that records installs and uninstalls
+                (default: the configured state database)
+        """
+        self.repository = repository
+        self.config = config or Config()
+        self.jobs = jobs
+        self.state = state if state is not None else InstallState(self.config.get_state_path())
+        self.last_snapshot: Optional[Snapshot] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def __enter__(self) -> "Installer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool, close the state database and save the catalog cache."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self.state.close()
+        if self.repository is not None:
+            self.repository.save_cache()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool shared by all bulk operations of this installer."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.jobs)
+        return self._executor
+
+    def roots(self, target: str = "personal", platform: str = "claude") -> List[Path]:
+        """Return the skills and commands directories of a target and platform."""
+        return [
+            self.config.get_skills_dir(target, platform),
+            self.config.get_commands_dir(target, platform),
+        ]
+
+    def snapshot(self, roots: Iterable[Path], operation: str) -> Optional[Snapshot]:
+        """
+        Snapshot install roots before a bulk change, keeping the newest few.
+
+        Snapshots are stored in the snapshot directory (see cli.snapshots).
+        Nothing is taken when ``snapshot_keep`` is 0 or the roots cannot be
+        saved; the change then goes ahead without one.
+
+        Returns:
+            The snapshot, also stored as last_snapshot, or None
+        """
+        keep = self.config.get_snapshot_keep()
+        if keep <= 0:
+            return None
+        roots = list(roots)
+        store = self.config.get_snapshot_dir()
+        try:
+            snapshot = snapshots.take(roots, operation, store, self.state.dump(roots))
+        except OSError:
+            return None
+        snapshots.prune(roots, keep, store)
+        self.last_snapshot = snapshot
+        return snapshot
+
+    def rollback(self, snapshot: Snapshot) -> Snapshot:
+        """
+        Restore the install roots saved in a snapshot.
+
+        The replaced state is saved as a new snapshot. The install records
+        and manifests saved with the snapshot are restored too, and the
+        restored roots are rescanned on next listing.
+
+        Returns:
+            The snapshot of the replaced state
+        """
+        store = self.config.get_snapshot_dir()
+        undo = snapshots.rollback(snapshot, store, self.state.dump(snapshot.roots))
+        self.state.restore(snapshot.roots, snapshot.records)
+        keep = self.config.get_snapshot_keep()
+        if keep > 0:
+            snapshots.prune(snapshot.roots, keep, store)
+        return undo
+
+    def destination(self, record: Record, target: str, platform: str) -> Path:
+        """Return the install path of a record for a target and platform."""
+        if isinstance(record, SkillRecord):
+            return self.config.get_skills_dir(target, platform) / record.name
+        return self.config.get_commands_dir(target, platform) / record.path.name
+
+    def install(
+        self,
+        name: str,
+        target: str = "personal",
+        platform: str = "claude",
+        item_type: Optional[str] = None,
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> OperationResult:
+        """
+        Install one skill or command.
+
+        Existing items are skipped unless force is set.
+
+        Returns:
+            OperationResult with status ok, planned, skipped or error
+        """
+
+        def result(status, message, path=None, errors=(), item_type=item_type, warnings=()):
+            return OperationResult(
+                "install",
+                item_type,
+                name,
+                target,
+                platform,
+                status,
+                path,
+                message,
+                errors,
+                warnings=warnings,
+            )
+
+        if self.repository is None:
+            return result("error", "No repository configured")
+
+        record = self.repository.get(name, item_type)
+        if record is None:
+            if item_type:
+                return result("error", f"{item_type.capitalize()} '{name}' not found in repository")
+            return result("error", f"Could not find skill or command '{name}'")
+
+        item_type = record.type
+        dest = self.destination(record, target, platform)
+        if dest.exists() and not force:
+            return result("skipped", f"Already installed at {dest}", dest, item_type=item_type)
+
+        issues = self.repository.check(record)
+        valid, errors = _summarize(issues)
+        if not valid:
+            return result(
+                "error", "; ".join(errors), dest, errors=tuple(errors), item_type=item_type
+            )
+        warnings = tuple(issue.message for issue in issues if not issue.is_error)
+
+        if dry_run:
+            return result(
+                "planned", f"Would install to {dest}", dest, item_type=item_type, warnings=warnings
+            )
+
+        try:
+            _copy_item(record.path, dest, item_type)
+            self.state.record(record, dest, f"{target}/{platform}", file_manifest(dest))
+        except Exception as e:
+            return result("error", f"Error copying {item_type}: {e}", dest, item_type=item_type)
+        return result("ok", f"Installed to {dest}", dest, item_type=item_type, warnings=warnings)
+
+    def install_many(
+        self,
+        names: Iterable[Union[str, Tuple[str, str]]],
+        target: str = "personal",
+        platform: str = "claude",
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> List[OperationResult]:
+        """
+        Install several items in parallel.
+
+        Args:
+            names: Item names, or (item_type, name) pairs
+            target: Installation target
+            platform: Target platform
+            force: Overwrite existing items
+            dry_run: Plan without copying
+
+        Returns:
+            One OperationResult per item, in input order
+        """
+        requests = [(None, n) if isinstance(n, str) else n for n in names]
+        if self.repository is not None:
+            self.repository.catalog.scan()
+        if not dry_run and len(requests) > 1:
+            self.snapshot(self.roots(target, platform), f"install {target}/{platform}")
+        futures = [
+            self.executor.submit(self.install, name, target, platform, item_type, force, dry_run)
+            for item_type, name in requests
+        ]
+        return [future.result() for future in futures]
+
+    def install_all(
+        self,
+        target: str = "personal",
+        platform: str = "claude",
+        force: bool = False,
+        dry_run: bool = False,
+    ) -> List[OperationResult]:
+        """Install every skill and command in the repository in parallel."""
+        if self.repository is None:
+            raise SkillzError("No repository configured")
+        catalog = self.repository.catalog
+        # One walk of the catalog lists every skill for validation
+        catalog.scan_stats(largest=0)
+        requests = [("skill", name) for name in sorted(catalog.skills)]
+        requests += [("command", name) for name in sorted(catalog.commands)]
+        return self.install_many(requests, target, platform, force, dry_run)
+
+    def uninstall(
+        self,
+        name: str,
+        target: str = "personal",
+        platform: str = "claude",
+        item_type: Optional[str] = None,
+        dry_run: bool = False,
+    ) -> OperationResult:
+        """
+        Uninstall one skill or command without prompting.
+
+        Returns:
+            OperationResult with status ok, planned or error
+        """
+
+        def result(status, message, path=None, item_type=item_type):
+            return OperationResult(
+                "uninstall", item_type, name, target, platform, status, path, message
+            )
+
+        found = self.find_installed(name, target, platform, item_type)
+        if not found:
+            return result("error", f"'{name}' not found in {target} for {platform}")
+        if len(found) > 1:
+            return result("error", "Multiple items found; specify the item type")
+
+        item_type, item_path = found[0]
+        if dry_run:
+            return result("planned", f"Would uninstall {item_path}", item_path, item_type)
+
+        try:
+            self._remove(item_type, item_path)
+        except Exception as e:
+            return result("error", f"Error uninstalling {item_type}: {e}", item_path, item_type)
+        return result("ok", f"Uninstalled {item_path}", item_path, item_type)
+
+    def installed(
+        self,
+        targets: Optional[Sequence[str]] = None,
+        platforms: Optional[Sequence[str]] = None,
+        item_type: str = "all",
+    ) -> List[Record]:
+        """
+        Items installed for targets and platforms, from the state database.
+
+        Args:
+            targets: Targets to include (default: personal and project)
+            platforms: Platforms to include (default: every configured platform)
+            item_type: 'skill', 'command' or 'all'
+        """
+        return self.state.items(install_locations(self.config, targets, platforms), item_type)
+
+    def uninstall_records(
+        self, records: Iterable[Record], dry_run: bool = False
+    ) -> List[OperationResult]:
+        """
+        Uninstall installed items in parallel without prompting.
+
+        Each result reports the size of the item in bytes, which is the space
+        reclaimed by removing it. Items already removed from disk are
+        skipped and dropped from the state database.
+
+        Returns:
+            One OperationResult per record, in input order
+        """
+        records = list(records)
+        if not dry_run and len(records) > 1:
+            roots = dict.fromkeys(record.path.parent for record in records)
+            self.snapshot(roots, f"uninstall {len(records)} items")
+        uninstall = functools.partial(self._uninstall_record, dry_run=dry_run)
+        return list(self.executor.map(uninstall, records))
+
+    def _uninstall_record(self, record: Record, dry_run: bool) -> OperationResult:
+        """Uninstall one installed item."""
+        target, _, platform = record.location.partition("/")
+
+        def result(status, message, size=0):
+            return OperationResult(
+                "uninstall",
+                record.type,
+                record.name,
+                target,
+                platform,
+                status,
+                record.path,
+                message,
+                bytes=size,
+            )
+
+        if not record.path.exists():
+            self.state.remove(record.type, record.name, record.path)
+            return result("skipped", f"Already removed: {record.path}")
+        size = record.stats.bytes
+        if dry_run:
+            return result("planned", f"Would uninstall {record.path}", size)
+        try:
+            self._remove(record.type, record.path)
+        except Exception as e:
+            return result("error", f"Error uninstalling {record.type}: {e}")
+        return result("ok", f"Uninstalled {record.path}", size)
+
+    def verify(self, records: Sequence[Record], use_repository: bool = False) -> List[Drift]:
+        """
+        Check installed items for files changed since they were installed.
+
+        Items are compared with the manifest recorded at install time, or
+        with the repository item of the same name when there is no manifest
+        (items installed by hand or by an older skillz) or use_repository is
+        set. Files are hashed in parallel on the installer's worker pool.
+
+        Returns:
+            One Drift per record, in input order
+        """
+
+        def baseline(record: Record):
+            if not use_repository:
+                manifest = self.state.manifest(record.type, record.name, record.path)
+                if manifest:
+                    return MANIFEST, manifest, None
+            source = self.repository.get(record.name, record.type) if self.repository else None
+            if source is None:
+                return NONE, {}, None
+            entries = {
+                relative: FileEntry(stat.st_size, stat.st_mtime_ns)
+                for relative, stat in list_files(source.path).items()
+            }
+            return REPOSITORY, entries, source.path
+
+        return verify(records, baseline, self.executor)
+
+    def _remove(self, item_type: str, path: Path) -> None:
+        """Delete an installed item and record its removal."""
+        if path.is_dir():
+            shutil.rmtree(path)
+            self.state.remove(item_type, path.name, path)
+        else:
+            path.unlink()
+            self.state.remove(item_type, path.stem, path)
+
+    def find_installed(
+        self,
+        name: str,
+        target: str = "personal",
+        platform: str = "claude",
+        item_type: Optional[str] = None,
+    ) -> List[Tuple[str, Path]]:
+        """Return (item_type, path) pairs for installed items matching name."""
+        found = []
+        if item_type in (None, "skill"):
+            skill_path = self.config.get_skills_dir(target, platform) / name
+            if (skill_path / "SKILL.md").exists():
+                found.append(("skill", skill_path))
+        if item_type in (None, "command"):
+            commands_dir = self.config.get_commands_dir(target, platform)
+            cmd_path = commands_dir / (name if name.endswith(".md") else f"{name}.md")
+            if cmd_path.exists():
+                found.append(("command", cmd_path))
+        return found
+
+
+class Exporter:
+    """
+    Renders agent instruction files from a repository's agent specification.
+
+    Exports are incremental: every input (agents.yaml, global policies, the
+    frontmatter of each skill and command, platform and agent) is folded
+    into a fingerprint, and an output generated from the same fingerprint
+    is left untouched. Outputs whose rendered content is unchanged are not
+    rewritten either, so file watchers only fire on real changes.
+    """
+
+    def __init__(
+        self,
+        repository: SkillRepository,
+        cache_dir: Optional[Path] = None,
+        token_budget: Optional[int] = None,
+        shard_by: Optional[str] = None,
+        template: Optional[str] = None,
+    ):
+        """
+        Initialize an exporter for a repository.
+
+        Args:
+            repository: Repository to export
+            cache_dir: Directory for the persistent build cache (default: in-memory only)
+            token_budget: Estimated token limit per output; lower-priority skills
+                and commands are truncated or dropped to fit (default: no limit)
+            shard_by: 'category' to write a root file with a category index plus
+                one detail file per category (default: a single file)
+            template: Name of a template in .ai/templates/ to render instead of
+                the built-in platform format (requires jinja2)
+        """
+        if shard_by not in (None, "category"):
+            raise SkillzError(f"Unknown shard key: {shard_by}")
+        if shard_by and token_budget:
+            raise SkillzError("A token budget cannot be combined with sharding")
+        self.repository = repository
+        self.token_budget = token_budget
+        self.shard_by = shard_by
+        self.template = template
+        self.templates = TemplateRenderer(
+            self.repository.path / ".ai" / "templates",
+            Path(cache_dir) / "templates" if cache_dir else None,
+        )
+        self.cache = BuildCache(Path(cache_dir) / "export.json" if cache_dir else None)
+        self._files: Dict[Path, Tuple[Tuple[int, int], object]] = {}
+
+    @property
+    def agents_path(self) -> Path:
+        """Path of the canonical agent specification."""
+        return self.repository.path / ".ai" / "agents" / "agents.yaml"
+
+    def agents_config(self) -> Dict:
+        """Load agents.yaml, reusing the parsed result until the file changes."""
+        if not self.agents_path.exists():
+            raise SkillzError(f"Agent configuration not found at {self.agents_path}")
+        try:
+            return self._load_cached(self.agents_path, yaml.safe_load) or {}
+        except yaml.YAMLError as e:
+            raise SkillzError(f"Could not load agents.yaml: {e}") from e
+
+    @property
+    def policies_path(self) -> Path:
+        """Path of the global policies file."""
+        return self.repository.path / ".ai" / "policies" / "global.md"
+
+    def global_policies(self) -> str:
+        """Load .ai/policies/global.md, or '' if it does not exist."""
+        path = self.policies_path
+        if not path.exists():
+            return ""
+        return self._load_cached(path, lambda text: text)
+
+    def agent_ids(self) -> List[str]:
+        """IDs of the agents defined in agents.yaml, in file order."""
+        return [a["id"] for a in self.agents_config().get("agents", [])]
+
+    def payload(self, agent: str = "default") -> Dict:
+        """Build the platform-neutral payload and instruction block for one agent."""
+        agents_config = self.agents_config()
+        agent_config = _find_agent(agents_config, agent)
+        if not agent_config:
+            raise AgentNotFoundError(agent, self.agent_ids())
+
+        role_id = agent_config.get("role")
+        role_policies = ""
+        if role_id and "roles" in agents_config:
+            role_policies = agents_config["roles"].get(role_id, {}).get("policies", "")
+
+        with profiler.span("render", agent=agent):
+            return _build_payload(
+                agent_config=agent_config,
+                agents_config=agents_config,
+                global_policies=self.global_policies(),
+                role_policies=role_policies,
+                skills=self.repository.skills(),
+                commands=self.repository.commands(),
+            )
+
+    def fit(self, platform: str, payload: Dict) -> Tuple[Dict, List[Elision]]:
+        """Apply the token budget to a payload for one platform."""
+        if self.token_budget is None:
+            return payload, []
+        try:
+            return _fit_token_budget(payload, platform, self.token_budget)
+        except ValueError as e:
+            raise SkillzError(str(e)) from e
+
+    def render(self, platform: str, agent: str = "default") -> str:
+        """Render the instruction file content for one agent and platform."""
+        payload, _ = self.fit(platform, self.payload(agent))
+        if not self.template:
+            return _render_payload(platform, payload)
+        out = io.StringIO()
+        self._writer(platform, payload)(out)
+        return out.getvalue()
+
+    def default_output_path(self, platform: str, agent: Optional[str] = None) -> Path:
+        """
+        Return the platform's default output path in the repository.
+
+        Agents other than 'default' get a suffixed path when agent is given.
+        """
+        return _get_default_output_path(platform, self.repository.path, agent)
+
+    def inputs_digest(self) -> str:
+        """Digest the inputs shared by every export of this repository."""
+        with profiler.span("cache"):
+            digest = hashlib.sha256()
+            for part in (str(BuildCache.VERSION), __version__):
+                digest.update(part.encode() + b"\0")
+            for path in (self.agents_path, self.policies_path):
+                digest.update(self.cache.digest(path).encode())
+            if self.template:
+                templates_dir = self.templates.templates_dir
+                for path in sorted(templates_dir.rglob("*")) if templates_dir.is_dir() else []:
+                    if path.is_file():
+                        digest.update(f"{path}\0{self.cache.digest(path)}\0".encode())
+
+            # Built-in renderers only use frontmatter; templates also see bodies and file sizes
+            catalog = self.repository.catalog
+            items = [(name, path, path / "SKILL.md") for name, path in catalog.skills.items()]
+            items += [(name, path, path) for name, path in catalog.commands.items()]
+            for name, path, source in sorted(items, key=lambda item: str(item[1])):
+                digest.update(f"{name}\0{path.relative_to(self.repository.path)}\0".encode())
+                if self.template:
+                    digest.update(item_digest(path, self.cache).encode())
+                else:
+                    digest.update(self.cache.digest(source, frontmatter_only=True).encode())
+            return digest.hexdigest()
+
+    def fingerprint(
+        self, platform: str, agent: str, output: Path, inputs: Optional[str] = None
+    ) -> str:
+        """Digest every input that affects one rendered output."""
+        inputs = inputs or self.inputs_digest()
+        options = (str(self.token_budget), str(self.shard_by), str(self.template))
+        key = "\0".join((inputs, platform, agent, str(output), *options))
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def is_current(
+        self, platform: str, agent: str = "default", output: Optional[Path] = None
+    ) -> bool:
+        """Return True if output (and its shards) already hold what export would write."""
+        output_path = Path(output) if output else self.default_output_path(platform)
+        if self.cache.is_fresh(output_path, self.fingerprint(platform, agent, output_path)):
+            return True
+
+        payload, _ = self.fit(platform, self.payload(agent))
+        outputs = self._outputs(platform, payload, output_path)
+        shards = {file for file, _ in outputs[1:]}
+        if any(old.exists() for old in set(self.cache.output_files(output_path)) - shards):
+            return False
+        for file, write in outputs:
+            expected = io.StringIO()
+            write(expected)
+            if _read_text(file) != expected.getvalue():
+                return False
+        return True
+
+    def export(
+        self, platform: str, agent: str = "default", output: Optional[Path] = None
+    ) -> ExportResult:
+        """
+        Render and write the instruction file for one agent and platform.
+
+        Nothing is rendered when the inputs match the previous export of the
+        same output, and nothing is written when the rendered content equals
+        the existing file; ``ExportResult.changed`` is False in both cases.
+        """
+        output_path = Path(output) if output else self.default_output_path(platform)
+        return self.export_targets([(platform, agent, output_path)])[0]
+
+    def export_many(self, platforms: Iterable[str], agents: Iterable[str]) -> List[ExportResult]:
+        """
+        Export every combination of platforms and agents to default locations.
+
+        Discovery, policy loading and the instruction block are built once
+        per agent, platform renderers run in parallel, and every output is
+        written atomically after all of them rendered successfully. Agents
+        other than 'default' are written to suffixed paths such as
+        ``AGENTS.review.md``.
+        """
+        return self.export_targets(
+            [
+                (platform, agent, self.default_output_path(platform, agent))
+                for agent in agents
+                for platform in platforms
+            ]
+        )
+
+    def export_targets(self, targets: List[Tuple[str, str, Path]]) -> List[ExportResult]:
+        """
+        Export explicit (platform, agent, output path) targets.
+
+        Only targets whose fingerprint changed are rendered, and only
+        outputs whose content changed are written.
+        """
+        inputs = self.inputs_digest()
+        fingerprints = [self.fingerprint(p, a, path, inputs) for p, a, path in targets]
+        stale = [
+            target
+            for target, fingerprint in zip(targets, fingerprints)
+            if not self.cache.is_fresh(target[2], fingerprint)
+        ]
+
+        temps: Dict[Path, Path] = {}
+        elisions: Dict[Path, List[Elision]] = {}
+        files: Dict[Path, List[Path]] = {}
+        agents = list(dict.fromkeys(agent for _, agent, _ in stale))
+        try:
+            with ThreadPoolExecutor(max_workers=len(PLATFORMS)) as executor:
+                for agent in agents:
+                    payload = self.payload(agent)
+                    futures = {}
+                    for platform, target_agent, path in stale:
+                        if target_agent != agent:
+                            continue
+                        fitted, elisions[path] = self.fit(platform, payload)
+                        jobs = self._outputs(platform, fitted, path)
+                        files[path] = [file for file, _ in jobs]
+                        for file, write in jobs:
+                            futures[file] = executor.submit(_render_to_temp, write, file, platform)
+                    error = None
+                    for file, future in futures.items():
+                        try:
+                            temps[file] = future.result()
+                        except Exception as e:
+                            error = error or e
+                    if error:
+                        raise error
+        except BaseException:
+            for tmp in temps.values():
+                tmp.unlink(missing_ok=True)
+            raise
+
+        results = []
+        for (platform, agent, path), fingerprint in zip(targets, fingerprints):
+            if path not in files:
+                shards = tuple(self.cache.output_files(path))
+                size = path.stat().st_size
+                report = self.cache.output_report(path)
+                elided = tuple(Elision(*elision) for elision in report.get("elided", []))
+                results.append(ExportResult(platform, agent, path, size, False, elided, shards))
+                continue
+
+            changed = False
+            for file in files[path]:
+                changed = _replace_if_changed(temps[file], file) or changed
+            shards = files[path][1:]
+            for old in set(self.cache.output_files(path)) - set(shards):
+                if old.exists():
+                    old.unlink()
+                    changed = True
+                with contextlib.suppress(OSError):
+                    old.parent.rmdir()
+            report = {"elided": [list(elision) for elision in elisions[path]]}
+            self.cache.record_output(path, fingerprint, shards, report)
+            size = path.stat().st_size
+            results.append(
+                ExportResult(
+                    platform, agent, path, size, changed, tuple(elisions[path]), tuple(shards)
+                )
+            )
+
+        self.cache.save()
+        return results
+
+    def _outputs(
+        self, platform: str, payload: Dict, path: Path
+    ) -> List[Tuple[Path, Callable[[TextIO], None]]]:
+        """Return (file, writer) pairs for one target: the output and any shards."""
+        if self.shard_by is None:
+            return [(path, self._writer(platform, payload))]
+
+        shard_dir = path.parent / path.stem
+        try:
+            shard_relpath = shard_dir.relative_to(self.repository.path).as_posix()
+        except ValueError:
+            shard_relpath = str(shard_dir)
+        root, shards = _shard_by_category(payload, shard_dir, shard_relpath)
+        outputs = [(path, self._writer(platform, root))]
+        outputs += [
+            (file, functools.partial(_write_shard, platform=platform, shard=shard))
+            for file, shard in shards
+        ]
+        return outputs
+
+    def _writer(self, platform: str, payload: Dict) -> Callable[[TextIO], None]:
+        """Return a function streaming the main output for platform to a sink."""
+        if not self.template:
+            return functools.partial(_write_platform, platform=platform, payload=payload)
+
+        try:
+            self.templates.get(self.template)
+        except TemplateError as e:
+            raise SkillzError(str(e)) from e
+
+        def write(out: TextIO) -> None:
+            try:
+                self.templates.write(out, self.template, platform, payload)
+            except TemplateError as e:
+                raise SkillzError(str(e)) from e
+
+        return write
+
+    def _load_cached(self, path: Path, parse):
+        """Read and parse a file, reusing the result until its mtime or size changes."""
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._files.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with profiler.span("config", path=path):
+            value = parse(path.read_text())
+        profiler.count("config", files=1, bytes=stat.st_size)
+        self._files[path] = (signature, value)
+        return value
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """Read a text file, or return None if it cannot be read."""
+    try:
+        return path.read_text()
+    except OSError:
+        return None
+
+
+def _render_payload(platform: str, payload: Dict) -> str:
+    """Render one platform from a prepared payload, timed as a render span."""
+    with profiler.span("render", platform=platform):
+        return _render_platform(platform, payload)
+
+
+def _render_to_temp(write: Callable[[TextIO], None], path: Path, platform: str) -> Path:
+    """
+    Stream one output file into a temporary file next to path.
+
+    The caller moves the file into place with os.replace, so readers never
+    see a partially written output.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with profiler.span("render", platform=platform, path=path), open(tmp, "w") as f:
+            write(f)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return tmp
+
+
+def _replace_if_changed(tmp: Path, path: Path) -> bool:
+    """Move tmp over path if their contents differ, else discard tmp. Returns True if moved."""
+    if path.exists() and filecmp.cmp(tmp, path, shallow=False):
+        tmp.unlink()
+        return False
+    size = tmp.stat().st_size
+    with profiler.span("write", path=path):
+        os.replace(tmp, path)
+    profiler.count("write", files=1, bytes=size)
+    return True
+
+
+def _copy_item(source: Path, dest: Path, item_type: str) -> None:
+    """Copy a skill directory or command file, replacing any existing copy."""
+    with profiler.span("copy", path=source):
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if item_type == "skill":
+            if dest.exists():
+                shutil.rmtree(dest)
+            shutil.copytree(source, dest, copy_function=tracked_copy2)
+        else:
+            # Replace instead of overwriting, so hardlinked snapshots keep the old file
+            if dest.exists():
+                dest.unlink()
+            tracked_copy2(source, dest)
@@ -0,0 +1,107 @@
+"""Detection of installed items the repository no longer provides.
+
+Installed items are matched against the repository catalog by name first;
+only the items left over are hashed, and only repository items of the same
+size are hashed to compare against them. A leftover item whose content
+matches a repository item was renamed in the repository, and is a
+duplicate if the new name is installed in the same location.
+
+Only items skillz installed itself (those with an install manifest) are
+managed. Leftover items found on disk that skillz never installed, such as
+skills written by hand, are reported as unmanaged and never removed unless
+asked for explicitly.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from cli.buildcache import BuildCache
+from cli.catalog import CatalogRecord
+
+# Reasons an installed item is garbage
+ORPHAN = "orphan"
+RENAMED = "renamed"
+DUPLICATE = "duplicate"
+
+
+class Garbage(NamedTuple):
+    """An installed item that can be removed."""
+
+    record: CatalogRecord
+    reason: str
+    replacement: Optional[str] = None
+    managed: bool = True
+
+
+def item_digest(path: Path, cache: BuildCache) -> str:
+    """
+    Digest of a command file, or of a skill directory's file names and contents.
+
+    File digests come from cache, so unchanged files are not read again.
+    """
+    if path.is_file():
+        return cache.digest(path)
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            file = Path(root) / name
+            relative = file.relative_to(path).as_posix()
+            digest.update(f"{relative}\0{cache.digest(file)}\0".encode())
+    return digest.hexdigest()
+
+
+def find_garbage(
+    available: Sequence[CatalogRecord],
+    installed: Sequence[CatalogRecord],
+    cache: Optional[BuildCache] = None,
+    jobs: int = 4,
+    is_managed: Optional[Callable[[CatalogRecord], bool]] = None,
+) -> List[Garbage]:
+    """
+    Find installed items that are not in the repository.
+
+    Args:
+        available: Skills and commands of the repository
+        installed: Installed items of every location to check
+        cache: Digest cache (default: an in-memory cache)
+        jobs: Worker threads used to hash items
+        is_managed: Tells items skillz installed from items it only found on
+            disk (default: every item is managed)
+
+    Returns:
+        One Garbage per installed item whose name the repository does not
+        have, in installed order
+    """
+    names = {(record.type, record.name) for record in available}
+    leftover = [record for record in installed if (record.type, record.name) not in names]
+    if not leftover:
+        return []
+
+    sizes = {(record.type, record.stats.bytes) for record in leftover}
+    candidates = [record for record in available if (record.type, record.stats.bytes) in sizes]
+    cache = cache if cache is not None else BuildCache()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        digests = list(
+            executor.map(lambda record: item_digest(record.path, cache), leftover + candidates)
+        )
+
+    renamed: Dict[Tuple[str, str], str] = {}
+    for record, digest in zip(candidates, digests[len(leftover) :]):
+        renamed.setdefault((record.type, digest), record.name)
+    present = {(record.location, record.type, record.name) for record in installed}
+
+    garbage = []
+    for record, digest in zip(leftover, digests):
+        managed = is_managed is None or is_managed(record)
+        replacement = renamed.get((record.type, digest))
+        if replacement is None:
+            garbage.append(Garbage(record, ORPHAN, managed=managed))
+        elif (record.location, record.type, replacement) in present:
+            garbage.append(Garbage(record, DUPLICATE, replacement, managed))
+        else:
+            garbage.append(Garbage(record, RENAMED, replacement, managed))
+    return garbage
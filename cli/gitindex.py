@@ -0,0 +1,237 @@
+"""Catalog discovery for repositories that are git checkouts.
+
+Finding the skills and commands of a repository normally means walking the
+whole ``skills`` and ``commands`` trees. In a git checkout, git already
+knows what changed: the index remembers the commit and the tree IDs of both
+directories it last saw, plus the files that differed from that commit. On
+the next scan it asks git for the paths that differ between the old and new
+trees (``git diff-tree``) and for the working-tree changes (``git
+status``), and re-checks only those paths on disk. ``git status`` still
+looks at every file, but from git's own index and in native code; skillz
+itself stats only the changed paths, so a ``git pull`` that touched three
+skills re-checks three files instead of walking both trees.
+
+The index uses git plumbing through the ``git`` executable. Whenever git is
+unavailable, the repository is not a checkout, or the saved state cannot be
+compared (a first scan, a missing object after ``git gc``, a submodule),
+the index falls back to walking the trees and starts over from there.
+Files ignored by git are seen by full walks only.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from cli.profiling import profiler
+from cli.utils import find_command_files, find_skill_directories
+
+SKILLS = "skills"
+COMMANDS = "commands"
+
+# Files each tree is indexed by, as git glob patterns relative to the tree
+PATTERNS = {SKILLS: "**/SKILL.md", COMMANDS: "**/*.md"}
+
+
+class GitIndex:
+    """
+    Skill and command files of a git checkout, kept up to date from git.
+
+    The saved state of every repository lives in one JSON file keyed by
+    repository path. Like the build cache it is an optimization only: a
+    missing, corrupt or unwritable file causes a full walk.
+    """
+
+    VERSION = 1
+
+    def __init__(self, repo_path: Path, path: Optional[Path] = None):
+        """
+        Initialize the index of the repository at repo_path.
+
+        Args:
+            repo_path: Repository root, with the skills and commands directories
+            path: JSON file holding the saved state (default: in-memory only)
+        """
+        self.repo_path = Path(repo_path)
+        self.path = path
+        self._key = os.path.abspath(repo_path)
+        self.changed: Optional[List[str]] = None
+        self._lock = threading.Lock()
+        self._repositories: Dict[str, Dict] = {}
+        self._dirty = False
+        self._load()
+
+    @property
+    def state(self) -> Optional[Dict]:
+        """Saved state of this repository: commit, trees, dirty paths and files."""
+        return self._repositories.get(self._key)
+
+    def scan(self) -> Optional[Tuple[List[Path], List[Path]]]:
+        """
+        Return the skill directories and command files of the repository.
+
+        Both lists are sorted like ``find_skill_directories`` and
+        ``find_command_files``. After the call, ``changed`` holds the
+        repository-relative paths that were re-checked, or None if the trees
+        were walked.
+
+        Returns:
+            (skill directories, command files), or None if the repository
+            is not a git checkout
+        """
+        with self._lock, profiler.span("index", path=self.repo_path):
+            try:
+                current = self._git_state()
+            except (OSError, subprocess.CalledProcessError, ValueError):
+                return None
+
+            state = self.state
+            files = None
+            if state is not None:
+                try:
+                    files = self._update(state, current)
+                except (OSError, subprocess.CalledProcessError, KeyError, TypeError, ValueError):
+                    files = None
+            if files is None:
+                self.changed = None
+                files = self._walk()
+
+            skills, commands = files
+            current[SKILLS] = sorted(skills)
+            current[COMMANDS] = sorted(commands)
+            if current != state:
+                self._repositories[self._key] = current
+                self._dirty = True
+
+        # Sorting by parts orders the paths like sorting Path objects, which is much slower
+        directories = sorted((path.rpartition("/")[0] for path in skills), key=_parts)
+        return (
+            [self.repo_path / path for path in directories],
+            [self.repo_path / path for path in sorted(commands, key=_parts)],
+        )
+
+    def save(self) -> None:
+        """Write the index to disk if it changed."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            data = {"version": self.VERSION, "repositories": self._repositories}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".git-index-")
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except OSError:
+                return
+            self._dirty = False
+
+    def _load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return
+        self._repositories = data.get("repositories", {})
+
+    def _git(self, *args: str) -> str:
+        """Run a git command in the repository and return its output."""
+        # Optional locks stay enabled so that git status can refresh the stat data of the
+        # git index, as when run by hand; otherwise a stale index is rehashed every time
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_path), *args],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return result.stdout
+
+    def _git_state(self) -> Dict:
+        """Commit, tree IDs and paths differing from the commit, as git sees them now."""
+        prefix, head = self._git("rev-parse", "--show-prefix", "HEAD").splitlines()
+        trees = {SKILLS: None, COMMANDS: None}
+        for entry in self._git("ls-tree", "-z", "-d", "HEAD", "--", SKILLS, COMMANDS).split("\0"):
+            if entry:
+                info, _, name = entry.partition("\t")
+                trees[name] = info.split()[2]
+
+        # Porcelain paths are relative to the top of the checkout, not to the repository
+        pathspecs = [f":(glob){name}/{pattern}" for name, pattern in PATTERNS.items()]
+        status = self._git(
+            "status", "--porcelain=v1", "-z", "--untracked-files=all", "--", *pathspecs
+        )
+        dirty = set()
+        entries = iter(status.split("\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            dirty.add(entry[3:][len(prefix) :])
+            if entry[0] in "RC":
+                # Renames and copies are followed by their source path
+                dirty.add(next(entries)[len(prefix) :])
+        return {"head": head, "trees": trees, "dirty": sorted(dirty)}
+
+    def _update(self, state: Dict, current: Dict) -> Optional[Tuple[Set[str], Set[str]]]:
+        """
+        Apply the changes between a saved state and the current one.
+
+        Returns:
+            The updated (SKILL.md files, command files), or None if the
+            changes cannot be applied incrementally
+        """
+        changed = set(state["dirty"]) | set(current["dirty"])
+        for name in (SKILLS, COMMANDS):
+            old, new = state["trees"].get(name), current["trees"][name]
+            if old == new:
+                continue
+            if old is None or new is None:
+                return None
+            pathspec = f":(glob){PATTERNS[name]}"
+            diff = self._git("diff-tree", "-r", "-z", "--name-only", old, new, "--", pathspec)
+            changed.update(f"{name}/{path}" for path in diff.split("\0") if path)
+
+        skills, commands = set(state[SKILLS]), set(state[COMMANDS])
+        for relpath in changed:
+            path = self.repo_path / relpath
+            if path.is_dir() and not path.is_symlink():
+                # A submodule or nested checkout: git does not list its files
+                return None
+            top, _, rest = relpath.partition("/")
+            name = rest.rpartition("/")[2]
+            if top == SKILLS and name == "SKILL.md":
+                files = skills
+            elif top == COMMANDS and name.endswith(".md") and name != "SKILL.md":
+                files = commands
+            else:
+                continue
+            if path.exists():
+                files.add(relpath)
+            else:
+                files.discard(relpath)
+
+        self.changed = sorted(changed)
+        profiler.count("index", files=len(changed))
+        return skills, commands
+
+    def _walk(self) -> Tuple[Set[str], Set[str]]:
+        """Find every SKILL.md and command file by walking the trees."""
+        skills = {
+            (path / "SKILL.md").relative_to(self.repo_path).as_posix()
+            for path in find_skill_directories(self.repo_path / SKILLS)
+        }
+        commands = {
+            path.relative_to(self.repo_path).as_posix()
+            for path in find_command_files(self.repo_path / COMMANDS)
+        }
+        return skills, commands
+
+
+def _parts(relpath: str) -> List[str]:
+    """Sort key of a relative path, comparing it part by part."""
+    return relpath.split("/")
@@ -0,0 +1,156 @@
+"""Integrity verification of installed skills and commands.
+
+Installed files are compared with a baseline: the manifest recorded when
+the item was installed, or the repository item it was installed from. A
+file whose size and modification time match the baseline is taken as
+unchanged without reading it; installs copy with ``shutil.copy2``, which
+preserves modification times. Every other file is hashed with BLAKE2b,
+using large reads on a thread pool.
+"""
+
+import hashlib
+import os
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from cli.catalog import CatalogRecord
+from cli.profiling import profiler
+
+BUFFER_SIZE = 1 << 20
+
+# Baselines an installed item is verified against
+MANIFEST = "manifest"
+REPOSITORY = "repository"
+NONE = "none"
+
+
+class FileEntry(NamedTuple):
+    """Size, modification time and digest of one file of an item."""
+
+    size: int
+    mtime_ns: int
+    digest: Optional[str] = None
+
+
+class Drift(NamedTuple):
+    """Result of verifying one installed item."""
+
+    record: CatalogRecord
+    baseline: str
+    modified: Tuple[str, ...] = ()
+    missing: Tuple[str, ...] = ()
+    added: Tuple[str, ...] = ()
+    files: int = 0
+    hashed: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """True if the item matches its baseline."""
+        return self.baseline != NONE and not (self.modified or self.missing or self.added)
+
+
+def file_digest(path: Path) -> str:
+    """BLAKE2b digest of a file, read in large unbuffered chunks."""
+    digest = hashlib.blake2b()
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    size = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+            size += n
+    profiler.count("hash", files=1, bytes=size)
+    return digest.hexdigest()
+
+
+def list_files(path: Path) -> Dict[str, os.stat_result]:
+    """Stat the files of a skill directory, or a command file, by relative path."""
+    if path.is_file():
+        return {path.name: path.stat()}
+    files = {}
+    for root, _, names in os.walk(path):
+        for name in names:
+            file = Path(root) / name
+            files[file.relative_to(path).as_posix()] = file.stat()
+    return files
+
+
+def file_manifest(path: Path) -> Dict[str, FileEntry]:
+    """Manifest of an installed item: size, modification time and digest of each file."""
+    with profiler.span("hash", path=path):
+        base = path.parent if path.is_file() else path
+        return {
+            relative: FileEntry(stat.st_size, stat.st_mtime_ns, file_digest(base / relative))
+            for relative, stat in list_files(path).items()
+        }
+
+
+def verify(
+    records: Sequence[CatalogRecord],
+    baseline: Callable[[CatalogRecord], Tuple[str, Dict[str, FileEntry], Optional[Path]]],
+    executor: Executor,
+) -> List[Drift]:
+    """
+    Compare installed items with their baselines.
+
+    Args:
+        records: Installed items to verify
+        baseline: Returns (kind, entries, source) for a record, where
+            entries is the expected manifest and source the directory (or
+            command file) to hash for entries without a digest
+        executor: Pool the files are hashed on
+
+    Returns:
+        One Drift per record, in input order
+    """
+    plans = []
+    tasks = []
+    for record in records:
+        kind, expected, source = baseline(record)
+        if kind == NONE or not record.path.exists():
+            plans.append((record, kind, expected, {}, []))
+            continue
+        actual = list_files(record.path)
+        base = record.path.parent if record.path.is_file() else record.path
+        source_base = source.parent if source is not None and source.is_file() else source
+        changed = []
+        for relative, stat in actual.items():
+            entry = expected.get(relative)
+            if entry is None or (stat.st_size, stat.st_mtime_ns) == entry[:2]:
+                continue
+            changed.append(relative)
+            tasks.append((base / relative, entry.digest, source_base, relative))
+        plans.append((record, kind, expected, actual, changed))
+
+    def compare(task) -> bool:
+        path, digest, source_base, relative = task
+        if digest is None:
+            digest = file_digest(source_base / relative)
+        return file_digest(path) == digest
+
+    with profiler.span("verify", files=len(tasks)):
+        matches = iter(list(executor.map(compare, tasks)))
+
+    drifts = []
+    for record, kind, expected, actual, changed in plans:
+        if kind == NONE:
+            drifts.append(Drift(record, kind))
+            continue
+        same = [next(matches) for _ in changed]
+        modified = tuple(sorted(relative for relative, ok in zip(changed, same) if not ok))
+        drifts.append(
+            Drift(
+                record,
+                kind,
+                modified=modified,
+                missing=tuple(sorted(set(expected) - set(actual))),
+                added=tuple(sorted(set(actual) - set(expected))),
+                files=len(actual),
+                hashed=len(changed),
+            )
+        )
+    return drifts
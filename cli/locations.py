@@ -0,0 +1,124 @@
+"""Install locations of every configured target and platform.
+
+Each target (personal, project) and platform has a skills and a commands
+directory; several may be the same directory (project installs are shared
+by every platform). The helpers here probe all of them at once with a
+thread pool, so a home directory on a network mount costs one round of
+latency instead of one per location.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+
+from cli.catalog import Catalog
+from cli.config import Config
+from cli.profiling import profiler
+
+TARGETS = ("personal", "project")
+
+T = TypeVar("T")
+
+
+class InstalledItem(NamedTuple):
+    """An item found in an install location."""
+
+    location: str
+    type: str
+    name: str
+    path: Path
+
+
+def installed_catalog(
+    config: Config, target: str, platform: str, location: Optional[str] = None
+) -> Catalog:
+    """Catalog of the items installed for a target and platform."""
+    skills_dir = config.get_skills_dir(target, platform)
+    return Catalog(
+        skills_dir.parent,
+        skills_dir=skills_dir,
+        commands_dir=config.get_commands_dir(target, platform),
+        location=location or f"{target}/{platform}",
+    )
+
+
+def install_locations(
+    config: Config,
+    targets: Optional[Sequence[str]] = None,
+    platforms: Optional[Sequence[str]] = None,
+) -> List[Catalog]:
+    """
+    Catalogs of the distinct install locations of targets and platforms.
+
+    Locations that share their directories are listed once. A location
+    shared by several platforms is labeled with the target alone (e.g.
+    'project'), otherwise with 'target/platform'.
+
+    Args:
+        targets: Targets to include (default: personal and project)
+        platforms: Platforms to include (default: every configured platform)
+    """
+    groups: Dict[Tuple[Path, Path], List[Tuple[str, str]]] = {}
+    for target in targets or TARGETS:
+        for platform in platforms or list(config.config["platforms"]):
+            key = (
+                config.get_skills_dir(target, platform),
+                config.get_commands_dir(target, platform),
+            )
+            groups.setdefault(key, []).append((target, platform))
+
+    catalogs = []
+    for members in groups.values():
+        target, platform = members[0]
+        shared = len(members) > 1 and all(member[0] == target for member in members)
+        catalogs.append(installed_catalog(config, target, platform, target if shared else None))
+    return catalogs
+
+
+def probe(catalogs: Sequence[Catalog], task: Callable[[Catalog], T]) -> List[T]:
+    """Run task on every catalog concurrently and return the results in catalog order."""
+    if len(catalogs) <= 1:
+        return [task(catalog) for catalog in catalogs]
+    with ThreadPoolExecutor(max_workers=len(catalogs)) as executor:
+        return list(executor.map(task, catalogs))
+
+
+def scan_locations(catalogs: Sequence[Catalog]) -> List[Catalog]:
+    """Discover and parse the items of every catalog concurrently."""
+
+    def scan(catalog: Catalog) -> Catalog:
+        with profiler.span("discovery", path=catalog.skills_dir):
+            catalog.skill_records()
+            catalog.command_records()
+        return catalog
+
+    return probe(catalogs, scan)
+
+
+def find_installed(
+    catalogs: Sequence[Catalog], name: str, item_type: Optional[str] = None
+) -> List[InstalledItem]:
+    """
+    Find an item by name in every install location concurrently.
+
+    Only the item's own path is checked in each location, without
+    scanning the install directories.
+
+    Returns:
+        One InstalledItem per location holding the item, in catalog order
+        with a location's skill before its command
+    """
+
+    def find(catalog: Catalog) -> List[InstalledItem]:
+        found = []
+        if item_type in (None, "skill"):
+            skill_path = catalog.skills_dir / name
+            if (skill_path / "SKILL.md").is_file():
+                found.append(InstalledItem(catalog.location, "skill", name, skill_path))
+        if item_type in (None, "command"):
+            cmd_path = catalog.commands_dir / (name if name.endswith(".md") else f"{name}.md")
+            if cmd_path.is_file():
+                found.append(InstalledItem(catalog.location, "command", cmd_path.stem, cmd_path))
+        return found
+
+    return [item for items in probe(catalogs, find) for item in items]
@@ -2,9 +2,27 @@
 
 import click
 from rich.console import Console
+from rich.table import Table
 
-from cli.commands import config, create, export, info, install, search, uninstall, update
+from cli.commands import (
+    batch,
+    config,
+    create,
+    export,
+    gc,
+    info,
+    install,
+    rollback,
+    search,
+    show,
+    stats,
+    uninstall,
+    update,
+    validate,
+    verify,
+)
 from cli.commands.list import list_skills
+from cli.profiling import profiler
 
 console = Console()
 
@@ -12,8 +30,16 @@ console = Console()
 @click.group()
 @click.version_option(version="0.1.0", prog_name="skillz")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
+@click.option("--timings", is_flag=True, help="Print a timing summary when the command finishes")
+@click.option(
+    "--trace",
+    "trace_file",
+    type=click.Path(dir_okay=False),
+    envvar="SKILLZ_TRACE",
+    help="Write a Chrome trace JSON file (or set SKILLZ_TRACE)",
+)
 @click.pass_context
-def cli(ctx, verbose):
+def cli(ctx, verbose, timings, trace_file):
     """
     Skillz - Manage AI assistant skills and slash commands.
 
@@ -23,6 +49,40 @@ def cli(ctx, verbose):
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
 
+    if timings or trace_file:
+        profiler.enable()
+        ctx.call_on_close(lambda: _report_profile(timings, trace_file))
+
+
+def _report_profile(show_summary: bool, trace_file: str):
+    """Print the timing summary and/or write the Chrome trace."""
+    if trace_file:
+        profiler.write_chrome_trace(trace_file)
+
+    if not show_summary:
+        return
+
+    err_console = Console(stderr=True)
+    table = Table(title=f"Timings ({profiler.elapsed_ms():.1f} ms total)")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time (ms)", justify="right", style="green")
+    table.add_column("Files", justify="right")
+    table.add_column("Bytes", justify="right")
+
+    for phase in profiler.summary():
+        table.add_row(
+            phase["name"],
+            str(phase["calls"]),
+            f"{phase['total_ms']:.2f}",
+            str(phase["files"]),
+            str(phase["bytes"]),
+        )
+
+    err_console.print(table)
+    if trace_file:
+        err_console.print(f"[dim]Chrome trace written to {trace_file}[/dim]")
+
 
 # Register commands
 cli.add_command(config.config)
@@ -34,6 +94,13 @@ cli.add_command(info.info)
 cli.add_command(update.update)
 cli.add_command(create.create)
 cli.add_command(export.export)
+cli.add_command(batch.batch)
+cli.add_command(validate.validate)
+cli.add_command(show.show)
+cli.add_command(stats.stats)
+cli.add_command(gc.gc)
+cli.add_command(verify.verify)
+cli.add_command(rollback.rollback)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,166 @@
+"""Timing instrumentation for skillz commands.
+
+Instrumented code wraps each phase in ``profiler.span(...)`` and reports
+work done with ``profiler.count(...)``. Both are no-ops until the profiler
+is enabled with the global ``--timings`` flag, ``--trace FILE`` or the
+``SKILLZ_TRACE`` environment variable.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+
+
+class Profiler:
+    """Collects timing spans and file/byte counters for one process."""
+
+    def __init__(self):
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self._origin = time.perf_counter_ns()
+        self._spans: List[tuple] = []
+        self._counters: Dict[str, List[int]] = {}
+        self._threads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording spans and counters."""
+        self.enabled = True
+        self._origin = time.perf_counter_ns()
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._threads.clear()
+        self._origin = time.perf_counter_ns()
+
+    @contextmanager
+    def span(self, name: str, **args) -> Iterator[None]:
+        """
+        Time the enclosed block as a span of the named phase.
+
+        Args:
+            name: Phase name, e.g. "discovery" or "copy"
+            **args: Extra details recorded in the Chrome trace
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            thread_id = threading.get_ident()
+            with self._lock:
+                tid = self._threads.setdefault(thread_id, len(self._threads) + 1)
+                self._spans.append((name, start, end, tid, args))
+
+    def timed(self, name: str) -> Callable:
+        """Decorator form of span() that times every call of a function."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def count(self, name: str, files: int = 0, bytes: int = 0) -> None:
+        """Add files and bytes touched to the named phase."""
+        if not self.enabled:
+            return
+        with self._lock:
+            counter = self._counters.setdefault(name, [0, 0])
+            counter[0] += files
+            counter[1] += bytes
+
+    def summary(self) -> List[Dict]:
+        """
+        Aggregate recorded spans per phase.
+
+        Returns:
+            List of dicts with name, calls, total_ms, files and bytes,
+            ordered by first appearance
+        """
+        phases: Dict[str, Dict] = {}
+        with self._lock:
+            spans = list(self._spans)
+            counters = dict(self._counters)
+
+        for name, start, end, _, _ in sorted(spans, key=lambda s: s[1]):
+            phase = phases.setdefault(
+                name, {"name": name, "calls": 0, "total_ms": 0.0, "files": 0, "bytes": 0}
+            )
+            phase["calls"] += 1
+            phase["total_ms"] += (end - start) / 1e6
+
+        for name, (files, nbytes) in counters.items():
+            phase = phases.setdefault(
+                name, {"name": name, "calls": 0, "total_ms": 0.0, "files": 0, "bytes": 0}
+            )
+            phase["files"] = files
+            phase["bytes"] = nbytes
+
+        return list(phases.values())
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the profiler was enabled."""
+        return (time.perf_counter_ns() - self._origin) / 1e6
+
+    def chrome_trace(self) -> Dict:
+        """Build a Chrome trace (chrome://tracing, Perfetto) from recorded spans."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self._spans)
+            counters = dict(self._counters)
+
+        events = []
+        for name, start, end, tid, args in spans:
+            events.append(
+                {
+                    "name": name,
+                    "cat": "skillz",
+                    "ph": "X",
+                    "ts": (start - self._origin) / 1e3,
+                    "dur": (end - start) / 1e3,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {k: str(v) for k, v in args.items()},
+                }
+            )
+        for name, (files, nbytes) in counters.items():
+            events.append(
+                {
+                    "name": name,
+                    "cat": "skillz",
+                    "ph": "C",
+                    "ts": self.elapsed_ms() * 1e3,
+                    "pid": pid,
+                    "args": {"files": files, "bytes": nbytes},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the Chrome trace JSON to path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+profiler = Profiler()
@@ -0,0 +1,513 @@
+"""Rendering of agent instruction files for export.
+
+These helpers are shared by ``skillz export`` and the embeddable API in
+:mod:`cli.core`, so they do no terminal I/O and do not depend on click.
+"""
+
+import io
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, TextIO, Tuple, Type, Union
+
+import yaml
+
+from cli.catalog import CHARS_PER_TOKEN, Catalog, CatalogRecord, CommandRecord, SkillRecord
+from cli.profiling import profiler
+
+GEMINI_YAML_WIDTH = 120
+PLATFORMS = ("codex", "gemini", "copilot")
+
+# How many times each skill/command appears in a platform's output: Codex and
+# Gemini list items again after the instruction block.
+ITEM_COPIES = {"codex": 2, "gemini": 2, "copilot": 1}
+# Default priority weights; override under `export-weights` in agents.yaml.
+DEFAULT_EXPORT_WEIGHTS = {"base": 1, "capability": 10, "categories": {}, "items": {}}
+# Descriptions are dropped rather than truncated below this many characters.
+MIN_DESCRIPTION_CHARS = 40
+# Times the item selection is refined when the rendered output is over budget.
+BUDGET_ATTEMPTS = 4
+
+
+class Elision(NamedTuple):
+    """A skill or command shortened or left out to fit a token budget."""
+
+    type: str
+    name: str
+    action: str  # truncated or dropped
+    tokens: int  # estimated tokens saved
+
+
+def _find_agent(agents_config: Dict, agent_id: str) -> Optional[Dict]:
+    """Find agent configuration by ID."""
+    for agent in agents_config.get("agents", []):
+        if agent.get("id") == agent_id:
+            return agent
+    return None
+
+
+def _get_default_output_path(platform: str, repo_path: Path, agent: Optional[str] = None) -> Path:
+    """
+    Get default output path for platform.
+
+    When agent is given and is not 'default', its ID is inserted before the
+    extension (AGENTS.review.md) so several agents can be exported side by side.
+    """
+    if platform == "codex":
+        path = repo_path / "AGENTS.md"
+    elif platform == "gemini":
+        path = repo_path / "GEMINI.md"
+    elif platform == "copilot":
+        path = repo_path / ".github" / "copilot-instructions.md"
+    else:
+        raise ValueError(f"Unknown platform: {platform}")
+    if agent and agent != "default":
+        path = path.with_name(f"{path.stem}.{agent}{path.suffix}")
+    return path
+
+
+def _discover_skills(repo_path: Path) -> List[SkillRecord]:
+    """Discover all skills in repository, sorted by name."""
+    return Catalog(repo_path).skill_records()
+
+
+def _discover_commands(repo_path: Path) -> List[CommandRecord]:
+    """Discover all commands in repository, sorted by name."""
+    return Catalog(repo_path).command_records()
+
+
+@profiler.timed("frontmatter")
+def _parse_frontmatter(content: str) -> Optional[Dict]:
+    """Parse YAML frontmatter from markdown content."""
+    pattern = r"^---\s*\n(.*?)\n---\s*\n"
+    match = re.match(pattern, content, re.DOTALL)
+
+    if not match:
+        return None
+
+    frontmatter_str = match.group(1)
+    try:
+        return yaml.safe_load(frontmatter_str)
+    except yaml.YAMLError:
+        return None
+
+
+def _render_template(
+    platform: str,
+    agent_config: Dict,
+    agents_config: Dict,
+    global_policies: str,
+    role_policies: str,
+    skills: Iterable[Union[CatalogRecord, Dict]],
+    commands: Iterable[Union[CatalogRecord, Dict]],
+    repo_path: Path,
+) -> str:
+    """Render platform-specific template using a shared instruction block."""
+    payload = _build_payload(
+        agent_config, agents_config, global_policies, role_policies, skills, commands
+    )
+    return _render_platform(platform, payload)
+
+
+def _build_payload(
+    agent_config: Dict,
+    agents_config: Dict,
+    global_policies: str,
+    role_policies: str,
+    skills: Iterable[Union[CatalogRecord, Dict]],
+    commands: Iterable[Union[CatalogRecord, Dict]],
+) -> Dict:
+    """Build the platform-neutral payload for one agent."""
+    agent_name = agent_config.get("name", "Skillz Agent")
+    agent_id = agent_config.get("id", "default")
+    agent_policies = agent_config.get("policies", "")
+    role_id = agent_config.get("role", "")
+
+    role_config = agents_config.get("roles", {}).get(role_id, {})
+    capability_ids = role_config.get("default-capabilities", [])
+    capabilities = agents_config.get("capabilities", {})
+    capabilities_payload = []
+    for cap_id in capability_ids:
+        cap = capabilities.get(cap_id, {})
+        capabilities_payload.append({"id": cap_id, "description": cap.get("description", "")})
+
+    return {
+        "agent": {"id": agent_id, "name": agent_name, "role": role_id},
+        "capabilities": capabilities_payload,
+        "policies": {"global": global_policies, "role": role_policies, "agent": agent_policies},
+        "weights": agents_config.get("export-weights") or {},
+        "skills": _normalize_items(skills, SkillRecord),
+        "commands": _normalize_items(commands, CommandRecord),
+    }
+
+
+def _render_platform(platform: str, payload: Dict) -> str:
+    """Serialize a payload from _build_payload into one platform's format."""
+    out = io.StringIO()
+    _write_platform(out, platform, payload)
+    return out.getvalue()
+
+
+def _write_platform(out: TextIO, platform: str, payload: Dict) -> None:
+    """Stream one platform's serialization of a payload to out."""
+    if platform == "codex":
+        _write_codex(out, payload)
+    elif platform == "gemini":
+        _write_gemini(out, payload)
+    elif platform == "copilot":
+        _write_copilot(out, payload)
+    else:
+        raise ValueError(f"Unknown platform: {platform}")
+
+
+def _get_header(platform: str) -> str:
+    """Get platform-specific header."""
+    base_header = """<!--
+THIS FILE IS AUTO-GENERATED FROM .ai/agents/agents.yaml
+DO NOT EDIT THIS FILE DIRECTLY
+Changes should be made to the canonical agent specification in .ai/agents/agents.yaml
+and then exported using: skillz export --platform {platform}
+-->
+
+"""
+    return base_header.format(platform=platform)
+
+
+def _write_instruction_block(out: TextIO, payload: Dict) -> None:
+    """Stream the platform-neutral instruction block shared by all exporters."""
+    agent = payload["agent"]
+    role_id = agent["role"]
+    policies = payload["policies"]
+
+    out.write(f"# {agent['name']}\n\n")
+    out.write(f"**Agent ID**: {agent['id']}\n")
+    out.write(f"**Role**: {role_id}\n\n")
+
+    capabilities = payload["capabilities"]
+    if capabilities:
+        out.write("## Capabilities\n\n")
+        out.write("The following capabilities are available to this agent:\n\n")
+        for cap in capabilities:
+            out.write(f"- **{cap['id']}**: {cap.get('description', '')}\n")
+        out.write("\n")
+
+    out.write("# Policies\n\n")
+    if policies["global"]:
+        out.write("## Global Policies\n\n")
+        out.write(policies["global"] + "\n\n")
+    if policies["role"]:
+        out.write(f"## Role Policies ({role_id})\n\n")
+        out.write(policies["role"] + "\n\n")
+    if policies["agent"]:
+        out.write("## Agent-Specific Policies\n\n")
+        out.write(policies["agent"] + "\n\n")
+
+    if "shards" in payload:
+        _write_shard_index(out, payload["shards"])
+        return
+
+    for title, items, empty in (
+        ("Skills", payload["skills"], "No skills available."),
+        ("Commands", payload["commands"], "No commands available."),
+    ):
+        out.write(f"# Available {title}\n\n")
+        for item in items:
+            out.write(_item_section(item))
+        if not items:
+            out.write(f"{empty}\n\n")
+
+
+def _write_shard_index(out: TextIO, shards: List[Dict]) -> None:
+    """Stream the one-line-per-category index that replaces item sections in sharded exports."""
+    out.write("# Skill and Command Index\n\n")
+    if not shards:
+        out.write("No skills or commands available.\n\n")
+        return
+    out.write("Skills and commands are listed per category in separate files. ")
+    out.write("Read the file for a category when you need its details.\n\n")
+    for shard in shards:
+        out.write(
+            f"- **{shard['category']}**: {shard['skills']} skills, "
+            f"{shard['commands']} commands: `{shard['path']}`\n"
+        )
+    out.write("\n")
+
+
+def _shard_by_category(
+    payload: Dict, shard_dir: Path, shard_relpath: str
+) -> Tuple[Dict, List[Tuple[Path, Dict]]]:
+    """
+    Split a payload into a root payload with a category index and per-category shards.
+
+    Categories are the first directory below skills/ or commands/; items
+    outside any category go to the 'general' shard.
+
+    Args:
+        payload: Payload from _build_payload
+        shard_dir: Directory the shard files are written to
+        shard_relpath: shard_dir as shown in the index
+
+    Returns:
+        Tuple of (root payload, list of (shard path, shard payload))
+    """
+    groups: Dict[str, Dict[str, List[CatalogRecord]]] = {}
+    for key in ("skills", "commands"):
+        for item in payload[key]:
+            group = groups.setdefault(item.category or "general", {"skills": [], "commands": []})
+            group[key].append(item)
+
+    index = []
+    shards = []
+    for category in sorted(groups):
+        group = groups[category]
+        filename = f"{category}.md"
+        index.append(
+            {
+                "category": category,
+                "skills": len(group["skills"]),
+                "commands": len(group["commands"]),
+                "path": f"{shard_relpath}/{filename}",
+            }
+        )
+        shards.append(
+            (shard_dir / filename, {"agent": payload["agent"], "category": category, **group})
+        )
+
+    root = {**payload, "skills": [], "commands": [], "shards": index}
+    return root, shards
+
+
+def _write_shard(out: TextIO, platform: str, shard: Dict) -> None:
+    """Stream one category shard of a sharded export as markdown."""
+    out.write(_get_header(platform))
+    out.write(f"# {shard['category']}\n\n")
+    out.write(f"Skills and commands in the '{shard['category']}' category ")
+    out.write(f"for agent {shard['agent']['name']}.\n\n")
+    for title, items in (("Skills", shard["skills"]), ("Commands", shard["commands"])):
+        if items:
+            out.write(f"# {title}\n\n")
+        for item in items:
+            out.write(_item_section(item))
+
+
+def _item_section(item: CatalogRecord) -> str:
+    """Return the instruction block section describing one skill or command."""
+    section = f"## {item.name}\n\n"
+    if item.description:
+        section += f"{item.description}\n\n"
+    return section + f"Location: `{item.relpath}`\n\n"
+
+
+def _estimate_tokens(text: str) -> int:
+    """Estimate the token count of text."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _item_weight(item: CatalogRecord, payload: Dict) -> float:
+    """Priority of an item under the payload's export weights (higher is kept first)."""
+    weights = {**DEFAULT_EXPORT_WEIGHTS, **payload.get("weights", {})}
+    weight = weights["base"]
+    capability_ids = {cap["id"] for cap in payload["capabilities"]}
+    if item.name in capability_ids or item.category in capability_ids:
+        weight += weights["capability"]
+    weight += (weights["categories"] or {}).get(item.category, 0)
+    weight += (weights["items"] or {}).get(item.name, 0)
+    return weight
+
+
+def _select_items(payload: Dict, platform: str, budget: int) -> Tuple[Dict, List[Elision]]:
+    """
+    Shorten or drop skills and commands so the estimated output fits budget tokens.
+
+    Identity, capabilities and policies are always kept. Items are then
+    admitted in order of weight (ties by name): in full if they fit, with a
+    truncated description if at least MIN_DESCRIPTION_CHARS of it fit, or
+    with no description at all; items that do not fit even then are dropped.
+    Admitted items keep their original order in the output.
+
+    Returns:
+        Tuple of (payload to render, elided items in priority order)
+    """
+    copies = ITEM_COPIES.get(platform, 1)
+    fixed = _estimate_tokens(_render_platform(platform, {**payload, "skills": [], "commands": []}))
+    if fixed > budget:
+        raise ValueError(
+            f"Token budget {budget} is smaller than the fixed sections (~{fixed} tokens)"
+        )
+
+    def cost(item: CatalogRecord) -> int:
+        return _estimate_tokens(_item_section(item)) * copies
+
+    items = payload["skills"] + payload["commands"]
+    ranked = sorted(
+        range(len(items)), key=lambda i: (-_item_weight(items[i], payload), items[i].name)
+    )
+    remaining = budget - fixed
+    kept: Dict[int, CatalogRecord] = {}
+    elided: List[Elision] = []
+    for index in ranked:
+        item = items[index]
+        full = cost(item)
+        if full <= remaining:
+            kept[index] = item
+            remaining -= full
+            continue
+
+        bare = item._replace(description="")
+        room = (remaining - cost(bare)) // copies * CHARS_PER_TOKEN - len("...\n\n")
+        if room >= MIN_DESCRIPTION_CHARS:
+            short = item._replace(description=item.description[:room].rstrip() + "...")
+        elif cost(bare) <= remaining:
+            short = bare
+        else:
+            elided.append(Elision(item.type, item.name, "dropped", full))
+            continue
+        kept[index] = short
+        remaining -= cost(short)
+        elided.append(Elision(item.type, item.name, "truncated", full - cost(short)))
+
+    split = len(payload["skills"])
+    fitted = {
+        **payload,
+        "skills": [kept[i] for i in range(split) if i in kept],
+        "commands": [kept[i] for i in range(split, len(items)) if i in kept],
+    }
+    return fitted, elided
+
+
+def _fit_token_budget(payload: Dict, platform: str, budget: int) -> Tuple[Dict, List[Elision]]:
+    """
+    Fit a payload into budget tokens for one platform.
+
+    Item costs in _select_items are estimates, so the result is rendered and
+    measured, and the selection is repeated with a tighter budget while the
+    output is still too large.
+
+    Returns:
+        Tuple of (payload to render, elided items in priority order)
+    """
+    fitted, elided = _select_items(payload, platform, budget)
+    target = budget
+    for _ in range(BUDGET_ATTEMPTS):
+        excess = _estimate_tokens(_render_platform(platform, fitted)) - budget
+        if excess <= 0:
+            break
+        target -= excess
+        try:
+            fitted, elided = _select_items(payload, platform, target)
+        except ValueError:
+            break
+    return fitted, elided
+
+
+def _write_codex(out: TextIO, payload: Dict) -> None:
+    """Stream Codex CLI configuration (TOML-style) using the shared instruction block."""
+    agent = payload["agent"]
+
+    out.write(_get_header("codex"))
+    out.write("\n# Codex CLI Agent Profile\n\n")
+    out.write("[[agents]]\n")
+    out.write(f'id = "{_escape_toml(agent["id"])}"\n')
+    out.write(f'name = "{_escape_toml(agent["name"])}"\n')
+    if agent.get("role"):
+        out.write(f'role = "{_escape_toml(agent["role"])}"\n')
+    out.write('instructions = """\n')
+    block = _RStripWriter(out)
+    _write_instruction_block(block, payload)
+    out.write('\n"""')
+
+    for table, items in (("skills", payload["skills"]), ("commands", payload["commands"])):
+        if items:
+            out.write(f"\n\n# {table.capitalize()} available to this agent")
+        for item in items:
+            out.write(f"\n[[agents.{table}]]\n")
+            out.write(f'name = "{_escape_toml(item.name)}"\n')
+            out.write(f'description = "{_escape_toml(item.description)}"\n')
+            out.write(f'path = "{_escape_toml(item.relpath)}"')
+
+
+def _write_gemini(out: TextIO, payload: Dict) -> None:
+    """
+    Stream Gemini CLI configuration in YAML with embedded instructions.
+
+    YAML needs the instruction block as a single scalar, so it is built in
+    memory once; the document itself is dumped straight to out.
+    """
+    agent = payload["agent"]
+    block = io.StringIO()
+    _write_instruction_block(block, payload)
+    gemini_payload = {
+        "agents": [
+            {
+                "id": agent["id"],
+                "name": agent["name"],
+                "role": agent.get("role", ""),
+                "instructions": block.getvalue(),
+                "skills": [item.to_dict() for item in payload["skills"]],
+                "commands": [item.to_dict() for item in payload["commands"]],
+            }
+        ]
+    }
+    if "shards" in payload:
+        gemini_payload["agents"][0]["shards"] = payload["shards"]
+    out.write(_get_header("gemini"))
+    yaml.safe_dump(
+        gemini_payload,
+        out,
+        sort_keys=False,
+        default_flow_style=False,
+        width=GEMINI_YAML_WIDTH,
+    )
+
+
+def _write_copilot(out: TextIO, payload: Dict) -> None:
+    """Stream GitHub Copilot instructions markdown using the shared block."""
+    agent = payload["agent"]
+    out.write(_get_header("copilot"))
+    out.write(f"# Copilot Agent: {agent['name']}\n\n")
+    out.write(f"**Agent ID**: {agent['id']}\n\n")
+    if agent.get("role"):
+        out.write(f"**Role**: {agent['role']}\n\n")
+    _write_instruction_block(out, payload)
+
+
+class _RStripWriter:
+    """Text sink that drops trailing whitespace, like str.rstrip() on the whole stream."""
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self._pending = ""
+
+    def write(self, text: str) -> int:
+        stripped = text.rstrip()
+        if stripped:
+            self.out.write(self._pending + stripped)
+            self._pending = text[len(stripped) :]
+        else:
+            self._pending += text
+        return len(text)
+
+
+def _normalize_items(
+    items: Iterable[Union[CatalogRecord, Dict]], record_type: Type[CatalogRecord]
+) -> List[CatalogRecord]:
+    """Return skill/command entries as catalog records, converting plain dictionaries."""
+    normalized = []
+    for item in items:
+        if not isinstance(item, CatalogRecord):
+            path = str(item.get("path", ""))
+            item = record_type(item.get("name", ""), item.get("description", ""), Path(path), path)
+        normalized.append(item)
+    return normalized
+
+
+def _escape_toml(value: str) -> str:
+    """Minimally escape TOML string content without pulling in extra dependencies."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\t", "\\t")
+        .replace("\r", "\\r")
+        .replace("\b", "\\b")
+        .replace("\f", "\\f")
+    )
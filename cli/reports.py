@@ -0,0 +1,90 @@
+"""Machine-readable validation reports.
+
+Reports are streamed: each issue is written as soon as the file it belongs
+to has been checked, so CI logs and pre-commit hooks see results while a
+large repository is still being validated.
+"""
+
+import json
+from typing import Dict, TextIO
+
+from cli import __version__
+from cli.validator import RULES, Issue
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class JsonLinesReport:
+    """Writes one JSON object per issue."""
+
+    def __init__(self, out: TextIO):
+        """Initialize a report that writes to out."""
+        self.out = out
+
+    def start(self) -> None:
+        """Begin the report."""
+
+    def emit(self, issue: Issue) -> None:
+        """Write one issue."""
+        self.out.write(json.dumps(issue.to_dict()) + "\n")
+        self.out.flush()
+
+    def finish(self) -> None:
+        """End the report."""
+
+
+class SarifReport:
+    """
+    Writes a SARIF 2.1.0 log with a single run.
+
+    The log is one JSON document, so the run header is written by start(),
+    each result by emit() and the closing brackets by finish().
+    """
+
+    def __init__(self, out: TextIO):
+        """Initialize a report that writes to out."""
+        self.out = out
+        self._results = 0
+
+    def start(self) -> None:
+        """Write the SARIF header and open the results array."""
+        driver = {
+            "name": "skillz",
+            "version": __version__,
+            "rules": [
+                {"id": rule, "shortDescription": {"text": text}} for rule, text in RULES.items()
+            ],
+        }
+        header = json.dumps({"$schema": SARIF_SCHEMA, "version": "2.1.0"})
+        self.out.write(header[:-1] + ', "runs": [{"tool": ')
+        self.out.write(json.dumps({"driver": driver}))
+        self.out.write(', "results": [')
+
+    def emit(self, issue: Issue) -> None:
+        """Write one result."""
+        if self._results:
+            self.out.write(",")
+        self.out.write("\n" + json.dumps(_sarif_result(issue)))
+        self.out.flush()
+        self._results += 1
+
+    def finish(self) -> None:
+        """Close the results array, the run and the log."""
+        self.out.write("\n]}]}\n")
+        self.out.flush()
+
+
+REPORT_FORMATS = {"jsonl": JsonLinesReport, "sarif": SarifReport}
+
+
+def _sarif_result(issue: Issue) -> Dict:
+    """Convert an issue to a SARIF result object."""
+    location: Dict = {"artifactLocation": {"uri": issue.file.replace("\\", "/")}}
+    if issue.line:
+        location["region"] = {"startLine": issue.line}
+    return {
+        "ruleId": issue.rule,
+        "level": issue.severity,
+        "message": {"text": issue.message},
+        "locations": [{"physicalLocation": location}],
+    }
@@ -0,0 +1,140 @@
+"""Resolution of the project and repository roots above a directory.
+
+Finding the project a command runs in means walking up from the working
+directory and probing each parent for marker files. The walk stops at the
+nearest version-control root and never crosses onto another filesystem, so
+a deep checkout on a network mount probes only the directories of the
+checkout. Walks are memoized per directory inode: every directory visited
+remembers its chain of parents, so resolving from a sibling or a child
+directory later costs one ``stat`` before reaching known ground.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+VCS_MARKERS = (".git", ".hg", ".svn", ".jj")
+
+# Directories a skillz repository has at its root
+REPOSITORY_MARKERS = ("skills", "commands")
+
+
+class RootResolver:
+    """Memoized upward search for directories holding marker files."""
+
+    def __init__(self):
+        """Initialize an empty resolver."""
+        self._lock = threading.Lock()
+        self._chains: Dict[Tuple[int, int], Tuple[Path, ...]] = {}
+        self._found: Dict[Tuple, Optional[Path]] = {}
+        self._vcs_roots: Set[Path] = set()
+
+    def clear(self) -> None:
+        """Forget every walk, e.g. after directories were created or removed."""
+        with self._lock:
+            self._chains.clear()
+            self._found.clear()
+            self._vcs_roots.clear()
+
+    def ancestors(self, start: Optional[Path] = None) -> Tuple[Path, ...]:
+        """
+        Return start and its parents, nearest first.
+
+        The chain ends at the first directory that is a version-control
+        root, the last directory on start's filesystem, or the filesystem
+        root.
+
+        Args:
+            start: Directory to start from (default: the working directory)
+        """
+        path = Path(os.path.abspath(start if start is not None else os.getcwd()))
+        stat = os.stat(path)
+        visited = []
+        chain: Tuple[Path, ...] = ()
+        while True:
+            key = (stat.st_dev, stat.st_ino)
+            cached = self._chains.get(key)
+            # An inode can be reused by a new directory elsewhere; only trust the same path
+            if cached is not None and cached[0] == path:
+                chain = cached
+                break
+            visited.append((key, path))
+            parent = path.parent
+            if _is_vcs_root(path):
+                with self._lock:
+                    self._vcs_roots.add(path)
+                break
+            if parent == path:
+                break
+            parent_stat = os.stat(parent)
+            if parent_stat.st_dev != stat.st_dev:
+                break
+            path, stat = parent, parent_stat
+
+        with self._lock:
+            for key, directory in reversed(visited):
+                chain = (directory,) + chain
+                self._chains[key] = chain
+        return chain
+
+    def find(
+        self,
+        markers: Sequence[str],
+        start: Optional[Path] = None,
+        require_all: bool = False,
+    ) -> Optional[Path]:
+        """
+        Return the nearest directory of start's chain that holds markers.
+
+        Args:
+            markers: Relative paths to look for
+            start: Directory to start from (default: the working directory)
+            require_all: Require every marker instead of any one
+
+        Returns:
+            The directory, or None if no directory of the chain matches
+        """
+        chain = self.ancestors(start)
+        key = (chain[0], tuple(markers), require_all)
+        if key in self._found:
+            return self._found[key]
+
+        match = any if not require_all else all
+        found = next(
+            (
+                directory
+                for directory in chain
+                if match(os.path.exists(directory / marker) for marker in markers)
+            ),
+            None,
+        )
+        with self._lock:
+            self._found[key] = found
+        return found
+
+    def project_root(self, markers: Sequence[str] = (), start: Optional[Path] = None) -> Path:
+        """
+        Return the root of the project containing start.
+
+        The root is the nearest directory holding one of markers (such as
+        the project skills directory) or a version-control directory.
+        Outside any project it is start itself.
+        """
+        chain = self.ancestors(start)
+        found = self.find(markers, start) if markers else None
+        if found is not None:
+            return found
+        return chain[-1] if chain[-1] in self._vcs_roots else chain[0]
+
+    def repository_root(self, start: Optional[Path] = None) -> Optional[Path]:
+        """Return the nearest skillz repository (a directory with skills and commands)."""
+        return self.find(REPOSITORY_MARKERS, start, require_all=True)
+
+
+def _is_vcs_root(path: Path) -> bool:
+    """True if path is the top of a version-control checkout."""
+    return any(os.path.exists(path / marker) for marker in VCS_MARKERS)
+
+
+resolver = RootResolver()
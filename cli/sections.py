@@ -0,0 +1,136 @@
+"""Heading index of markdown files, for reading one section without the rest.
+
+Every ATX heading (``#`` to ``######``) outside fenced code is indexed with
+the byte span of its section: from the heading line up to the next heading
+of the same or a higher level, or the end of the file. Reading a section
+seeks straight to its span, so only the requested bytes are read.
+
+Some skills are written in org-mode syntax inside .md files. Their
+``#+begin_src`` blocks are skipped like fences, and files without any
+markdown heading are indexed by their org headings (``*`` to ``******``).
+Since markdown bullets look the same, org headings are only used in .org
+files and in files with org keywords or blocks (``#+TITLE:``, ``#+begin_src``).
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from cli.validator import FENCE_PATTERN
+
+HEADING_PATTERN = re.compile(r"^ {0,3}(#{1,6})[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+ORG_HEADING_PATTERN = re.compile(r"^(\*{1,6})[ \t]+(.*?)[ \t]*$")
+ORG_BLOCK_PATTERN = re.compile(r"^[ \t]*#\+(begin|end)_\w+", re.IGNORECASE)
+ORG_KEYWORD_PATTERN = re.compile(r"^[ \t]*#\+\w+:")
+ANCHOR_STRIP_PATTERN = re.compile(r"[^\w\- ]")
+
+
+class Section(NamedTuple):
+    """A heading and the byte span of its section in a markdown file."""
+
+    level: int
+    title: str
+    anchor: str
+    start: int
+    end: int
+
+    @property
+    def size(self) -> int:
+        """Size of the section in bytes."""
+        return self.end - self.start
+
+
+def anchor(title: str) -> str:
+    """Return the GitHub-style anchor of a heading ('Quick Start!' -> 'quick-start')."""
+    return ANCHOR_STRIP_PATTERN.sub("", title.strip().lower()).replace(" ", "-")
+
+
+def index_sections(path: Path) -> List[Section]:
+    """
+    Index the headings of a markdown file.
+
+    Anchors are made unique within the file the way GitHub does, by adding
+    -1, -2, ... to repeated headings. Unreadable files have no sections.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return []
+
+    headings: List[Tuple[int, str, int]] = []
+    org_headings: List[Tuple[int, str, int]] = []
+    org = path.suffix == ".org"
+    offset = 0
+    fence = None
+    for line in data.splitlines(keepends=True):
+        text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+        match = FENCE_PATTERN.match(text)
+        block = ORG_BLOCK_PATTERN.match(text)
+        if match:
+            if fence is None:
+                fence = match.group(1)
+            elif fence == match.group(1):
+                fence = None
+        elif block:
+            if fence is None and block.group(1).lower() == "begin":
+                fence = "#+"
+                org = True
+            elif fence == "#+" and block.group(1).lower() == "end":
+                fence = None
+        elif fence is None:
+            match = HEADING_PATTERN.match(text)
+            if match:
+                headings.append((len(match.group(1)), match.group(2), offset))
+            match = ORG_HEADING_PATTERN.match(text)
+            if match:
+                org_headings.append((len(match.group(1)), match.group(2), offset))
+            elif ORG_KEYWORD_PATTERN.match(text):
+                org = True
+        offset += len(line)
+    if not headings and org:
+        headings = org_headings
+
+    sections = []
+    seen: Dict[str, int] = {}
+    for i, (level, title, start) in enumerate(headings):
+        end = len(data)
+        for next_level, _, next_start in headings[i + 1 :]:
+            if next_level <= level:
+                end = next_start
+                break
+        slug = anchor(title)
+        count = seen.get(slug, 0)
+        seen[slug] = count + 1
+        sections.append(Section(level, title, f"{slug}-{count}" if count else slug, start, end))
+    return sections
+
+
+def find_section(
+    index: Dict[str, List[Section]], heading: str, file: Optional[str] = None
+) -> Optional[Tuple[str, Section]]:
+    """
+    Find a section by anchor or heading text.
+
+    Args:
+        index: Sections of each file, in search order
+        heading: Anchor or heading text (matched by its anchor)
+        file: Only search this file
+
+    Returns:
+        (file, section) of the first match, or None
+    """
+    slug = anchor(heading)
+    for name, sections in index.items():
+        if file is not None and name != file:
+            continue
+        for section in sections:
+            if section.anchor == slug:
+                return name, section
+    return None
+
+
+def read_section(path: Path, section: Section) -> str:
+    """Read only the bytes of a section."""
+    with open(path, "rb") as f:
+        f.seek(section.start)
+        return f.read(section.size).decode("utf-8", errors="replace")
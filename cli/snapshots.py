@@ -0,0 +1,239 @@
+"""Snapshots of install roots, taken by hardlinking their files.
+
+A snapshot of an install root (a skills or commands directory) recreates
+its directory tree under ``<store>/<id>/``, where the store is the
+``snapshots`` directory next to the state database. Files are hardlinked
+instead of copied, so taking a snapshot costs metadata only; they are
+copied only where a link cannot be made. Installs and uninstalls never
+write to an installed file in place (they replace or unlink it), which
+leaves the linked copies untouched. A file edited in place by anything
+else, such as an editor, changes in the snapshot too.
+
+Each snapshot also keeps the install database rows of its roots (see
+``cli.state``), so that rolling back restores what skillz knew about the
+items it puts back.
+
+Hardlinks and renames cannot cross filesystems, so a root on another
+filesystem than the store (for example a project checkout on another disk)
+is saved next to it instead, under ``.skillz-snapshots/``, which holds a
+``.gitignore`` so that the snapshots do not show up in the checkout.
+
+Rolling back renames the current root into a new snapshot and the saved
+tree into its place: two renames per root whatever its size, and the
+rollback itself can be rolled back.
+"""
+
+import json
+import os
+import secrets
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from cli.profiling import profiler
+
+SNAPSHOT_DIR = ".skillz-snapshots"
+META_FILE = "snapshot.json"
+
+
+class Snapshot(NamedTuple):
+    """Saved state of one or more install roots."""
+
+    id: str
+    operation: str
+    created_at: float
+    roots: Tuple[Path, ...]
+    records: Dict[str, Dict]
+
+
+def take(
+    roots: Iterable[Path], operation: str, store: Path, records: Optional[Dict[str, Dict]] = None
+) -> Snapshot:
+    """
+    Snapshot install roots before an operation changes them.
+
+    Roots that do not exist are recorded as absent, so rolling back
+    removes them again.
+
+    Args:
+        roots: Install roots to save
+        operation: Description of the operation, shown in listings
+        store: Directory holding the snapshots
+        records: Install database rows of the roots, by absolute root path
+
+    Raises:
+        OSError: If a root cannot be saved; nothing is left behind
+    """
+    now = time.time()
+    roots = tuple(dict.fromkeys(Path(os.path.abspath(root)) for root in roots))
+    records = {str(root): records[str(root)] for root in roots if str(root) in (records or {})}
+    snapshot = Snapshot(_new_id(now), operation, now, roots, records)
+    created = []
+    try:
+        with profiler.span("snapshot", roots=len(roots)):
+            for location, members in _by_location(roots, store).items():
+                directory = location / snapshot.id
+                # Created exclusively, so that a failure only removes what this call made
+                directory.mkdir(parents=True)
+                created.append(directory)
+                if location != store:
+                    _ignore(location)
+                for index, root in members:
+                    if root.is_dir():
+                        _save_tree(root, directory / str(index))
+                _write_meta(directory, snapshot, members)
+    except OSError:
+        for directory in created:
+            shutil.rmtree(directory, ignore_errors=True)
+        raise
+    return snapshot
+
+
+def list_snapshots(roots: Iterable[Path], store: Path) -> List[Snapshot]:
+    """Snapshots that cover any of roots, newest first."""
+    roots = {Path(os.path.abspath(root)) for root in roots}
+    locations = dict.fromkeys([store] + [root.parent / SNAPSHOT_DIR for root in sorted(roots)])
+    parts: Dict[str, Dict] = {}
+    for location in locations:
+        if not location.is_dir():
+            continue
+        for directory in location.iterdir():
+            try:
+                meta = json.loads((directory / META_FILE).read_text())
+            except (OSError, ValueError):
+                continue
+            part = parts.setdefault(meta["id"], {"meta": meta, "roots": {}, "records": {}})
+            part["roots"].update((int(index), Path(root)) for index, root in meta["roots"].items())
+            part["records"].update(meta.get("records", {}))
+
+    found = []
+    for part in parts.values():
+        covered = tuple(root for _, root in sorted(part["roots"].items()))
+        if roots.intersection(covered):
+            meta = part["meta"]
+            created_at, records = meta["created_at"], part["records"]
+            found.append(Snapshot(meta["id"], meta["operation"], created_at, covered, records))
+    return sorted(found, key=lambda snapshot: snapshot.created_at, reverse=True)
+
+
+def rollback(
+    snapshot: Snapshot, store: Path, records: Optional[Dict[str, Dict]] = None
+) -> Snapshot:
+    """
+    Restore the roots of a snapshot.
+
+    The current state of the roots becomes a new snapshot, and the restored
+    snapshot is consumed.
+
+    Args:
+        snapshot: Snapshot to restore
+        store: Directory holding the snapshots
+        records: Current install database rows of the roots, kept in the new snapshot
+
+    Returns:
+        The snapshot of the state that was replaced
+    """
+    now = time.time()
+    records = {
+        str(root): records[str(root)] for root in snapshot.roots if str(root) in (records or {})
+    }
+    undo = Snapshot(_new_id(now), f"rollback to {snapshot.id}", now, snapshot.roots, records)
+    with profiler.span("rollback", roots=len(snapshot.roots)):
+        for location, members in _by_location(snapshot.roots, store).items():
+            saved = location / snapshot.id
+            replaced = location / undo.id
+            replaced.mkdir(parents=True)
+            for index, root in members:
+                if root.exists() or root.is_symlink():
+                    os.rename(root, replaced / str(index))
+                if (saved / str(index)).exists():
+                    root.parent.mkdir(parents=True, exist_ok=True)
+                    os.rename(saved / str(index), root)
+            _write_meta(replaced, undo, members)
+            shutil.rmtree(saved)
+    return undo
+
+
+def delete(snapshot: Snapshot, store: Path) -> None:
+    """Delete a snapshot. Files still installed are not affected."""
+    for location in _by_location(snapshot.roots, store):
+        shutil.rmtree(location / snapshot.id, ignore_errors=True)
+
+
+def prune(roots: Iterable[Path], keep: int, store: Path) -> List[Snapshot]:
+    """Delete all but the newest keep snapshots covering roots, and return them."""
+    stale = list_snapshots(roots, store)[keep:]
+    for snapshot in stale:
+        delete(snapshot, store)
+    return stale
+
+
+def _new_id(now: float) -> str:
+    """Snapshot id for a time: sortable, readable, with a random suffix to keep it unique."""
+    stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+    return f"{stamp}-{int(now * 1e6) % 10**6:06d}-{secrets.token_hex(2)}"
+
+
+def _by_location(roots: Iterable[Path], store: Path) -> Dict[Path, List[Tuple[int, Path]]]:
+    """Group roots, numbered in order, by the directory their snapshots live in."""
+    store_device = _device(store)
+    groups: Dict[Path, List[Tuple[int, Path]]] = {}
+    for index, root in enumerate(roots):
+        location = store if _device(root.parent) == store_device else root.parent / SNAPSHOT_DIR
+        groups.setdefault(location, []).append((index, root))
+    return groups
+
+
+def _device(path: Path) -> int:
+    """Device of path, or of its nearest existing parent."""
+    while not path.exists() and path.parent != path:
+        path = path.parent
+    return os.stat(path).st_dev
+
+
+def _ignore(location: Path) -> None:
+    """Keep snapshots stored next to their roots out of version control."""
+    gitignore = location / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+
+
+def _save_tree(source: Path, dest: Path) -> None:
+    """Recreate the tree at source under dest, hardlinking its files."""
+    files = 0
+    for directory, dirnames, filenames in os.walk(source):
+        target = dest / os.path.relpath(directory, source)
+        target.mkdir(parents=True, exist_ok=True)
+        # os.walk does not descend into symlinked directories; keep them as links
+        for name in dirnames + filenames:
+            path = os.path.join(directory, name)
+            if os.path.islink(path):
+                os.symlink(os.readlink(path), target / name)
+        for name in filenames:
+            path = os.path.join(directory, name)
+            if os.path.islink(path):
+                continue
+            try:
+                os.link(path, target / name)
+            except OSError:
+                # Filesystems without hardlinks, or a root that moved to another device
+                shutil.copy2(path, target / name)
+            files += 1
+    profiler.count("snapshot", files=files)
+
+
+def _write_meta(directory: Path, snapshot: Snapshot, members: List[Tuple[int, Path]]) -> None:
+    """Write the metadata of the part of a snapshot stored in directory."""
+    meta = {
+        "id": snapshot.id,
+        "operation": snapshot.operation,
+        "created_at": snapshot.created_at,
+        "roots": {str(index): str(root) for index, root in members},
+        "records": {
+            str(root): snapshot.records[str(root)]
+            for _, root in members
+            if str(root) in snapshot.records
+        },
+    }
+    (directory / META_FILE).write_text(json.dumps(meta, indent=2))
@@ -0,0 +1,369 @@
+"""Database of installed skills and commands."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from cli.catalog import Catalog, CatalogRecord, CommandRecord, SkillRecord
+from cli.integrity import FileEntry
+from cli.locations import scan_locations
+from cli.profiling import profiler
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    root TEXT NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    location TEXT NOT NULL,
+    description TEXT NOT NULL,
+    allowed_tools TEXT,
+    installed_at REAL NOT NULL,
+    PRIMARY KEY (root, type, name)
+);
+CREATE TABLE IF NOT EXISTS files (
+    root TEXT NOT NULL,
+    type TEXT NOT NULL,
+    name TEXT NOT NULL,
+    file TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (root, type, name, file)
+);
+CREATE TABLE IF NOT EXISTS roots (
+    root TEXT PRIMARY KEY,
+    scanned_at REAL NOT NULL
+);
+"""
+
+
+class Reconciliation(NamedTuple):
+    """Differences found between the database and disk for one location."""
+
+    location: str
+    added: Tuple[str, ...]
+    removed: Tuple[str, ...]
+    updated: Tuple[str, ...]
+
+    @property
+    def changed(self) -> bool:
+        """True if the database did not match disk."""
+        return bool(self.added or self.removed or self.updated)
+
+
+class InstallState:
+    """
+    Installed items of every install location, kept in one SQLite database.
+
+    Installs and uninstalls record each change in a transaction, so listing
+    installed items is one indexed query instead of a walk of every install
+    directory and a parse of every installed SKILL.md. Items are keyed by
+    the absolute directory they are installed in, which keeps project
+    installs of different working directories apart.
+
+    A directory the database has never seen (items installed by hand or by
+    an older skillz) is scanned on first listing and recorded. Changes made
+    behind skillz's back are picked up by ``reconcile``.
+
+    Installs also record a manifest of the files they wrote, which
+    ``skillz verify`` compares installed files with.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize a database stored at path, or in memory if path is None."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection to the database, created with its schema on first use."""
+        if self._conn is None:
+            if self.path is None:
+                target = ":memory:"
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                target = str(self.path)
+            conn = sqlite3.connect(target, timeout=10, check_same_thread=False)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.VERSION:
+                # The database only mirrors disk, so an unknown schema is rebuilt
+                conn.executescript(
+                    "DROP TABLE IF EXISTS items; DROP TABLE IF EXISTS files; "
+                    "DROP TABLE IF EXISTS roots;"
+                )
+            with conn:
+                conn.executescript(SCHEMA)
+                conn.execute(f"PRAGMA user_version = {self.VERSION}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def record(
+        self,
+        record: CatalogRecord,
+        path: Path,
+        location: str,
+        manifest: Optional[Dict[str, FileEntry]] = None,
+    ) -> None:
+        """Record that record is now installed at path, with the manifest of its files."""
+        with self._lock, self.conn:
+            root = self._key(record.type, record.name, path)[0]
+            row = (
+                root,
+                record.type,
+                record.name,
+                _root(path),
+                location,
+                record.description,
+                _tools_json(record),
+                time.time(),
+            )
+            self.conn.execute("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self.conn.execute(
+                "DELETE FROM files WHERE root = ? AND type = ? AND name = ?",
+                (root, record.type, record.name),
+            )
+            self.conn.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (root, record.type, record.name, file, *entry)
+                    for file, entry in (manifest or {}).items()
+                ],
+            )
+
+    def remove(self, item_type: str, name: str, path: Path) -> None:
+        """Record that the item installed at path was removed."""
+        with self._lock, self.conn:
+            key = self._key(item_type, name, path)
+            self.conn.execute("DELETE FROM items WHERE root = ? AND type = ? AND name = ?", key)
+            self.conn.execute("DELETE FROM files WHERE root = ? AND type = ? AND name = ?", key)
+
+    def dump(self, roots: Iterable[Path]) -> Dict[str, Dict]:
+        """Return the items and files rows of install directories, by directory, as JSON data."""
+        keys = [_root(root) for root in roots]
+        dumped: Dict[str, Dict] = {}
+        with self._lock:
+            for table in ("items", "files"):
+                for key in keys:
+                    rows = self.conn.execute(f"SELECT * FROM {table} WHERE root = ?", (key,))
+                    for row in rows:
+                        dumped.setdefault(key, {"items": [], "files": []})[table].append(list(row))
+        return dumped
+
+    def restore(self, roots: Iterable[Path], dumped: Dict[str, Dict]) -> None:
+        """
+        Replace the rows of install directories with rows returned by ``dump``.
+
+        The directories are rescanned on next listing, which keeps the
+        restored manifests of items still on disk.
+        """
+        keys = [_root(root) for root in roots]
+        with self._lock, self.conn:
+            for table in ("items", "files", "roots"):
+                self.conn.executemany(f"DELETE FROM {table} WHERE root = ?", [(k,) for k in keys])
+            for key in keys:
+                rows = dumped.get(key, {})
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [tuple(row) for row in rows.get("items", [])],
+                )
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [tuple(row) for row in rows.get("files", [])],
+                )
+
+    def manifest(self, item_type: str, name: str, path: Path) -> Optional[Dict[str, FileEntry]]:
+        """Return the manifest recorded when the item at path was installed, if any."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT file, size, mtime_ns, digest FROM files "
+                "WHERE root = ? AND type = ? AND name = ?",
+                self._key(item_type, name, path),
+            ).fetchall()
+        return {
+            file: FileEntry(size, mtime_ns, digest) for file, size, mtime_ns, digest in rows
+        } or None
+
+    def is_managed(self, record: CatalogRecord) -> bool:
+        """True if skillz installed the item of record, rather than only finding it on disk."""
+        return self.manifest(record.type, record.name, record.path) is not None
+
+    def items(self, catalogs: Sequence[Catalog], item_type: str = "all") -> List[CatalogRecord]:
+        """
+        Return the items installed in the locations of catalogs.
+
+        Records come from the database, in catalog order with skills before
+        commands, each sorted by name. Locations not in the database yet are
+        scanned from disk first.
+        """
+        roots = {}
+        for catalog in catalogs:
+            for directory in (catalog.skills_dir, catalog.commands_dir):
+                roots.setdefault(_root(directory), (len(roots), catalog.location))
+
+        with profiler.span("state", roots=len(roots)):
+            placeholders = ", ".join("?" * len(roots))
+            with self._lock:
+                known = {
+                    root
+                    for (root,) in self.conn.execute(
+                        f"SELECT root FROM roots WHERE root IN ({placeholders})", list(roots)
+                    )
+                }
+            unknown = [
+                catalog
+                for catalog in catalogs
+                if not {_root(catalog.skills_dir), _root(catalog.commands_dir)} <= known
+            ]
+            self.reconcile_all(unknown)
+
+            types = ("skill", "command") if item_type == "all" else (item_type,)
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT root, type, name, path, description, allowed_tools FROM items "
+                    f"WHERE root IN ({placeholders}) AND type IN ({', '.join('?' * len(types))})",
+                    list(roots) + list(types),
+                ).fetchall()
+
+        rows.sort(key=lambda row: (roots[row[0]][0], row[1] != "skill", row[2]))
+        return [_to_record(row, roots[row[0]][1]) for row in rows]
+
+    def reconcile(self, catalog: Catalog) -> Reconciliation:
+        """Replace the rows of a catalog's location with what is installed on disk now."""
+        return self.reconcile_all([catalog])[0]
+
+    def reconcile_all(self, catalogs: Sequence[Catalog]) -> List[Reconciliation]:
+        """Reconcile several locations, scanning them from disk concurrently."""
+        fresh = [
+            Catalog(
+                catalog.repo_path,
+                skills_dir=catalog.skills_dir,
+                commands_dir=catalog.commands_dir,
+                location=catalog.location,
+            )
+            for catalog in catalogs
+        ]
+        return [self._replace(catalog) for catalog in scan_locations(fresh)]
+
+    def _key(self, item_type: str, name: str, path: Path) -> Tuple[str, str, str]:
+        """
+        Return the (root, type, name) key of the item installed at path.
+
+        Rows are keyed by the install directory they belong to, which is the
+        parent of the item unless the item was found nested below it. Call
+        with the lock held.
+        """
+        row = self.conn.execute(
+            "SELECT root FROM items WHERE type = ? AND name = ? AND path = ?",
+            (item_type, name, _root(path)),
+        ).fetchone()
+        return (row[0] if row else _root(path.parent), item_type, name)
+
+    def _replace(self, catalog: Catalog) -> Reconciliation:
+        """Replace the rows of a scanned catalog's location with its records."""
+        skills_root, commands_root = _root(catalog.skills_dir), _root(catalog.commands_dir)
+        on_disk = {
+            (record.type, record.name): (root, record)
+            for root, records in (
+                (skills_root, catalog.skill_records()),
+                (commands_root, catalog.command_records()),
+            )
+            for record in records
+        }
+
+        now = time.time()
+        with self._lock, self.conn:
+            stored = {
+                (item_type, name): description
+                for item_type, name, description in self.conn.execute(
+                    "SELECT type, name, description FROM items WHERE "
+                    "(root = ? AND type = 'skill') OR (root = ? AND type = 'command')",
+                    (skills_root, commands_root),
+                )
+            }
+            self.conn.execute(
+                "DELETE FROM items WHERE (root = ? AND type = 'skill') "
+                "OR (root = ? AND type = 'command')",
+                (skills_root, commands_root),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        root,
+                        record.type,
+                        record.name,
+                        _root(record.path),
+                        catalog.location,
+                        record.description,
+                        _tools_json(record),
+                        now,
+                    )
+                    for root, record in on_disk.values()
+                ],
+            )
+            self.conn.execute(
+                "DELETE FROM files WHERE root IN (?, ?) AND NOT EXISTS ("
+                "SELECT 1 FROM items WHERE items.root = files.root "
+                "AND items.type = files.type AND items.name = files.name)",
+                (skills_root, commands_root),
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO roots VALUES (?, ?)",
+                [(skills_root, now), (commands_root, now)],
+            )
+
+        return Reconciliation(
+            catalog.location,
+            added=_names(key for key in on_disk if key not in stored),
+            removed=_names(key for key in stored if key not in on_disk),
+            updated=_names(
+                key
+                for key, (_, record) in on_disk.items()
+                if key in stored and stored[key] != record.description
+            ),
+        )
+
+
+def _root(path: Path) -> str:
+    """Return the absolute form of an install directory or item path, as stored in the database."""
+    return os.path.abspath(path)
+
+
+def _tools_json(record: CatalogRecord) -> Optional[str]:
+    """Return the allowed-tools of a record as JSON, or None."""
+    tools = getattr(record, "allowed_tools", None)
+    return json.dumps(tools) if tools is not None else None
+
+
+def _names(keys: Iterable[Tuple[str, str]]) -> Tuple[str, ...]:
+    """Return sorted 'type name' labels for (type, name) keys."""
+    return tuple(f"{item_type} {name}" for item_type, name in sorted(keys))
+
+
+def _to_record(row: Tuple, location: str) -> CatalogRecord:
+    """Build a catalog record from an items row."""
+    _, item_type, name, path, description, tools = row
+    if item_type == "skill":
+        return SkillRecord(
+            name,
+            description,
+            Path(path),
+            location=location,
+            allowed_tools=json.loads(tools) if tools is not None else None,
+        )
+    return CommandRecord(name, description, Path(path), location=location)
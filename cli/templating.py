@@ -0,0 +1,128 @@
+"""User-supplied export templates.
+
+Templates live in ``.ai/templates/`` and are rendered with jinja2, which is
+an optional dependency (``pip install 'skillz[templates]'``). They receive
+the same payload the built-in renderers use, plus ``platform``, ``header``
+and the rendered ``instruction_block``.
+"""
+
+import io
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+from cli.profiling import profiler
+from cli.rendering import _get_header, _write_instruction_block
+
+TEMPLATE_SUFFIX = ".j2"
+
+
+class TemplateError(Exception):
+    """Raised when a custom template cannot be loaded or rendered."""
+
+    pass
+
+
+class TemplateRenderer:
+    """
+    Loads and renders templates from one directory.
+
+    Compiled templates are kept in memory for the life of the renderer and,
+    when a cache directory is given, in a jinja2 bytecode cache keyed by the
+    template's path and mtime, so later processes skip parsing and compiling
+    unchanged templates.
+    """
+
+    def __init__(self, templates_dir: Path, cache_dir: Optional[Path] = None):
+        """
+        Initialize a renderer.
+
+        Args:
+            templates_dir: Directory holding the templates
+            cache_dir: Directory for compiled template bytecode (default: none)
+        """
+        self.templates_dir = templates_dir
+        self.cache_dir = cache_dir
+        self._environment = None
+
+    @property
+    def environment(self):
+        """The jinja2 environment, created on first use."""
+        if self._environment is None:
+            try:
+                import jinja2
+            except ImportError as e:
+                raise TemplateError(
+                    "Custom templates require jinja2. "
+                    "Install it with: pip install 'skillz[templates]'"
+                ) from e
+
+            bytecode_cache = None
+            if self.cache_dir is not None:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                bytecode_cache = _mtime_bytecode_cache(jinja2, self.cache_dir)
+            self._environment = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(str(self.templates_dir)),
+                bytecode_cache=bytecode_cache,
+                undefined=jinja2.StrictUndefined,
+                keep_trailing_newline=True,
+                autoescape=False,
+            )
+        return self._environment
+
+    def names(self) -> List[str]:
+        """Names of the available templates, without the .j2 suffix."""
+        if not self.templates_dir.is_dir():
+            return []
+        return sorted(
+            path.name[: -len(TEMPLATE_SUFFIX)] if path.name.endswith(TEMPLATE_SUFFIX) else path.name
+            for path in self.templates_dir.iterdir()
+            if path.is_file()
+        )
+
+    def get(self, name: str):
+        """Load and compile a template by name, with or without the .j2 suffix."""
+        environment = self.environment
+        import jinja2
+
+        candidates = [name] if name.endswith(TEMPLATE_SUFFIX) else [name + TEMPLATE_SUFFIX, name]
+        with profiler.span("template", template=name):
+            try:
+                return environment.get_or_select_template(candidates)
+            except jinja2.TemplatesNotFound:
+                available = ", ".join(self.names()) or "none"
+                raise TemplateError(
+                    f"Template '{name}' not found in {self.templates_dir} (available: {available})"
+                ) from None
+            except jinja2.TemplateError as e:
+                raise TemplateError(f"Could not load template '{name}': {e}") from e
+
+    def write(self, out: TextIO, name: str, platform: str, payload: Dict) -> None:
+        """Stream a template rendered against a payload to out."""
+        import jinja2
+
+        template = self.get(name)
+        block = io.StringIO()
+        _write_instruction_block(block, payload)
+        context = {
+            **payload,
+            "platform": platform,
+            "header": _get_header(platform),
+            "instruction_block": block.getvalue(),
+        }
+        try:
+            for chunk in template.generate(**context):
+                out.write(chunk)
+        except jinja2.TemplateError as e:
+            raise TemplateError(f"Could not render template '{name}': {e}") from e
+
+
+def _mtime_bytecode_cache(jinja2, directory: Path):
+    """Create a bytecode cache whose keys include each template's mtime."""
+
+    class MtimeBytecodeCache(jinja2.FileSystemBytecodeCache):
+        def get_cache_key(self, name: str, filename: Optional[str] = None) -> str:
+            mtime = os.stat(filename).st_mtime_ns if filename else 0
+            return super().get_cache_key(f"{name}@{mtime}", filename)
+
+    return MtimeBytecodeCache(str(directory))
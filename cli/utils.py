@@ -1,5 +1,6 @@
 """Utility functions for claude-skills."""
 
+import os
 import re
 import shutil
 from pathlib import Path
@@ -7,6 +8,8 @@ from typing import List
 
 from rich.console import Console
 
+from cli.profiling import profiler
+
 console = Console()
 
 
@@ -42,10 +45,11 @@ def copy_directory(src: Path, dst: Path, force: bool = False) -> bool:
             console.print(f"[yellow]Warning: {dst} already exists[/yellow]")
             return False
 
-        if dst.exists():
-            shutil.rmtree(dst)
+        with profiler.span("copy", path=src):
+            if dst.exists():
+                shutil.rmtree(dst)
 
-        shutil.copytree(src, dst)
+            shutil.copytree(src, dst, copy_function=tracked_copy2)
         return True
     except Exception as e:
         console.print(f"[red]Error copying directory: {e}[/red]")
@@ -69,14 +73,26 @@ def copy_file(src: Path, dst: Path, force: bool = False) -> bool:
             console.print(f"[yellow]Warning: {dst} already exists[/yellow]")
             return False
 
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dst)
+        with profiler.span("copy", path=src):
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            # Replace instead of overwriting, so hardlinked snapshots keep the old file
+            if dst.exists():
+                dst.unlink()
+            tracked_copy2(src, dst)
         return True
     except Exception as e:
         console.print(f"[red]Error copying file: {e}[/red]")
         return False
 
 
+def tracked_copy2(src, dst):
+    """Copy a file with metadata, counting it in the "copy" profiling phase."""
+    result = shutil.copy2(src, dst)
+    if profiler.enabled:
+        profiler.count("copy", files=1, bytes=os.path.getsize(result))
+    return result
+
+
 def find_skill_directories(base_path: Path) -> List[Path]:
     """
     Find all skill directories (containing SKILL.md) in a base path.
@@ -91,8 +107,10 @@ def find_skill_directories(base_path: Path) -> List[Path]:
     if not base_path.exists():
         return skills
 
-    for item in base_path.rglob("SKILL.md"):
-        skills.append(item.parent)
+    with profiler.span("discovery", path=base_path):
+        for item in base_path.rglob("SKILL.md"):
+            skills.append(item.parent)
+    profiler.count("discovery", files=len(skills))
 
     return sorted(skills)
 
@@ -111,10 +129,12 @@ def find_command_files(base_path: Path) -> List[Path]:
     if not base_path.exists():
         return commands
 
-    for item in base_path.rglob("*.md"):
-        # Skip SKILL.md files
-        if item.name != "SKILL.md":
-            commands.append(item)
+    with profiler.span("discovery", path=base_path):
+        for item in base_path.rglob("*.md"):
+            # Skip SKILL.md files
+            if item.name != "SKILL.md":
+                commands.append(item)
+    profiler.count("discovery", files=len(commands))
 
     return sorted(commands)
 
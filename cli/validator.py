@@ -1,13 +1,52 @@
 """Validation for skills and commands."""
 
+import os
+import posixpath
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote
 
 import yaml
 
+from cli.profiling import profiler
 from cli.utils import validate_description, validate_name
 
+ERROR = "error"
+WARNING = "warning"
+
+# Rule IDs reported by the validators, with a one-line summary of each.
+RULES = {
+    "missing-path": "The skill directory or command file does not exist",
+    "not-a-directory": "A skill must be a directory",
+    "missing-skill-md": "A skill directory must contain SKILL.md",
+    "not-markdown": "A command must be a .md file",
+    "read-error": "The file could not be read",
+    "invalid-frontmatter": "SKILL.md must start with valid YAML frontmatter",
+    "missing-field": "A required frontmatter field is missing",
+    "invalid-name": "Names are lowercase with hyphens/numbers only, max 64 chars",
+    "description-too-long": "The description exceeds the maximum length",
+    "unknown-tool": "allowed-tools names a tool that does not exist",
+    "invalid-allowed-tools": "allowed-tools must be a list or '*'",
+    "invalid-model": "model must be sonnet, opus or haiku",
+    "empty-content": "A command must have content after its frontmatter",
+    "broken-link": "A relative markdown link points to a file missing from the skill",
+    "missing-asset": "A path in code points to a file missing from the skill",
+    "skill-too-large": "The skill's files exceed the max_skill_bytes lint threshold",
+    "body-too-long": "The SKILL.md body exceeds the max_body_tokens lint threshold",
+    "too-many-references": "The skill has more reference files than max_references",
+}
+
+# Skill subdirectories whose paths are checked when they appear in code
+ASSET_DIRS = ("references", "scripts", "assets", "examples")
+
+LINK_PATTERN = re.compile(r"!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?[^)]*\)")
+REFERENCE_LINK_PATTERN = re.compile(r"^ {0,3}\[[^\]]+\]:\s*<?([^\s>]+)")
+FENCE_PATTERN = re.compile(r"^ {0,3}(```|~~~)")
+CODE_SPAN_PATTERN = re.compile(r"(`+)(.+?)\1")
+CODE_PATH_PATTERN = re.compile(rf"(?<![\w/.-])(?:\./)?(?:{'|'.join(ASSET_DIRS)})/[\w./-]*")
+URL_SCHEME_PATTERN = re.compile(r"^[a-zA-Z][\w+.-]*:")
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -15,6 +54,36 @@ class ValidationError(Exception):
     pass
 
 
+class Issue(NamedTuple):
+    """One validation finding, located at a line of a file."""
+
+    rule: str
+    severity: str
+    file: str
+    line: int
+    message: str
+
+    @property
+    def is_error(self) -> bool:
+        """True for error-severity issues, which make an item invalid."""
+        return self.severity == ERROR
+
+    def to_dict(self) -> Dict:
+        """Return the issue as a JSON-serializable dict."""
+        return self._asdict()
+
+
+def _summarize(issues: List[Issue]) -> Tuple[bool, List[str]]:
+    """Convert issues to the (is_valid, list_of_errors) form."""
+    return not any(issue.is_error for issue in issues), [issue.message for issue in issues]
+
+
+def _field_line(content: str, field: str) -> int:
+    """Return the 1-based line of a top-level frontmatter field, or 1 if not found."""
+    match = re.search(rf"^{re.escape(field)}\s*:", content, re.MULTILINE)
+    return content.count("\n", 0, match.start()) + 1 if match else 1
+
+
 class SkillValidator:
     """Validator for skill directories and SKILL.md files."""
 
@@ -50,74 +119,139 @@ class SkillValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
+        return _summarize(cls.check_skill_directory(skill_path))
+
+    @classmethod
+    def validate_skill_file(cls, skill_file: Path) -> Tuple[bool, List[str]]:
+        """
+        Validate a SKILL.md file.
+
+        Args:
+            skill_file: Path to SKILL.md file
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        return _summarize(cls.check_skill_file(skill_file))
+
+    @classmethod
+    def check_skill_directory(
+        cls, skill_path: Path, index: Optional[Set[str]] = None
+    ) -> List[Issue]:
+        """
+        Check a skill directory.
+
+        Args:
+            skill_path: Path to skill directory
+            index: Listing of the skill for check_links, if already made
 
+        Returns:
+            Issues found, in file order (empty if the skill is valid)
+        """
         # Check if directory exists
         if not skill_path.exists():
-            errors.append(f"Directory does not exist: {skill_path}")
-            return False, errors
+            return [
+                Issue(
+                    "missing-path",
+                    ERROR,
+                    str(skill_path),
+                    0,
+                    f"Directory does not exist: {skill_path}",
+                )
+            ]
 
         if not skill_path.is_dir():
-            errors.append(f"Path is not a directory: {skill_path}")
-            return False, errors
+            return [
+                Issue(
+                    "not-a-directory",
+                    ERROR,
+                    str(skill_path),
+                    0,
+                    f"Path is not a directory: {skill_path}",
+                )
+            ]
 
         # Check for SKILL.md
         skill_file = skill_path / "SKILL.md"
         if not skill_file.exists():
-            errors.append(f"Missing SKILL.md in {skill_path}")
-            return False, errors
+            return [
+                Issue(
+                    "missing-skill-md",
+                    ERROR,
+                    str(skill_file),
+                    0,
+                    f"Missing SKILL.md in {skill_path}",
+                )
+            ]
 
         # Validate SKILL.md content
-        valid, file_errors = cls.validate_skill_file(skill_file)
-        errors.extend(file_errors)
-
-        return len(errors) == 0, errors
+        return cls.check_skill_file(skill_file, index=index)
 
     @classmethod
-    def validate_skill_file(cls, skill_file: Path) -> Tuple[bool, List[str]]:
+    @profiler.timed("validation")
+    def check_skill_file(
+        cls,
+        skill_file: Path,
+        content: Optional[str] = None,
+        index: Optional[Set[str]] = None,
+    ) -> List[Issue]:
         """
-        Validate a SKILL.md file.
+        Check a SKILL.md file.
 
         Args:
             skill_file: Path to SKILL.md file
+            content: Content of the file if already read (read from disk if None)
+            index: Listing of the skill for check_links, if already made
 
         Returns:
-            Tuple of (is_valid, list_of_errors)
+            Issues found, in file order (empty if the file is valid)
         """
-        errors = []
+        file = str(skill_file)
+        issues = []
 
-        try:
-            with open(skill_file) as f:
-                content = f.read()
-        except Exception as e:
-            errors.append(f"Error reading file: {e}")
-            return False, errors
+        def issue(rule: str, message: str, field: Optional[str] = None) -> None:
+            line = _field_line(content, field) if field else 1
+            issues.append(Issue(rule, ERROR, file, line, message))
+
+        if content is None:
+            try:
+                with open(skill_file) as f:
+                    content = f.read()
+            except Exception as e:
+                return [Issue("read-error", ERROR, file, 0, f"Error reading file: {e}")]
+        profiler.count("validation", files=1, bytes=len(content))
 
         # Parse frontmatter
         frontmatter = cls._parse_frontmatter(content)
         if frontmatter is None:
-            errors.append("Missing or invalid YAML frontmatter")
-            return False, errors
+            issue("invalid-frontmatter", "Missing or invalid YAML frontmatter")
+            return issues
 
         # Validate required fields
         for field in cls.REQUIRED_FRONTMATTER_FIELDS:
             if field not in frontmatter:
-                errors.append(f"Missing required field: {field}")
+                issue("missing-field", f"Missing required field: {field}")
 
         # Validate name
         if "name" in frontmatter:
             name = frontmatter["name"]
             if not validate_name(name):
-                errors.append(
+                issue(
+                    "invalid-name",
                     f"Invalid name '{name}': must be lowercase with hyphens/numbers only, "
-                    f"max 64 chars"
+                    f"max 64 chars",
+                    "name",
                 )
 
         # Validate description
         if "description" in frontmatter:
             desc = frontmatter["description"]
             if not validate_description(desc):
-                errors.append("Description too long: max 1024 characters")
+                issue(
+                    "description-too-long",
+                    "Description too long: max 1024 characters",
+                    "description",
+                )
 
         # Validate allowed-tools
         if "allowed-tools" in frontmatter:
@@ -127,13 +261,95 @@ class SkillValidator:
                 if isinstance(tools, list):
                     for tool in tools:
                         if tool not in cls.VALID_TOOLS:
-                            errors.append(f"Unknown tool: {tool}")
+                            issue("unknown-tool", f"Unknown tool: {tool}", "allowed-tools")
                 else:
-                    errors.append("allowed-tools must be a list or '*'")
+                    issue(
+                        "invalid-allowed-tools",
+                        "allowed-tools must be a list or '*'",
+                        "allowed-tools",
+                    )
+
+        issues.extend(cls.check_links(skill_file.parent, content, file, index))
+        return issues
+
+    @classmethod
+    def check_stats(cls, stats, thresholds: Dict[str, int], file: str) -> List[Issue]:
+        """
+        Flag skills whose size exceeds the lint thresholds.
+
+        Args:
+            stats: ItemStats of the skill
+            thresholds: max_skill_bytes, max_body_tokens and max_references
+                (missing or 0 disables a rule)
+            file: Path reported in issues
+
+        Returns:
+            A warning per exceeded threshold
+        """
+        checks = [
+            ("skill-too-large", stats.bytes, "max_skill_bytes", "Skill is {} bytes"),
+            ("body-too-long", stats.body_tokens, "max_body_tokens", "SKILL.md body is ~{} tokens"),
+            (
+                "too-many-references",
+                stats.references,
+                "max_references",
+                "Skill has {} reference files",
+            ),
+        ]
+        issues = []
+        for rule, value, key, message in checks:
+            limit = thresholds.get(key)
+            if limit and value > limit:
+                text = f"{message.format(value)} (limit {limit})"
+                issues.append(Issue(rule, WARNING, file, 0, text))
+        return issues
+
+    @classmethod
+    def check_links(
+        cls, skill_path: Path, content: str, file: str, index: Optional[Set[str]] = None
+    ) -> List[Issue]:
+        """
+        Check that files referenced from SKILL.md exist in the skill.
+
+        Relative markdown links must resolve to a file or directory in the
+        skill (errors). Paths under references/, scripts/, assets/ or
+        examples/ that appear in code spans and fenced code are checked too
+        (warnings, since code may show paths of other projects). Links to
+        URLs, anchors and paths outside the skill are not checked.
+
+        The skill is listed once and every reference is resolved against that
+        listing, so checking a link costs no filesystem calls.
 
-        return len(errors) == 0, errors
+        Args:
+            skill_path: Skill directory
+            content: SKILL.md content
+            file: Path reported in issues
+            index: Skill-relative POSIX paths of everything in the skill
+                (listed from disk if None)
+
+        Returns:
+            Issues for references that do not resolve
+        """
+        references = list(_iter_references(content))
+        if not references:
+            return []
+
+        if index is None:
+            index = _list_skill(skill_path)
+        issues = []
+        for line, target, in_code in references:
+            path = _resolve_reference(target)
+            if path is None or path in index:
+                continue
+            if in_code:
+                message = f"Referenced path not found: {target}"
+                issues.append(Issue("missing-asset", WARNING, file, line, message))
+            else:
+                issues.append(Issue("broken-link", ERROR, file, line, f"Broken link: {target}"))
+        return issues
 
     @staticmethod
+    @profiler.timed("frontmatter")
     def _parse_frontmatter(content: str) -> Optional[Dict]:
         """
         Parse YAML frontmatter from markdown content.
@@ -158,6 +374,63 @@ class SkillValidator:
             return None
 
 
+def _iter_references(content: str):
+    """
+    Yield (line, target, in_code) for each file reference in markdown content.
+
+    Links are taken from markdown outside code; asset paths from code spans
+    and fenced code blocks. Frontmatter is skipped.
+    """
+    match = re.match(r"^---\s*\n.*?\n---\s*\n", content, re.DOTALL)
+    start = content.count("\n", 0, match.end()) if match else 0
+    in_fence = False
+    for number, text in enumerate(content.splitlines()[start:], start + 1):
+        if FENCE_PATTERN.match(text):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            for path in CODE_PATH_PATTERN.findall(text):
+                yield number, path, True
+            continue
+        for span in CODE_SPAN_PATTERN.finditer(text):
+            for path in CODE_PATH_PATTERN.findall(span.group(2)):
+                yield number, path, True
+        prose = CODE_SPAN_PATTERN.sub("", text)
+        for target in LINK_PATTERN.findall(prose):
+            yield number, target, False
+        reference = REFERENCE_LINK_PATTERN.match(prose)
+        if reference:
+            yield number, reference.group(1), False
+
+
+def _resolve_reference(target: str) -> Optional[str]:
+    """
+    Normalize a reference to a skill-relative POSIX path.
+
+    Returns None for references that are not checked: URLs, anchors,
+    absolute paths and paths leading out of the skill.
+    """
+    if target.startswith(("#", "/")) or URL_SCHEME_PATTERN.match(target):
+        return None
+    path = unquote(target.split("#", 1)[0].split("?", 1)[0])
+    path = posixpath.normpath(path) if path else "."
+    if path == "." or path == ".." or path.startswith("../"):
+        return None
+    return path
+
+
+def _list_skill(skill_path: Path) -> Set[str]:
+    """Return the skill-relative POSIX paths of every file and directory in a skill."""
+    index = set()
+    with profiler.span("discovery", path=skill_path):
+        for root, dirs, files in os.walk(skill_path):
+            rel = Path(root).relative_to(skill_path).as_posix()
+            prefix = "" if rel == "." else rel + "/"
+            index.update(prefix + name for name in dirs)
+            index.update(prefix + name for name in files)
+    return index
+
+
 class CommandValidator:
     """Validator for command files."""
 
@@ -180,22 +453,50 @@ class CommandValidator:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
+        return _summarize(cls.check_command_file(command_file))
+
+    @classmethod
+    @profiler.timed("validation")
+    def check_command_file(cls, command_file: Path, content: Optional[str] = None) -> List[Issue]:
+        """
+        Check a command file.
+
+        Args:
+            command_file: Path to command markdown file
+            content: Content of the file if already read (read from disk if None)
+
+        Returns:
+            Issues found, in file order (empty if the command is valid)
+        """
+        file = str(command_file)
+        issues = []
+
+        def issue(rule: str, message: str, field: Optional[str] = None, line: int = 1) -> None:
+            if field:
+                line = _field_line(content, field)
+            issues.append(Issue(rule, ERROR, file, line, message))
 
         if not command_file.exists():
-            errors.append(f"File does not exist: {command_file}")
-            return False, errors
+            return [Issue("missing-path", ERROR, file, 0, f"File does not exist: {command_file}")]
 
         if not command_file.suffix == ".md":
-            errors.append(f"Command file must be a .md file: {command_file}")
-            return False, errors
+            return [
+                Issue(
+                    "not-markdown",
+                    ERROR,
+                    file,
+                    0,
+                    f"Command file must be a .md file: {command_file}",
+                )
+            ]
 
-        try:
-            with open(command_file) as f:
-                content = f.read()
-        except Exception as e:
-            errors.append(f"Error reading file: {e}")
-            return False, errors
+        if content is None:
+            try:
+                with open(command_file) as f:
+                    content = f.read()
+            except Exception as e:
+                return [Issue("read-error", ERROR, file, 0, f"Error reading file: {e}")]
+        profiler.count("validation", files=1, bytes=len(content))
 
         # Parse optional frontmatter
         frontmatter = cls._parse_frontmatter(content)
@@ -206,14 +507,22 @@ class CommandValidator:
             if "description" in frontmatter:
                 desc = frontmatter["description"]
                 if not validate_description(desc, max_length=256):
-                    errors.append("Description too long: max 256 characters for commands")
+                    issue(
+                        "description-too-long",
+                        "Description too long: max 256 characters for commands",
+                        "description",
+                    )
 
             # Validate model
             if "model" in frontmatter:
                 model = frontmatter["model"]
                 valid_models = ["sonnet", "opus", "haiku"]
                 if model not in valid_models:
-                    errors.append(f"Invalid model '{model}': must be one of {valid_models}")
+                    issue(
+                        "invalid-model",
+                        f"Invalid model '{model}': must be one of {valid_models}",
+                        "model",
+                    )
 
             # Validate allowed-tools
             if "allowed-tools" in frontmatter:
@@ -221,16 +530,26 @@ class CommandValidator:
                 # Allow "*" as string or ["*"] as list to mean "all tools"
                 if tools and tools != "*" and tools != ["*"]:
                     if not isinstance(tools, list):
-                        errors.append("allowed-tools must be a list or '*'")
+                        issue(
+                            "invalid-allowed-tools",
+                            "allowed-tools must be a list or '*'",
+                            "allowed-tools",
+                        )
 
         # Check content is not empty (excluding frontmatter)
         content_without_frontmatter = cls._remove_frontmatter(content)
         if not content_without_frontmatter.strip():
-            errors.append("Command content is empty")
+            body_line = len(content) - len(content_without_frontmatter)
+            issue(
+                "empty-content",
+                "Command content is empty",
+                line=content.count("\n", 0, body_line) + 1,
+            )
 
-        return len(errors) == 0, errors
+        return issues
 
     @staticmethod
+    @profiler.timed("frontmatter")
     def _parse_frontmatter(content: str) -> Optional[Dict]:
         """Parse YAML frontmatter from markdown content."""
         pattern = r"^---\s*\n(.*?)\n---\s*\n"
@@ -0,0 +1,110 @@
+"""Tests for batch command."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from cli.commands.batch import _json_to_args, _parse_operations, _Pipeline
+from cli.config import Config
+from cli.main import cli
+
+
+@pytest.fixture
+def batch_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    config = Config(home / ".config" / "skillz" / "config.yaml")
+    config.set_repository_path(mock_repository)
+    return home
+
+
+class TestParseOperations:
+    """Tests for batch line parsing."""
+
+    def test_json_to_args(self):
+        """JSON operations map onto command arguments."""
+        args = _json_to_args(
+            {"op": "install", "name": "x", "platform": "codex", "force": True, "dry_run": False}
+        )
+        assert args == ["install", "x", "--platform", "codex", "--force"]
+
+    def test_parse_mixed_lines(self):
+        """Shell-style and JSON lines parse to the same parameters."""
+        lines = [
+            "# comment",
+            "",
+            "install sample-skill -p codex --force",
+            '{"op": "install", "name": "sample-skill", "platform": "codex", "force": true}',
+        ]
+        operations = _parse_operations(lines)
+        assert len(operations) == 2
+        assert operations[0]["line"] == 3
+        assert operations[0]["params"] == operations[1]["params"]
+        assert operations[0]["params"]["platform"] == "codex"
+
+    def test_parse_errors(self):
+        """Unknown operations, bad options and --help are reported per line."""
+        operations = _parse_operations(
+            ["frobnicate x", "install x --bogus", "{not json", "install --help"]
+        )
+        assert all("error" in op for op in operations)
+        assert "Unknown operation" in operations[0]["error"]
+        assert "--help is not supported" in operations[3]["error"]
+
+
+class TestBatchCommand:
+    """Tests for running batch files."""
+
+    def test_install_and_uninstall(self, batch_home):
+        """Operations share one pipeline and report per-operation results."""
+        ops = "\n".join(
+            [
+                "install sample-skill -p claude",
+                "install sample-command -p claude",
+                "install sample-skill -p claude",
+                "uninstall sample-command -p claude",
+                "install missing-item",
+            ]
+        )
+        result = CliRunner().invoke(cli, ["batch", "-", "--format", "json"], input=ops)
+
+        assert result.exit_code == 1
+        report = json.loads(result.output)
+        statuses = [r["status"] for r in report["results"]]
+        assert statuses == ["ok", "ok", "skipped", "ok", "error"]
+        assert report["summary"]["error"] == 1
+        assert (batch_home / ".claude" / "skills" / "sample-skill" / "SKILL.md").exists()
+        assert not (batch_home / ".claude" / "commands" / "sample-command.md").exists()
+
+    def test_pipeline_closes_installer(self, batch_home):
+        """The pipeline closes the state database it opened."""
+        with _Pipeline(Config()) as pipeline:
+            pipeline.installer.installed()
+            assert pipeline.installer.state._conn is not None
+        assert pipeline.installer.state._conn is None
+
+    def test_install_all_dry_run(self, batch_home):
+        """Dry run plans every item without touching the filesystem."""
+        result = CliRunner().invoke(
+            cli, ["batch", "-", "--format", "json", "--dry-run"], input="install --all -p codex\n"
+        )
+
+        assert result.exit_code == 0
+        report = json.loads(result.output)
+        assert {r["name"] for r in report["results"]} == {"sample-skill", "sample-command"}
+        assert report["summary"]["planned"] == 2
+        assert not (batch_home / ".codex").exists()
+
+    def test_uninstall_pattern_rejected(self, batch_home):
+        """Batch uninstalls take one exact name per line."""
+        result = CliRunner().invoke(
+            cli, ["batch", "-", "--format", "json"], input="uninstall 'sample-*' -p claude\n"
+        )
+
+        assert result.exit_code == 1
+        [entry] = json.loads(result.output)["results"]
+        assert entry["status"] == "error"
+        assert "exactly one NAME" in entry["message"]
@@ -0,0 +1,64 @@
+"""Tests for the benchmark suite."""
+
+from click.testing import CliRunner
+
+from benchmarks.generate import generate_repository
+from benchmarks.run import compare, main, run_benchmarks
+from cli.utils import find_command_files, find_skill_directories
+from cli.validator import SkillValidator
+
+
+class TestGenerateRepository:
+    """Tests for the synthetic repository generator."""
+
+    def test_generates_valid_nested_skills(self, temp_dir):
+        """Generated skills are nested by category and pass validation."""
+        summary = generate_repository(
+            temp_dir / "repo", skills=12, commands=3, categories=4, depth=2, references=2
+        )
+
+        skills = find_skill_directories(temp_dir / "repo" / "skills")
+        assert len(skills) == summary["skills"] == 12
+        assert len(find_command_files(temp_dir / "repo" / "commands")) == 3
+        assert len(skills[0].relative_to(temp_dir / "repo" / "skills").parts) == 3
+        assert len(list((skills[0] / "references").iterdir())) == 2
+        for skill_path in skills:
+            assert SkillValidator.validate_skill_directory(skill_path)[0]
+
+    def test_deterministic(self, temp_dir):
+        """The same seed produces identical content."""
+        generate_repository(temp_dir / "a", skills=2, commands=0, seed=7)
+        generate_repository(temp_dir / "b", skills=2, commands=0, seed=7)
+        relative = "skills/category-001/skill-00001/SKILL.md"
+        assert (temp_dir / "a" / relative).read_text() == (temp_dir / "b" / relative).read_text()
+
+
+class TestRunBenchmarks:
+    """Tests for the benchmark runner."""
+
+    def test_run_and_compare(self):
+        """Scenarios run end to end and regressions are detected."""
+        results = run_benchmarks([5], ["list", "export"], repeat=1, references=1, body_bytes=256)
+        scenarios = results["sizes"]["5"]["scenarios"]
+        assert set(scenarios) == {"list", "export"}
+        assert "render" in scenarios["export"]["phases"]
+
+        baseline = {
+            "sizes": {
+                "5": {
+                    "scenarios": {
+                        "list": {"median_ms": scenarios["list"]["median_ms"]},
+                        "export": {"median_ms": 0.001},
+                    }
+                }
+            }
+        }
+        rows = {row["scenario"]: row for row in compare(results, baseline, 0.25, 0.0)}
+        assert rows["list"]["regressed"] is False
+        assert rows["export"]["regressed"] is True
+
+    def test_missing_baseline(self, temp_dir):
+        """Without a baseline the regression check fails instead of passing silently."""
+        result = CliRunner().invoke(main, ["--baseline", str(temp_dir / "missing.json")])
+        assert result.exit_code == 2
+        assert "not found" in result.output
@@ -65,14 +65,15 @@ class TestConfig:
         claude_skills_dir = config.get_skills_dir("personal", "claude")
         assert ".claude/skills" in str(claude_skills_dir)
 
-    def test_get_skills_dir_project(self, temp_dir):
+    def test_get_skills_dir_project(self, temp_dir, monkeypatch):
         """Test getting project skills directory."""
+        monkeypatch.chdir(temp_dir)
         config_path = temp_dir / "config.yaml"
         config = Config(config_path)
 
-        # Default platform uses .opencode
+        # Default platform uses .opencode, relative to the project root
         skills_dir = config.get_skills_dir("project", "opencode")
-        assert skills_dir == Path(".opencode/skills")
+        assert skills_dir == Path.cwd() / ".opencode/skills"
 
     def test_get_commands_dir_personal(self, temp_dir, monkeypatch):
         """Test getting personal commands directory."""
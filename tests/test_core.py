@@ -0,0 +1,370 @@
+"""Tests for the embeddable core API."""
+
+import sys
+
+import pytest
+import yaml
+
+from cli.catalog import CommandRecord, SkillRecord
+from cli.config import Config
+from cli.core import AgentNotFoundError, Exporter, Installer, SkillRepository, SkillzError
+
+
+@pytest.fixture
+def home_config(temp_dir, monkeypatch):
+    """Config whose install locations live under a temporary HOME."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    return Config(home / ".config" / "skillz" / "config.yaml")
+
+
+class TestSkillRepository:
+    """Tests for SkillRepository."""
+
+    def test_records(self, mock_repository):
+        """Skills and commands are returned as typed records."""
+        repository = SkillRepository(mock_repository)
+
+        skills = repository.skills()
+        assert skills == [repository.get("sample-skill")]
+        assert isinstance(skills[0], SkillRecord)
+        assert skills[0].description == "A sample skill for testing"
+        assert skills[0].allowed_tools == ["Read", "Write"]
+
+        command = repository.get("sample-command")
+        assert isinstance(command, CommandRecord)
+        assert repository.get("sample-command", item_type="skill") is None
+
+    def test_nested_category(self, mock_repository):
+        """Categories match a prefix of the path below skills/ or commands/."""
+        skill = mock_repository / "skills" / "data" / "ml" / "foo"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text("---\nname: foo\ndescription: Foo\n---\n")
+        (mock_repository / "commands" / "data" / "ml").mkdir(parents=True)
+        (mock_repository / "commands" / "data" / "ml" / "bar.md").write_text("# Bar\n")
+
+        repository = SkillRepository(mock_repository)
+        for category in ("data", "data/ml"):
+            assert [r.name for r in repository.skills(category)] == ["foo"]
+            assert [r.name for r in repository.commands(category)] == ["bar"]
+        assert repository.skills("data/web") == []
+        assert [r.name for r in repository.skills("sample")] == ["sample-skill"]
+
+    def test_record_layout(self, mock_repository):
+        """Records are slotted, support mapping access and load bodies lazily."""
+        record = SkillRepository(mock_repository).get("sample-skill")
+
+        assert not hasattr(record, "__dict__")
+        assert record["name"] == record.name == "sample-skill"
+        assert record["type"] == "skill"
+        assert record.get("missing", "default") == "default"
+        assert record.relpath == "skills/sample-skill"
+        assert record.location is sys.intern("repository")
+
+        assert record._body is None
+        assert record.body.lstrip().startswith("# Sample Skill")
+
+    def test_stats_and_lint(self, mock_repository):
+        """Skill statistics are computed once and checked against lint thresholds."""
+        references = mock_repository / "skills" / "sample-skill" / "references"
+        references.mkdir()
+        (references / "a.md").write_text("a" * 100)
+        (references / "b.md").write_text("b" * 100)
+
+        record = SkillRepository(mock_repository).get("sample-skill")
+        stats = record.stats
+        assert stats is record.stats
+        assert (stats.files, stats.references) == (3, 2)
+        assert stats.bytes == record.source_file.stat().st_size + 200
+        assert stats.body_tokens == -(-len(record.body) // 4)
+        assert SkillRepository(mock_repository).check(record) == []
+
+        lint = {"max_skill_bytes": 100, "max_body_tokens": 0, "max_references": 1}
+        issues = SkillRepository(mock_repository, lint=lint).check(record)
+        assert [(i.rule, i.severity, i.file) for i in issues] == [
+            ("skill-too-large", "warning", "skills/sample-skill/SKILL.md"),
+            ("too-many-references", "warning", "skills/sample-skill/SKILL.md"),
+        ]
+        assert SkillRepository(mock_repository, lint=lint).validate(record)[0] is True
+
+    def test_search(self, mock_repository):
+        """Search matches names and descriptions case-insensitively."""
+        repository = SkillRepository(mock_repository)
+        assert [r.name for r in repository.search("SAMPLE")] == ["sample-skill", "sample-command"]
+        assert [r.name for r in repository.search("sample", item_type="command")] == [
+            "sample-command"
+        ]
+
+    def test_validate_is_cached(self, mock_repository, monkeypatch):
+        """Validation results are reused until the file changes."""
+        repository = SkillRepository(mock_repository)
+        record = repository.get("sample-skill")
+        assert repository.validate(record) == (True, [])
+
+        calls = []
+        monkeypatch.setattr(
+            "cli.core.SkillValidator.validate_skill_directory",
+            lambda path: calls.append(path) or (True, []),
+        )
+        repository.validate(record)
+        assert calls == []
+
+    def test_from_config_requires_repository(self, home_config):
+        """A missing repository path raises SkillzError."""
+        with pytest.raises(SkillzError):
+            SkillRepository.from_config(home_config)
+
+
+class TestInstaller:
+    """Tests for Installer."""
+
+    def test_install_skip_and_force(self, mock_repository, home_config):
+        """Existing installs are skipped unless forced."""
+        with Installer(SkillRepository(mock_repository), home_config) as installer:
+            first = installer.install("sample-skill", platform="claude")
+            second = installer.install("sample-skill", platform="claude")
+            forced = installer.install("sample-skill", platform="claude", force=True)
+
+        assert first.status == "ok"
+        assert (first.path / "SKILL.md").exists()
+        assert second.status == "skipped"
+        assert forced.status == "ok"
+
+    def test_install_missing_and_invalid(self, mock_repository, home_config):
+        """Missing and invalid items report errors instead of raising."""
+        bad = mock_repository / "skills" / "bad-skill"
+        bad.mkdir()
+        (bad / "SKILL.md").write_text("# No frontmatter\n")
+
+        installer = Installer(SkillRepository(mock_repository), home_config)
+        missing = installer.install("does-not-exist")
+        invalid = installer.install("bad-skill")
+
+        assert missing.status == "error"
+        assert not missing.ok
+        assert invalid.status == "error"
+        assert invalid.errors
+        assert not invalid.path.exists()
+
+    def test_install_all_and_uninstall(self, mock_repository, home_config):
+        """install_all installs everything; uninstall removes items."""
+        with Installer(SkillRepository(mock_repository), home_config) as installer:
+            results = installer.install_all(platform="codex")
+            assert [(r.type, r.name, r.status) for r in results] == [
+                ("skill", "sample-skill", "ok"),
+                ("command", "sample-command", "ok"),
+            ]
+
+            planned = installer.uninstall("sample-command", platform="codex", dry_run=True)
+            assert planned.status == "planned"
+            assert planned.path.exists()
+
+            removed = installer.uninstall("sample-command", platform="codex")
+            assert removed.status == "ok"
+            assert not removed.path.exists()
+            assert installer.uninstall("sample-command", platform="codex").status == "error"
+
+
+class TestExporter:
+    """Tests for Exporter."""
+
+    def _write_agents(self, repo_path):
+        agents_dir = repo_path / ".ai" / "agents"
+        agents_dir.mkdir(parents=True)
+        agents = {"agents": [{"id": "default", "name": "Default Agent", "role": "r"}]}
+        (agents_dir / "agents.yaml").write_text(yaml.safe_dump(agents))
+
+    def test_export_writes_file(self, mock_repository, temp_dir):
+        """Export renders the repository's skills into the output file."""
+        self._write_agents(mock_repository)
+        exporter = Exporter(SkillRepository(mock_repository))
+
+        result = exporter.export("codex", output=temp_dir / "AGENTS.md")
+        content = result.path.read_text()
+        assert result.bytes == len(content)
+        assert "Default Agent" in content
+        assert "skills/sample-skill" in content
+
+    def test_incremental_export(self, mock_repository, temp_dir):
+        """Unchanged inputs skip rendering; frontmatter changes regenerate."""
+        self._write_agents(mock_repository)
+        output = temp_dir / "AGENTS.md"
+        cache_dir = temp_dir / "cache"
+
+        assert (
+            Exporter(SkillRepository(mock_repository), cache_dir)
+            .export("codex", output=output)
+            .changed
+        )
+        assert (cache_dir / "export.json").exists()
+
+        exporter = Exporter(SkillRepository(mock_repository), cache_dir)
+        exporter.payload = None  # a fresh cache hit must not render
+        assert not exporter.export("codex", output=output).changed
+        assert exporter.is_current("codex", output=output)
+
+        skill_md = mock_repository / "skills" / "sample-skill" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text().replace("A sample skill", "An updated skill"))
+        exporter = Exporter(SkillRepository(mock_repository), cache_dir)
+        assert not exporter.is_current("codex", output=output)
+        assert exporter.export("codex", output=output).changed
+        assert "An updated skill" in output.read_text()
+
+    def test_unchanged_content_is_not_rewritten(self, mock_repository, temp_dir):
+        """Without a cache, identical content still leaves the file untouched."""
+        self._write_agents(mock_repository)
+        output = temp_dir / "AGENTS.md"
+        Exporter(SkillRepository(mock_repository)).export("codex", output=output)
+        mtime = output.stat().st_mtime_ns
+
+        result = Exporter(SkillRepository(mock_repository)).export("codex", output=output)
+        assert not result.changed
+        assert output.stat().st_mtime_ns == mtime
+
+    def test_export_many(self, mock_repository):
+        """All platforms and agents are exported, with suffixed paths per agent."""
+        agents_dir = mock_repository / ".ai" / "agents"
+        agents_dir.mkdir(parents=True)
+        agents = {
+            "agents": [
+                {"id": "default", "name": "Default Agent", "role": "r"},
+                {"id": "review", "name": "Review Agent", "role": "r"},
+            ]
+        }
+        (agents_dir / "agents.yaml").write_text(yaml.safe_dump(agents))
+        exporter = Exporter(SkillRepository(mock_repository))
+
+        results = exporter.export_many(["codex", "gemini", "copilot"], exporter.agent_ids())
+
+        paths = [r.path.relative_to(mock_repository).as_posix() for r in results]
+        assert paths == [
+            "AGENTS.md",
+            "GEMINI.md",
+            ".github/copilot-instructions.md",
+            "AGENTS.review.md",
+            "GEMINI.review.md",
+            ".github/copilot-instructions.review.md",
+        ]
+        assert all(r.changed for r in results)
+        assert "Review Agent" in (mock_repository / "GEMINI.review.md").read_text()
+        assert not list(mock_repository.glob(".*.tmp"))
+
+    def test_failed_render_keeps_outputs(self, mock_repository, temp_dir, monkeypatch):
+        """A renderer failure leaves existing outputs and no temporary files behind."""
+        self._write_agents(mock_repository)
+        output = temp_dir / "AGENTS.md"
+        output.write_text("previous")
+
+        def fail(out, platform, payload):
+            out.write("partial")
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr("cli.core._write_platform", fail)
+        with pytest.raises(RuntimeError):
+            Exporter(SkillRepository(mock_repository)).export("codex", output=output)
+        assert output.read_text() == "previous"
+        assert not list(temp_dir.glob(".*.tmp"))
+
+    def test_sharded_export(self, mock_repository, temp_dir):
+        """Sharded exports write a category index plus one file per category."""
+        self._write_agents(mock_repository)
+        nested = mock_repository / "skills" / "data" / "csv-tools"
+        nested.mkdir(parents=True)
+        (nested / "SKILL.md").write_text("---\nname: csv-tools\ndescription: CSV help\n---\n")
+        cache_dir = temp_dir / "cache"
+        output = mock_repository / "AGENTS.md"
+
+        exporter = Exporter(SkillRepository(mock_repository), cache_dir, shard_by="category")
+        result = exporter.export("codex")
+
+        assert [p.name for p in result.shards] == ["data.md", "general.md"]
+        root = output.read_text()
+        assert "`AGENTS/data.md`" in root
+        assert "csv-tools" not in root
+        assert "CSV help" in (mock_repository / "AGENTS" / "data.md").read_text()
+        assert exporter.is_current("codex")
+
+        Exporter(SkillRepository(mock_repository), cache_dir).export("codex")
+        assert "csv-tools" in output.read_text()
+        assert not (mock_repository / "AGENTS").exists()
+
+    def test_custom_template(self, mock_repository, temp_dir):
+        """Custom templates render the payload and are compiled into the cache."""
+        pytest.importorskip("jinja2")
+        self._write_agents(mock_repository)
+        templates = mock_repository / ".ai" / "templates"
+        templates.mkdir()
+        (templates / "brief.j2").write_text(
+            "# {{ agent.name }} for {{ platform }}\n"
+            "{% for skill in skills %}- {{ skill.name }}\n{% endfor %}"
+        )
+        cache_dir = temp_dir / "cache"
+        output = temp_dir / "BRIEF.md"
+
+        exporter = Exporter(SkillRepository(mock_repository), cache_dir, template="brief")
+        result = exporter.export("codex", output=output)
+        assert output.read_text() == "# Default Agent for codex\n- sample-skill\n"
+        assert list((cache_dir / "templates").iterdir())
+        assert exporter.is_current("codex", output=output)
+
+        (templates / "brief.j2").write_text("{{ agent.id }}\n")
+        exporter = Exporter(SkillRepository(mock_repository), cache_dir, template="brief")
+        assert not exporter.is_current("codex", output=output)
+        assert exporter.export("codex", output=output).changed
+        assert result.path.read_text() == "default\n"
+
+        with pytest.raises(SkillzError, match="not found"):
+            Exporter(SkillRepository(mock_repository), template="nope").render("codex")
+
+    def test_template_body_changes(self, mock_repository, temp_dir):
+        """Templates see bodies, so editing a body makes their output stale."""
+        pytest.importorskip("jinja2")
+        self._write_agents(mock_repository)
+        templates = mock_repository / ".ai" / "templates"
+        templates.mkdir()
+        template = "{% for skill in skills %}{{ skill.body }}{% endfor %}"
+        (templates / "bodies.j2").write_text(template)
+        cache_dir = temp_dir / "cache"
+        output = temp_dir / "BODIES.md"
+
+        Exporter(SkillRepository(mock_repository), cache_dir, template="bodies").export(
+            "codex", output=output
+        )
+        skill_md = mock_repository / "skills" / "sample-skill" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text() + "\nNew paragraph.\n")
+
+        exporter = Exporter(SkillRepository(mock_repository), cache_dir, template="bodies")
+        assert not exporter.is_current("codex", output=output)
+        assert exporter.export("codex", output=output).changed
+        assert "New paragraph." in output.read_text()
+
+    def test_up_to_date_keeps_elisions(self, mock_repository, temp_dir):
+        """An up-to-date export reports the same elided items as the run that wrote it."""
+        self._write_agents(mock_repository)
+        skill_md = mock_repository / "skills" / "sample-skill" / "SKILL.md"
+        skill_md.write_text(f"---\nname: sample-skill\ndescription: {'word ' * 200}\n---\n")
+        cache_dir = temp_dir / "cache"
+        output = temp_dir / "AGENTS.md"
+
+        def export():
+            exporter = Exporter(SkillRepository(mock_repository), cache_dir, token_budget=300)
+            return exporter.export("codex", output=output)
+
+        first = export()
+        assert [elision.name for elision in first.elided] == ["sample-skill"]
+        second = export()
+        assert not second.changed
+        assert second.elided == first.elided
+
+    def test_unknown_agent(self, mock_repository):
+        """Unknown agents raise AgentNotFoundError listing available agents."""
+        self._write_agents(mock_repository)
+        with pytest.raises(AgentNotFoundError) as excinfo:
+            Exporter(SkillRepository(mock_repository)).render("codex", agent="nope")
+        assert excinfo.value.available == ["default"]
+
+    def test_missing_agents_yaml(self, mock_repository):
+        """A repository without agents.yaml raises SkillzError."""
+        with pytest.raises(SkillzError):
+            Exporter(SkillRepository(mock_repository)).render("codex")
@@ -6,11 +6,16 @@ from pathlib import Path
 import pytest
 import yaml
 
-from cli.commands.export import (
+from cli.catalog import SkillRecord
+from cli.rendering import (
+    _build_payload,
     _discover_commands,
     _discover_skills,
+    _estimate_tokens,
     _find_agent,
+    _fit_token_budget,
     _get_default_output_path,
+    _render_platform,
     _render_template,
 )
 
@@ -392,6 +397,58 @@ description: Test skill {name}
         assert "commands/cmd1.md" in content
 
 
+class TestTokenBudget:
+    """Tests for token-budgeted export."""
+
+    def _payload(self, weights=None):
+        agent_config = {"id": "test", "name": "Test", "role": "r"}
+        agents_config = {
+            "roles": {"r": {"default-capabilities": ["data"]}},
+            "capabilities": {"data": {"description": "Data work"}},
+            "export-weights": weights or {},
+        }
+        skills = [
+            SkillRecord(
+                f"skill-{i:02d}",
+                f"Description of skill {i} " * 5,
+                Path(f"skills/{category}/skill-{i:02d}"),
+                f"skills/{category}/skill-{i:02d}",
+                category=category,
+            )
+            for i, category in enumerate(["data", "docs", "misc"] * 10)
+        ]
+        return _build_payload(agent_config, agents_config, "", "", skills, [])
+
+    def test_fits_budget_and_prefers_weighted_items(self):
+        """Output fits the budget; capability and per-item weights are kept first."""
+        payload = self._payload({"items": {"skill-01": 100}})
+        fitted, elided = _fit_token_budget(payload, "codex", 1500)
+
+        content = _render_platform("codex", fitted)
+        assert _estimate_tokens(content) <= 1500
+        kept = [skill.name for skill in fitted["skills"]]
+        assert kept == sorted(kept)
+        assert elided
+
+        data_skills = {s.name for s in payload["skills"] if s.category == "data"}
+        elided_names = {e.name for e in elided}
+        assert not elided_names & (data_skills | {"skill-01"})
+        dropped = {e.name for e in elided if e.action == "dropped"}
+        assert not dropped & set(kept)
+
+    def test_budget_smaller_than_fixed_sections(self):
+        """A budget that cannot hold identity and policies is rejected."""
+        with pytest.raises(ValueError, match="smaller than the fixed sections"):
+            _fit_token_budget(self._payload(), "copilot", 10)
+
+    def test_large_budget_elides_nothing(self):
+        """Nothing is elided when everything fits."""
+        payload = self._payload()
+        fitted, elided = _fit_token_budget(payload, "gemini", 100000)
+        assert elided == []
+        assert fitted["skills"] == payload["skills"]
+
+
 @pytest.fixture
 def mock_agents_yaml(temp_dir):
     """Create a mock agents.yaml file."""
@@ -0,0 +1,108 @@
+"""Tests for garbage collection of installed items."""
+
+import pytest
+from click.testing import CliRunner
+
+from cli.config import Config
+from cli.core import SkillRepository
+from cli.gc import DUPLICATE, ORPHAN, RENAMED, find_garbage
+from cli.locations import install_locations
+from cli.main import cli
+from cli.state import InstallState
+
+
+@pytest.fixture
+def gc_home(temp_dir, mock_repository, monkeypatch):
+    """Install the mock repository for claude and codex, then change the repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(temp_dir)
+    config = Config(home / ".config" / "skillz" / "config.yaml")
+    config.set_repository_path(mock_repository)
+    runner = CliRunner()
+    for platform in ("claude", "codex"):
+        assert runner.invoke(cli, ["install", "--all", "-p", platform]).exit_code == 0
+
+    # The repository renames the skill and drops the command
+    (mock_repository / "skills" / "sample-skill").rename(mock_repository / "skills" / "new-skill")
+    (mock_repository / "commands" / "sample-command.md").unlink()
+    assert runner.invoke(cli, ["install", "new-skill", "-p", "claude"]).exit_code == 0
+
+    # A skill written by hand, which skillz never installed
+    private = config.get_skills_dir("personal", "claude") / "my-private-skill"
+    private.mkdir()
+    (private / "SKILL.md").write_text("---\nname: my-private-skill\ndescription: Mine\n---\n")
+    return config
+
+
+class TestFindGarbage:
+    """Tests for find_garbage."""
+
+    def test_reasons(self, gc_home, mock_repository):
+        """Orphans, renamed items and duplicates are told apart by content."""
+        repository = SkillRepository(mock_repository)
+        catalogs = install_locations(gc_home, ["personal"], ["claude", "codex"])
+        state = InstallState(gc_home.get_state_path())
+        state.reconcile_all(catalogs)
+        installed = state.items(catalogs)
+
+        garbage = find_garbage(
+            repository.skills() + repository.commands(), installed, is_managed=state.is_managed
+        )
+        state.close()
+        found = {
+            (item.record.location, item.record.name): (item.reason, item.replacement, item.managed)
+            for item in garbage
+        }
+        assert found == {
+            ("personal/claude", "sample-skill"): (DUPLICATE, "new-skill", True),
+            ("personal/claude", "sample-command"): (ORPHAN, None, True),
+            ("personal/claude", "my-private-skill"): (ORPHAN, None, False),
+            ("personal/codex", "sample-skill"): (RENAMED, "new-skill", True),
+            ("personal/codex", "sample-command"): (ORPHAN, None, True),
+        }
+
+    def test_repository_items_kept(self, mock_repository):
+        """Items the repository has are never garbage."""
+        repository = SkillRepository(mock_repository)
+        records = repository.skills() + repository.commands()
+        assert find_garbage(records, records) == []
+
+
+class TestGcCommand:
+    """Tests for skillz gc."""
+
+    def test_dry_run_lists(self, gc_home):
+        """--dry-run lists the garbage of every platform and removes nothing."""
+        result = CliRunner().invoke(cli, ["gc", "--dry-run"])
+        assert result.exit_code == 0
+        assert "duplicate of" in result.output
+        assert "renamed to new-skill" in result.output
+        assert "Kept 1 item(s) skillz did not install" in result.output
+        assert "Would reclaim" in result.output
+        assert (gc_home.get_commands_dir("personal", "codex") / "sample-command.md").exists()
+
+    def test_removes_garbage(self, gc_home):
+        """Garbage is removed after one confirmation; repository and hand-made items stay."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["gc"], input="y\n")
+        assert result.exit_code == 0
+        assert "Removed 4 item(s)" in result.output
+        claude_skills = gc_home.get_skills_dir("personal", "claude")
+        assert sorted(path.name for path in claude_skills.iterdir()) == [
+            "my-private-skill",
+            "new-skill",
+        ]
+        assert not (gc_home.get_commands_dir("personal", "codex") / "sample-command.md").exists()
+
+        result = runner.invoke(cli, ["gc", "--platform", "codex"])
+        assert "Nothing to collect in 0 installed item(s)" in result.output
+
+    def test_unmanaged(self, gc_home):
+        """--unmanaged removes items skillz did not install too."""
+        result = CliRunner().invoke(cli, ["gc", "--unmanaged", "--force"])
+        assert result.exit_code == 0
+        assert "Removed 5 item(s)" in result.output
+        claude_skills = gc_home.get_skills_dir("personal", "claude")
+        assert [path.name for path in claude_skills.iterdir()] == ["new-skill"]
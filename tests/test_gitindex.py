@@ -0,0 +1,163 @@
+"""Tests for git-backed catalog discovery."""
+
+import shutil
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from cli.config import Config
+from cli.core import SkillRepository
+from cli.gitindex import GitIndex
+from cli.main import cli
+from cli.utils import find_command_files, find_skill_directories
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _write_skill(repo, name, description="A skill"):
+    skill = repo / "skills" / name
+    skill.mkdir(parents=True, exist_ok=True)
+    (skill / "SKILL.md").write_text(f"---\nname: {name}\ndescription: {description}\n---\n")
+
+
+@pytest.fixture
+def git_repository(temp_dir):
+    """A committed repository with five skills and two commands."""
+    repo = temp_dir / "repo"
+    for name in ("one", "two", "three", "four", "five"):
+        _write_skill(repo, name)
+    (repo / "commands" / "tools").mkdir(parents=True)
+    (repo / "commands" / "build.md").write_text("---\ndescription: Build\n---\n")
+    (repo / "commands" / "tools" / "lint.md").write_text("---\ndescription: Lint\n---\n")
+    _git(repo, "init", "-q")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+def _walk(repo):
+    return find_skill_directories(repo / "skills"), find_command_files(repo / "commands")
+
+
+class TestGitIndex:
+    """Tests for GitIndex."""
+
+    def test_first_scan_walks(self, git_repository, temp_dir):
+        """Without saved state the trees are walked; afterwards nothing is re-checked."""
+        path = temp_dir / "cache" / "catalog-git.json"
+        index = GitIndex(git_repository, path)
+        assert index.scan() == _walk(git_repository)
+        assert index.changed is None
+        index.save()
+
+        index = GitIndex(git_repository, path)
+        assert index.scan() == _walk(git_repository)
+        assert index.changed == []
+
+    def test_commit_rechecks_changed_paths(self, git_repository, temp_dir):
+        """A commit touching three skills re-checks only their files."""
+        path = temp_dir / "cache" / "catalog-git.json"
+        index = GitIndex(git_repository, path)
+        index.scan()
+        index.save()
+
+        _write_skill(git_repository, "one", "Changed")
+        shutil.rmtree(git_repository / "skills" / "two")
+        _write_skill(git_repository, "six")
+        _git(git_repository, "add", "-A")
+        _git(git_repository, "commit", "-q", "-m", "update")
+
+        index = GitIndex(git_repository, path)
+        assert index.scan() == _walk(git_repository)
+        assert index.changed == [
+            "skills/one/SKILL.md",
+            "skills/six/SKILL.md",
+            "skills/two/SKILL.md",
+        ]
+        assert index.state["dirty"] == []
+
+    def test_working_tree_changes(self, git_repository):
+        """Untracked and deleted files are seen before and after they are committed."""
+        index = GitIndex(git_repository)
+        index.scan()
+
+        _write_skill(git_repository, "untracked")
+        (git_repository / "commands" / "build.md").unlink()
+        assert index.scan() == _walk(git_repository)
+        assert index.changed == ["commands/build.md", "skills/untracked/SKILL.md"]
+
+        _git(git_repository, "add", "-A")
+        _git(git_repository, "commit", "-q", "-m", "commit")
+        assert index.scan() == _walk(git_repository)
+        assert index.changed == ["commands/build.md", "skills/untracked/SKILL.md"]
+        assert index.scan() == _walk(git_repository)
+        assert index.changed == []
+
+    def test_unknown_tree_walks(self, git_repository):
+        """Saved trees git no longer has cause a full walk."""
+        index = GitIndex(git_repository)
+        index.scan()
+        index.state["trees"]["skills"] = "0" * 40
+        _write_skill(git_repository, "new")
+        assert index.scan() == _walk(git_repository)
+        assert index.changed is None
+
+    def test_not_a_checkout(self, mock_repository):
+        """Outside a git checkout there is nothing to scan."""
+        assert GitIndex(mock_repository).scan() is None
+
+
+class TestRepositoryIndex:
+    """Tests for catalogs discovered through the git index."""
+
+    def test_refresh_after_pull(self, git_repository, temp_dir):
+        """Refreshing a repository picks up committed changes."""
+        repository = SkillRepository(git_repository, cache_dir=temp_dir / "cache")
+        assert [record.name for record in repository.skills()] == [
+            "five",
+            "four",
+            "one",
+            "three",
+            "two",
+        ]
+        repository.save_cache()
+        assert (temp_dir / "cache" / "catalog-git.json").exists()
+
+        _write_skill(git_repository, "one", "Changed")
+        _git(git_repository, "commit", "-q", "-am", "update")
+        repository = SkillRepository(git_repository, cache_dir=temp_dir / "cache")
+        assert repository.get("one").description == "Changed"
+        assert repository.index.changed == ["skills/one/SKILL.md"]
+
+    def test_not_a_checkout_walks(self, mock_repository, temp_dir):
+        """Repositories outside git are walked as before."""
+        repository = SkillRepository(mock_repository, cache_dir=temp_dir / "cache")
+        assert [record.name for record in repository.skills()] == ["sample-skill"]
+        assert repository.catalog.index is None
+
+    @pytest.mark.parametrize(
+        "args", [["list", "--source", "repository"], ["search", "one"], ["validate"]]
+    )
+    def test_commands_save_index(self, args, git_repository, temp_dir, monkeypatch):
+        """Catalog commands discover items through the index and save it."""
+        home = temp_dir / "home"
+        home.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(temp_dir)
+        config = Config(home / ".config" / "skillz" / "config.yaml")
+        config.set_repository_path(git_repository)
+
+        # validate exits with 1 for the empty commands of the fixture
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code in (0, 1), result.output
+        assert (config.get_cache_dir() / "catalog-git.json").exists()
@@ -0,0 +1,73 @@
+"""Tests for info command."""
+
+import pytest
+from click.testing import CliRunner
+
+from cli.commands.info import _scan_tree
+from cli.config import Config
+from cli.main import cli
+
+
+@pytest.fixture
+def info_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(mock_repository)
+    skill_dir = mock_repository / "skills" / "long-skill"
+    (skill_dir / "references" / "api").mkdir(parents=True)
+    body = "\n".join(f"line {i}" for i in range(100))
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: long-skill\ndescription: Long\n---\n{body}\n"
+        "See [the API](references/api/calls.md).\n"
+    )
+    (skill_dir / "references" / "api" / "calls.md").write_text("x" * 300)
+    (skill_dir / "references" / "notes.md").write_text("x" * 200)
+    return home
+
+
+class TestScanTree:
+    """Tests for _scan_tree."""
+
+    def test_nested_rows_and_index(self, info_home, mock_repository):
+        """Directories precede their contents and are sized by them."""
+        rows, index = _scan_tree(mock_repository / "skills" / "long-skill")
+        names = [(depth, name, is_dir) for depth, name, _, is_dir in rows]
+        assert names == [
+            (0, "SKILL.md", False),
+            (0, "references", True),
+            (1, "api", True),
+            (2, "calls.md", False),
+            (1, "notes.md", False),
+        ]
+        assert [size for _, _, size, _ in rows[1:]] == [500, 300, 300, 200]
+        assert "references/api/calls.md" in index
+
+
+class TestInfoCommand:
+    """Tests for skillz info."""
+
+    def test_tree_and_validation(self, info_home):
+        """Nested files are listed and links resolve against the same scan."""
+        result = CliRunner().invoke(cli, ["info", "long-skill"])
+        assert result.exit_code == 0
+        assert "✓ Valid" in result.output
+        assert "calls.md" in result.output
+        assert "(72 more lines)" in result.output
+
+    def test_lines(self, info_home):
+        """--lines prints the start of the body as plain text."""
+        result = CliRunner().invoke(cli, ["info", "long-skill", "--lines", "3"])
+        assert result.exit_code == 0
+        assert "line 0\nline 1\nline 2\n" in result.output
+        assert "line 3" not in result.output
+        assert "(99 more lines)" in result.output
+
+    def test_pager(self, info_home):
+        """--pager outputs the whole file."""
+        result = CliRunner().invoke(cli, ["info", "sample-command", "--pager"])
+        assert result.exit_code == 0
+        assert "---\ndescription: A sample command for testing\n---\n\n# Sample Command\n" in (
+            result.output
+        )
@@ -0,0 +1,85 @@
+"""Tests for install location scanning."""
+
+import threading
+
+import pytest
+from click.testing import CliRunner
+
+from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.locations import find_installed, install_locations, probe
+from cli.main import cli
+
+
+@pytest.fixture
+def locations_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(temp_dir)
+    config = Config(home / ".config" / "skillz" / "config.yaml")
+    config.set_repository_path(mock_repository)
+    return config
+
+
+class TestInstallLocations:
+    """Tests for install_locations, probe and find_installed."""
+
+    def test_locations(self, locations_home):
+        """Personal locations are per platform; the shared project location is listed once."""
+        locations = [catalog.location for catalog in install_locations(locations_home)]
+        assert locations == [
+            "personal/opencode",
+            "personal/claude",
+            "personal/codex",
+            "personal/gemini",
+            "personal/copilot",
+            "personal/mcp",
+            "project",
+        ]
+        [catalog] = install_locations(locations_home, ["project"], ["claude"])
+        assert catalog.location == "project/claude"
+
+    def test_probe_is_concurrent(self, locations_home):
+        """Every location is probed at the same time."""
+        catalogs = install_locations(locations_home)
+        barrier = threading.Barrier(len(catalogs), timeout=5)
+        assert probe(catalogs, lambda catalog: barrier.wait() >= 0) == [True] * len(catalogs)
+
+    def test_find_installed(self, locations_home, mock_repository):
+        """Matches from every location are merged, with their provenance."""
+        with Installer(SkillRepository(mock_repository), locations_home) as installer:
+            installer.install("sample-skill", platform="codex")
+            installer.install("sample-skill", target="project")
+            installer.install("sample-command", platform="mcp")
+
+        found = find_installed(install_locations(locations_home), "sample-skill")
+        assert [(item.location, item.type) for item in found] == [
+            ("personal/codex", "skill"),
+            ("project", "skill"),
+        ]
+        [command] = find_installed(install_locations(locations_home), "sample-command")
+        assert command.path.name == "sample-command.md"
+
+
+class TestCommands:
+    """Tests for list and info across platforms."""
+
+    def test_list_all_platforms(self, locations_home):
+        """list --platform all shows items from every platform."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "sample-skill", "--platform", "gemini"])
+        runner.invoke(cli, ["install", "sample-command", "--platform", "opencode"])
+        result = runner.invoke(cli, ["list", "--source", "installed", "--platform", "all"])
+        assert result.exit_code == 0
+        assert "personal/gemini" in result.output
+        assert "personal/opencode" in result.output
+
+    def test_info_installed(self, locations_home):
+        """info --source installed finds items of any platform."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "sample-skill", "--platform", "codex"])
+        result = runner.invoke(cli, ["info", "sample-skill", "--source", "installed"])
+        assert result.exit_code == 0
+        assert "Installed in: personal/codex (skill)" in result.output
@@ -0,0 +1,91 @@
+"""Tests for profiling module."""
+
+import json
+
+from click.testing import CliRunner
+
+from cli.main import cli
+from cli.profiling import Profiler, profiler
+
+
+class TestProfiler:
+    """Tests for Profiler."""
+
+    def test_disabled_records_nothing(self):
+        """Spans and counters are no-ops until enabled."""
+        prof = Profiler()
+        with prof.span("discovery"):
+            pass
+        prof.count("copy", files=1, bytes=10)
+        assert prof.summary() == []
+
+    def test_summary_aggregates_phases(self):
+        """Summary aggregates calls, files and bytes per phase."""
+        prof = Profiler()
+        prof.enable()
+        for _ in range(3):
+            with prof.span("validation"):
+                pass
+        prof.count("copy", files=2, bytes=100)
+        prof.count("copy", files=1, bytes=50)
+
+        summary = {phase["name"]: phase for phase in prof.summary()}
+        assert summary["validation"]["calls"] == 3
+        assert summary["copy"]["files"] == 3
+        assert summary["copy"]["bytes"] == 150
+
+    def test_timed_decorator(self):
+        """Decorated functions record one span per call."""
+        prof = Profiler()
+        prof.enable()
+
+        @prof.timed("render")
+        def render(value):
+            return value * 2
+
+        assert render(2) == 4
+        assert prof.summary()[0]["calls"] == 1
+
+    def test_chrome_trace_format(self):
+        """Chrome trace contains complete events for spans."""
+        prof = Profiler()
+        prof.enable()
+        with prof.span("config", path="x"):
+            pass
+        trace = prof.chrome_trace()
+        event = trace["traceEvents"][0]
+        assert event["ph"] == "X"
+        assert event["name"] == "config"
+        assert event["args"] == {"path": "x"}
+
+
+class TestProfileOptions:
+    """Tests for the global --timings and --trace options."""
+
+    def test_timings_summary(self, temp_dir, monkeypatch):
+        """--timings prints a per-phase summary when the command finishes."""
+        monkeypatch.setenv("HOME", str(temp_dir))
+        try:
+            result = CliRunner().invoke(cli, ["--timings", "list", "--source", "installed"])
+        finally:
+            profiler.enabled = False
+            profiler.reset()
+
+        assert result.exit_code == 0
+        assert "Timings (" in result.output
+
+    def test_trace_env_var_writes_file(self, temp_dir, mock_repository, monkeypatch):
+        """SKILLZ_TRACE writes a Chrome trace for the command."""
+        monkeypatch.setenv("HOME", str(temp_dir))
+        trace_file = temp_dir / "trace.json"
+        try:
+            result = CliRunner().invoke(
+                cli, ["list", "--source", "installed"], env={"SKILLZ_TRACE": str(trace_file)}
+            )
+        finally:
+            profiler.enabled = False
+            profiler.reset()
+
+        assert result.exit_code == 0
+        names = {e["name"] for e in json.loads(trace_file.read_text())["traceEvents"]}
+        assert "config" in names
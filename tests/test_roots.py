@@ -0,0 +1,91 @@
+"""Tests for project and repository root resolution."""
+
+import pytest
+from click.testing import CliRunner
+
+from cli import roots
+from cli.config import Config
+from cli.main import cli
+from cli.roots import RootResolver
+
+
+@pytest.fixture
+def checkout(temp_dir):
+    """A version-controlled project with nested subdirectories."""
+    root = temp_dir / "checkout"
+    (root / ".git").mkdir(parents=True)
+    (root / "pkg" / "a" / "deep").mkdir(parents=True)
+    (root / "pkg" / "b").mkdir(parents=True)
+    return root
+
+
+class TestRootResolver:
+    """Tests for RootResolver."""
+
+    def test_stops_at_vcs_root(self, checkout):
+        """The chain ends at the checkout root."""
+        chain = RootResolver().ancestors(checkout / "pkg" / "a" / "deep")
+        assert chain == (
+            checkout / "pkg" / "a" / "deep",
+            checkout / "pkg" / "a",
+            checkout / "pkg",
+            checkout,
+        )
+
+    def test_project_root(self, checkout):
+        """The nearest project marker wins over the checkout root."""
+        resolver = RootResolver()
+        assert resolver.project_root([".opencode/skills"], checkout / "pkg" / "a") == checkout
+        (checkout / "pkg" / ".opencode" / "skills").mkdir(parents=True)
+        assert RootResolver().project_root([".opencode/skills"], checkout / "pkg" / "a") == (
+            checkout / "pkg"
+        )
+
+    def test_outside_projects(self, temp_dir):
+        """Without markers the start directory is the project root."""
+        start = temp_dir / "loose"
+        start.mkdir()
+        assert RootResolver().project_root([".opencode/skills"], start) == start
+
+    def test_repository_not_found_above_checkout(self, temp_dir, checkout):
+        """A repository outside the checkout is not picked up."""
+        (temp_dir / "skills").mkdir()
+        (temp_dir / "commands").mkdir()
+        resolver = RootResolver()
+        assert resolver.repository_root(checkout / "pkg") is None
+        assert resolver.repository_root(temp_dir) == temp_dir
+
+    def test_memoized_per_directory(self, checkout, monkeypatch):
+        """Known parents are not probed again from a new subdirectory."""
+        resolver = RootResolver()
+        resolver.ancestors(checkout / "pkg" / "a" / "deep")
+
+        probed = []
+        is_vcs_root = roots._is_vcs_root
+        monkeypatch.setattr(
+            roots, "_is_vcs_root", lambda path: probed.append(path) or is_vcs_root(path)
+        )
+        assert resolver.ancestors(checkout / "pkg" / "b")[-1] == checkout
+        assert resolver.ancestors(checkout / "pkg" / "a" / "deep")[-1] == checkout
+        assert probed == [checkout / "pkg" / "b"]
+
+
+class TestProjectInstall:
+    """Tests for project-target commands run from subdirectories."""
+
+    def test_install_from_subdirectory(self, checkout, temp_dir, mock_repository, monkeypatch):
+        """Project installs land in the project root, not the working directory."""
+        home = temp_dir / "home"
+        home.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(checkout / "pkg" / "a")
+        Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(mock_repository)
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ["install", "sample-skill", "--target", "project"])
+        assert result.exit_code == 0
+        assert (checkout / ".opencode" / "skills" / "sample-skill" / "SKILL.md").exists()
+
+        monkeypatch.chdir(checkout / "pkg" / "b")
+        listing = runner.invoke(cli, ["list", "--source", "installed", "--target", "project"])
+        assert "sample-skill" in listing.output
@@ -0,0 +1,156 @@
+"""Tests for the section index and show command."""
+
+import pytest
+from click.testing import CliRunner
+
+from cli.buildcache import BuildCache
+from cli.catalog import Catalog
+from cli.config import Config
+from cli.core import SkillRepository, SkillzError
+from cli.main import cli
+from cli.sections import anchor, index_sections
+
+SKILL = """---
+name: writing
+description: Writing help
+---
+# Writing
+
+## Méthodes
+
+Intro.
+
+### Statistics
+
+Report p-values.
+
+```markdown
+# Not a heading
+```
+
+## Results
+
+Text.
+
+## Results
+"""
+
+
+@pytest.fixture
+def writing_skill(mock_repository):
+    """Add a skill with nested headings and a reference file."""
+    skill_dir = mock_repository / "skills" / "writing"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(SKILL)
+    (skill_dir / "references" / "methods.md").write_text("# Methods\n\n## Statistics\n\nMore.\n")
+    return skill_dir
+
+
+class TestIndexSections:
+    """Tests for index_sections."""
+
+    def test_anchor(self):
+        """Anchors follow GitHub's rules."""
+        assert anchor("Planning & Project Breakdown!") == "planning--project-breakdown"
+        assert anchor("Agile/Iterative (WBS)") == "agileiterative-wbs"
+
+    def test_spans(self, writing_skill):
+        """Sections end at the next heading of the same or a higher level."""
+        path = writing_skill / "SKILL.md"
+        data = path.read_bytes()
+        sections = index_sections(path)
+        assert [(s.level, s.anchor) for s in sections] == [
+            (1, "writing"),
+            (2, "méthodes"),
+            (3, "statistics"),
+            (2, "results"),
+            (2, "results-1"),
+        ]
+        writing, methods, statistics, _, last = sections
+        assert writing.end == len(data)
+        assert data[methods.start : methods.end].decode().startswith("## Méthodes\n")
+        assert data[methods.start : methods.end].decode().endswith("```\n\n")
+        assert statistics.end == methods.end
+        assert data[last.start :] == b"## Results\n"
+
+    def test_org_headings(self, temp_dir):
+        """Files without markdown headings are indexed by their org headings."""
+        path = temp_dir / "guide.md"
+        path.write_text("* Guide\n#+begin_src bash\n# comment\n#+end_src\n** Usage\n- item\n")
+        assert [(s.level, s.anchor, s.start) for s in index_sections(path)] == [
+            (1, "guide", 0),
+            (2, "usage", 45),
+        ]
+
+    def test_bullets_are_not_org_headings(self, temp_dir):
+        """Markdown bullets are only org headings in files with org evidence."""
+        path = temp_dir / "notes.md"
+        path.write_text("Some notes.\n\n* first point\n* second point\n")
+        assert index_sections(path) == []
+
+        path.write_text("#+TITLE: Notes\n* first point\n")
+        assert [s.anchor for s in index_sections(path)] == ["first-point"]
+        org = temp_dir / "notes.org"
+        org.write_text("* first point\n")
+        assert [s.anchor for s in index_sections(org)] == ["first-point"]
+
+
+class TestSections:
+    """Tests for catalog and repository section lookup."""
+
+    def test_index_order_and_cache(self, writing_skill, mock_repository, temp_dir, monkeypatch):
+        """SKILL.md is indexed first and cached indexes are reused."""
+        cache = BuildCache(temp_dir / "catalog.json")
+        index = Catalog(mock_repository, cache=cache).sections("writing")
+        assert list(index) == ["SKILL.md", "references/methods.md"]
+        cache.save()
+
+        def fail(path):
+            raise AssertionError("indexed again")
+
+        monkeypatch.setattr("cli.catalog.index_sections", fail)
+        cached = Catalog(mock_repository, cache=BuildCache(temp_dir / "catalog.json"))
+        assert cached.sections("writing") == index
+
+    def test_read_section(self, writing_skill, mock_repository):
+        """Sections are found by text or anchor, optionally within one file."""
+        repository = SkillRepository(mock_repository)
+        assert repository.read_section("writing", "Statistics") == (
+            "### Statistics\n\nReport p-values.\n\n```markdown\n# Not a heading\n```\n\n"
+        )
+        text = repository.read_section("writing", "statistics", "references/methods.md")
+        assert text == "## Statistics\n\nMore.\n"
+        assert repository.read_section("sample-command", "sample-command") == "# Sample Command\n"
+        with pytest.raises(SkillzError):
+            repository.read_section("writing", "missing")
+
+
+class TestShowCommand:
+    """Tests for skillz show."""
+
+    @pytest.fixture(autouse=True)
+    def home(self, temp_dir, mock_repository, writing_skill, monkeypatch):
+        """Point HOME at a temp dir with a config referencing the mock repository."""
+        home = temp_dir / "home"
+        home.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(mock_repository)
+
+    def test_show_section(self):
+        """skill#heading prints just that section."""
+        result = CliRunner().invoke(cli, ["show", "writing#results-1"])
+        assert result.exit_code == 0
+        assert result.output == "## Results\n"
+
+    def test_list_sections(self):
+        """Without a heading, the sections of a file are listed."""
+        result = CliRunner().invoke(cli, ["show", "writing/references/methods.md"])
+        assert result.exit_code == 0
+        assert "#statistics" in result.output
+        assert "SKILL.md" not in result.output
+
+    def test_missing(self):
+        """Unknown sections and files abort."""
+        runner = CliRunner()
+        assert runner.invoke(cli, ["show", "writing#nope"]).exit_code == 1
+        assert runner.invoke(cli, ["show", "writing/missing.md#methods"]).exit_code == 1
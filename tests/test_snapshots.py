@@ -0,0 +1,210 @@
+"""Tests for install snapshots and rollback."""
+
+import pytest
+from click.testing import CliRunner
+
+from cli import snapshots
+from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.integrity import MANIFEST
+from cli.main import cli
+
+
+@pytest.fixture
+def snapshot_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(temp_dir)
+    config = Config(home / ".config" / "skillz" / "config.yaml")
+    config.set_repository_path(mock_repository)
+    return config
+
+
+def _replace(path, text):
+    """Replace a file the way installs do, rather than editing the linked file in place."""
+    path.unlink()
+    path.write_text(text)
+
+
+class TestSnapshots:
+    """Tests for cli.snapshots."""
+
+    def test_take_links_files(self, temp_dir):
+        """Files are hardlinked into the store, with the records of the root."""
+        root = temp_dir / "skills"
+        store = temp_dir / "state" / "snapshots"
+        (root / "one" / "references").mkdir(parents=True)
+        (root / "one" / "SKILL.md").write_text("one")
+        (root / "one" / "references" / "data.bin").write_bytes(b"x" * 100_000)
+        records = {str(root): {"items": [["row"]], "files": []}, "elsewhere": {}}
+
+        snapshot = snapshots.take([root], "test", store, records)
+        saved = store / snapshot.id / "0"
+        for name in ("one/SKILL.md", "one/references/data.bin"):
+            assert (saved / name).stat().st_ino == (root / name).stat().st_ino
+        assert snapshot.records == {str(root): {"items": [["row"]], "files": []}}
+        assert not (temp_dir / snapshots.SNAPSHOT_DIR).exists()
+        assert snapshots.list_snapshots([root], store) == [snapshot]
+
+    def test_failure_keeps_other_snapshots(self, temp_dir, monkeypatch):
+        """Snapshots taken at the same instant get their own ids and survive a failed take."""
+        root = temp_dir / "skills"
+        store = temp_dir / "snapshots"
+        (root / "one").mkdir(parents=True)
+        (root / "one" / "SKILL.md").write_text("one")
+        monkeypatch.setattr(snapshots.time, "time", lambda: 1_000_000.0)
+        first = snapshots.take([root], "first", store)
+
+        def fail(source, dest):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(snapshots, "_save_tree", fail)
+        with pytest.raises(OSError):
+            snapshots.take([root], "second", store)
+        assert snapshots.list_snapshots([root], store) == [first]
+
+    def test_rollback_swaps_roots(self, temp_dir):
+        """Rollback renames the saved tree into place and can itself be undone."""
+        root = temp_dir / "commands"
+        store = temp_dir / "snapshots"
+        root.mkdir()
+        (root / "cmd.md").write_text("old")
+        snapshot = snapshots.take([root], "test", store)
+        saved_inode = (store / snapshot.id / "0").stat().st_ino
+        _replace(root / "cmd.md", "new")
+
+        undo = snapshots.rollback(snapshot, store)
+        assert (root / "cmd.md").read_text() == "old"
+        assert root.stat().st_ino == saved_inode
+        assert [s.id for s in snapshots.list_snapshots([root], store)] == [undo.id]
+
+        snapshots.rollback(undo, store)
+        assert (root / "cmd.md").read_text() == "new"
+
+    def test_same_names(self, temp_dir):
+        """Roots with the same name in different directories are kept apart."""
+        store = temp_dir / "snapshots"
+        roots = [temp_dir / platform / "skills" for platform in ("claude", "codex")]
+        for root in roots:
+            root.mkdir(parents=True)
+            (root / "owner").write_text(root.parent.name)
+        snapshot = snapshots.take(roots, "test", store)
+        for root in roots:
+            _replace(root / "owner", "changed")
+
+        snapshots.rollback(snapshot, store)
+        assert [(root / "owner").read_text() for root in roots] == ["claude", "codex"]
+
+    def test_other_filesystem(self, temp_dir, monkeypatch):
+        """Roots on another filesystem are saved next to them, ignored by git."""
+        root = temp_dir / "checkout" / ".opencode" / "skills"
+        store = temp_dir / "snapshots"
+        root.mkdir(parents=True)
+        (root / "SKILL.md").write_text("one")
+        monkeypatch.setattr(snapshots, "_device", lambda path: hash(path == store))
+
+        snapshot = snapshots.take([root], "test", store)
+        location = root.parent / snapshots.SNAPSHOT_DIR
+        assert (location / ".gitignore").read_text() == "*\n"
+        assert (location / snapshot.id / "0" / "SKILL.md").exists()
+        assert snapshots.list_snapshots([root], store) == [snapshot]
+
+    def test_absent_root(self, temp_dir):
+        """Rolling back to before a root existed removes it."""
+        root = temp_dir / "skills"
+        store = temp_dir / "snapshots"
+        snapshot = snapshots.take([root], "test", store)
+        (root / "new").mkdir(parents=True)
+        snapshots.rollback(snapshot, store)
+        assert not root.exists()
+
+    def test_prune(self, temp_dir):
+        """Only the newest snapshots are kept."""
+        root = temp_dir / "skills"
+        store = temp_dir / "snapshots"
+        root.mkdir()
+        taken = [snapshots.take([root], f"op {i}", store) for i in range(4)]
+        assert snapshots.prune([root], 2, store) == taken[1::-1]
+        assert [s.operation for s in snapshots.list_snapshots([root], store)] == ["op 3", "op 2"]
+
+
+class TestInstallerSnapshots:
+    """Tests for snapshots taken by bulk operations."""
+
+    def test_force_reinstall_keeps_snapshot_intact(self, snapshot_home, mock_repository):
+        """Reinstalling replaces files, so the snapshot keeps the old content."""
+        with Installer(SkillRepository(mock_repository), snapshot_home) as installer:
+            installer.install_all(platform="claude")
+            command = snapshot_home.get_commands_dir("personal", "claude") / "sample-command.md"
+            original = command.read_text()
+            command.write_text("local edit")
+
+            results = installer.install_all(platform="claude", force=True)
+            assert all(result.ok for result in results)
+            snapshot = installer.last_snapshot
+            assert command.read_text() == original
+
+            installer.rollback(snapshot)
+            assert command.read_text() == "local edit"
+            assert [r.name for r in installer.installed(platforms=["claude"])] == [
+                "sample-skill",
+                "sample-command",
+            ]
+
+    def test_rollback_restores_records(self, snapshot_home, mock_repository):
+        """Items put back by a rollback keep their install records and manifests."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "--all", "--platform", "claude"])
+        runner.invoke(cli, ["uninstall", "--all", "--force"])
+        result = runner.invoke(cli, ["rollback", "--platform", "claude", "--force"])
+        assert result.exit_code == 0
+
+        (mock_repository / "commands" / "sample-command.md").unlink()
+        result = runner.invoke(cli, ["gc", "--dry-run", "--platform", "claude"])
+        assert "sample-command" in result.output
+        assert "did not install" not in result.output
+
+        with Installer(SkillRepository(mock_repository), snapshot_home) as installer:
+            drifts = installer.verify(installer.installed(platforms=["claude"]))
+        assert [(drift.record.name, drift.baseline) for drift in drifts] == [
+            ("sample-skill", MANIFEST),
+            ("sample-command", MANIFEST),
+        ]
+        assert all(drift.ok for drift in drifts)
+
+    def test_disabled(self, snapshot_home, mock_repository):
+        """snapshot_keep 0 turns snapshots off."""
+        snapshot_home.config["snapshot_keep"] = 0
+        with Installer(SkillRepository(mock_repository), snapshot_home) as installer:
+            installer.install_all(platform="claude")
+            assert installer.last_snapshot is None
+
+
+class TestRollbackCommand:
+    """Tests for skillz rollback."""
+
+    def test_undo_uninstall_all(self, snapshot_home):
+        """Rolling back restores items removed by a bulk uninstall."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "--all", "--platform", "claude"])
+        result = runner.invoke(cli, ["uninstall", "--all", "--force"])
+        assert "Saved snapshot" in result.output
+
+        listing = runner.invoke(cli, ["rollback", "--list"])
+        assert "uninstall" in listing.output
+
+        result = runner.invoke(cli, ["rollback", "--platform", "claude"], input="y\n")
+        assert result.exit_code == 0
+        assert "Rolled back to snapshot" in result.output
+        listing = runner.invoke(cli, ["list", "--source", "installed", "--platform", "claude"])
+        assert "sample-skill" in listing.output
+
+    def test_unknown_snapshot(self, snapshot_home):
+        """Unknown ids abort."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "--all", "--platform", "claude"])
+        result = runner.invoke(cli, ["rollback", "nope", "--force"])
+        assert result.exit_code == 1
+        assert "Snapshot 'nope' not found" in result.output
@@ -0,0 +1,122 @@
+"""Tests for the installed-items database."""
+
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from cli.catalog import Catalog
+from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.locations import installed_catalog
+from cli.main import cli
+from cli.state import InstallState
+
+
+@pytest.fixture
+def state_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(temp_dir)
+    config = Config(home / ".config" / "skillz" / "config.yaml")
+    config.set_repository_path(mock_repository)
+    return config
+
+
+class TestInstallState:
+    """Tests for InstallState."""
+
+    def test_install_and_uninstall_update_rows(self, state_home, mock_repository, monkeypatch):
+        """Installer changes are recorded, and listings do not scan known locations."""
+        state = InstallState(state_home.get_state_path())
+        catalogs = [installed_catalog(state_home, "personal", "claude")]
+        assert state.items(catalogs) == []
+
+        with Installer(SkillRepository(mock_repository), state_home) as installer:
+            installer.install_all(platform="claude")
+            installer.uninstall("sample-command", platform="claude")
+
+        def fail(self):
+            raise AssertionError("install directory scanned")
+
+        monkeypatch.setattr(Catalog, "skill_records", fail)
+        [record] = state.items([installed_catalog(state_home, "personal", "claude")])
+        assert (record.type, record.name, record.location) == (
+            "skill",
+            "sample-skill",
+            "personal/claude",
+        )
+        assert record.description == "A sample skill for testing"
+        assert record.allowed_tools == ["Read", "Write"]
+        assert (record.path / "SKILL.md").exists()
+
+    def test_unknown_location_scanned_once(self, state_home, mock_repository):
+        """Items installed without skillz are found on first listing."""
+        skills_dir = state_home.get_skills_dir("personal", "codex")
+        skills_dir.mkdir(parents=True)
+        shutil.copytree(mock_repository / "skills" / "sample-skill", skills_dir / "sample-skill")
+
+        state = InstallState(state_home.get_state_path())
+        catalogs = [installed_catalog(state_home, "personal", "codex")]
+        assert [r.name for r in state.items(catalogs)] == ["sample-skill"]
+
+        shutil.rmtree(skills_dir / "sample-skill")
+        assert [r.name for r in state.items(catalogs)] == ["sample-skill"]
+        result = state.reconcile(catalogs[0])
+        assert result.removed == ("skill sample-skill",)
+        assert state.items(catalogs) == []
+
+    def test_nested_command_rows(self, state_home):
+        """Items found nested below an install directory are removed by path."""
+        commands_dir = state_home.get_commands_dir("personal", "claude")
+        (commands_dir / "tools").mkdir(parents=True)
+        (commands_dir / "tools" / "lint.md").write_text("---\ndescription: Lint\n---\n")
+
+        state = InstallState(state_home.get_state_path())
+        catalogs = [installed_catalog(state_home, "personal", "claude")]
+        [record] = state.items(catalogs)
+        assert record.path == commands_dir / "tools" / "lint.md"
+
+        state.remove(record.type, record.name, record.path)
+        assert state.items(catalogs) == []
+        state.close()
+
+    def test_project_locations_by_directory(
+        self, state_home, mock_repository, temp_dir, monkeypatch
+    ):
+        """Project installs in different directories are kept apart."""
+        project = temp_dir / "project"
+        project.mkdir()
+        monkeypatch.chdir(project)
+        with Installer(SkillRepository(mock_repository), state_home) as installer:
+            installer.install("sample-skill", target="project")
+        state = InstallState(state_home.get_state_path())
+        assert len(state.items([installed_catalog(state_home, "project", "claude")])) == 1
+
+        other = temp_dir / "other"
+        other.mkdir()
+        monkeypatch.chdir(other)
+        assert state.items([installed_catalog(state_home, "project", "claude")]) == []
+
+
+class TestListVerify:
+    """Tests for list --verify."""
+
+    def test_verify_reports_changes(self, state_home):
+        """--verify reconciles the database with directories changed by hand."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "sample-skill", "--platform", "claude"])
+        runner.invoke(cli, ["list", "--source", "installed", "--platform", "claude"])
+        shutil.rmtree(state_home.get_skills_dir("personal", "claude") / "sample-skill")
+
+        stale = runner.invoke(cli, ["list", "--source", "installed", "--platform", "claude"])
+        assert "sample-skill" in stale.output
+
+        result = runner.invoke(
+            cli, ["list", "--source", "installed", "--platform", "claude", "--verify"]
+        )
+        assert result.exit_code == 0
+        assert "Reconciled personal/claude: 0 added, 1 removed" in result.output
+        assert "No items found" in result.output
@@ -0,0 +1,110 @@
+"""Tests for repository statistics."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from cli.buildcache import BuildCache
+from cli.catalog import Catalog
+from cli.config import Config
+from cli.core import SkillRepository
+from cli.main import cli
+
+
+@pytest.fixture
+def stats_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(mock_repository)
+    skill_dir = mock_repository / "skills" / "data" / "csv-tools"
+    (skill_dir / "references").mkdir(parents=True)
+    (skill_dir / "SKILL.md").write_text(
+        "---\nname: csv-tools\ndescription: CSV help\nallowed-tools: [Read, Bash]\n---\n# CSV\n"
+    )
+    (skill_dir / "references" / "formats.md").write_text("x" * 5000)
+    return home
+
+
+class TestScanStats:
+    """Tests for Catalog.scan_stats."""
+
+    def test_matches_per_record_stats(self, stats_home, mock_repository):
+        """One walk gives the same stats as sizing each record on its own."""
+        scanned = Catalog(mock_repository)
+        largest = scanned.scan_stats(largest=1)
+
+        fresh = Catalog(mock_repository)
+        assert scanned.skills == fresh.skills
+        for record in scanned.skill_records() + scanned.command_records():
+            expected = fresh.get_skill(record.name) or fresh.get_command(record.name)
+            assert record.stats == expected.stats
+        assert scanned.get_skill("csv-tools").stats.references == 1
+        assert largest == [("skills/data/csv-tools/references/formats.md", 5000)]
+
+    def test_listing_reused_by_checks(self, stats_home, mock_repository, monkeypatch):
+        """Link checks use the listing of the scan instead of walking the skill again."""
+        skill_md = mock_repository / "skills" / "data" / "csv-tools" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text() + "See [formats](references/formats.md).\n")
+        repository = SkillRepository(mock_repository)
+        repository.catalog.scan_stats(largest=0)
+        record = repository.get("csv-tools")
+        assert record.listing == {
+            "SKILL.md": skill_md.stat().st_size,
+            "references": -1,
+            "references/formats.md": 5000,
+        }
+
+        def fail(path):
+            raise AssertionError(f"{path} walked again")
+
+        monkeypatch.setattr("cli.catalog._list_tree", fail)
+        monkeypatch.setattr("cli.validator._list_skill", fail)
+        assert repository.check(record) == []
+
+    def test_metadata_cache(self, stats_home, mock_repository, temp_dir, monkeypatch):
+        """Cached frontmatter is reused across catalogs until the file changes."""
+        cache = BuildCache(temp_dir / "catalog.json")
+        Catalog(mock_repository, cache=cache).skill_records()
+        cache.save()
+
+        def fail(content):
+            raise AssertionError("frontmatter parsed")
+
+        monkeypatch.setattr("cli.validator.SkillValidator._parse_frontmatter", fail)
+        catalog = Catalog(mock_repository, cache=BuildCache(temp_dir / "catalog.json"))
+        assert catalog.get_skill("csv-tools").allowed_tools == ["Read", "Bash"]
+        assert catalog.get_skill("csv-tools").stats.body_tokens == 2
+
+
+class TestStatsCommand:
+    """Tests for skillz stats."""
+
+    def test_json_report(self, stats_home):
+        """The JSON report covers categories, tools and install footprint."""
+        runner = CliRunner()
+        runner.invoke(cli, ["install", "csv-tools", "--platform", "claude"])
+        result = runner.invoke(cli, ["stats", "--format", "json", "--top", "2"])
+        assert result.exit_code == 0
+
+        report = json.loads(result.output)
+        assert (report["skills"], report["commands"]) == (2, 1)
+        assert [(c["category"], c["skills"], c["commands"]) for c in report["categories"]] == [
+            ("", 1, 1),
+            ("data", 1, 0),
+        ]
+        assert report["allowed_tools"] == {"Read": 2, "Write": 1, "Bash": 1}
+        assert len(report["largest_files"]) == 2
+        [installed] = report["installed"]
+        assert installed["location"] == "personal/claude"
+        assert (installed["skills"], installed["commands"]) == (1, 0)
+        assert installed["bytes"] > 5000
+
+    def test_table_report(self, stats_home):
+        """The table report prints the summary line and category table."""
+        result = CliRunner().invoke(cli, ["stats"])
+        assert result.exit_code == 0
+        assert "2 skills, 1 commands" in result.output
+        assert "Categories" in result.output
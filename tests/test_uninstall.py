@@ -0,0 +1,86 @@
+"""Tests for uninstall command."""
+
+import pytest
+from click.testing import CliRunner
+
+from cli.config import Config
+from cli.main import cli
+
+
+@pytest.fixture
+def installed_home(temp_dir, mock_repository, monkeypatch):
+    """Install three skills and a command for claude and codex under a temp HOME."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(temp_dir)
+    Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(mock_repository)
+    for name, category in (("lab-one", "lab"), ("lab-two", "lab")):
+        skill_dir = mock_repository / "skills" / category / name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\ndescription: Lab\n---\n# Lab\n")
+
+    runner = CliRunner()
+    for platform in ("claude", "codex"):
+        result = runner.invoke(cli, ["install", "--all", "--platform", platform])
+        assert result.exit_code == 0
+    return home
+
+
+def _installed(home, platform):
+    """Names of the skills installed for a platform."""
+    skills_dir = home / f".{platform}" / "skills"
+    return sorted(path.name for path in skills_dir.iterdir())
+
+
+class TestUninstallCommand:
+    """Tests for skillz uninstall."""
+
+    def test_single_item(self, installed_home):
+        """One name removes one item from one location."""
+        result = CliRunner().invoke(cli, ["uninstall", "lab-one", "--force"])
+        assert result.exit_code == 0
+        assert "Successfully uninstalled skill 'lab-one' (reclaimed" in result.output
+        assert _installed(installed_home, "claude") == ["lab-two", "sample-skill"]
+        assert "lab-one" in _installed(installed_home, "codex")
+
+    def test_pattern_all_platforms(self, installed_home):
+        """Patterns match across every platform, with one confirmation."""
+        result = CliRunner().invoke(cli, ["uninstall", "lab-*", "--platform", "all"], input="y\n")
+        assert result.exit_code == 0
+        assert result.output.count("Uninstall 4 items") == 1
+        assert "Uninstalled 4 item(s), reclaimed" in result.output
+        assert _installed(installed_home, "claude") == ["sample-skill"]
+        assert _installed(installed_home, "codex") == ["sample-skill"]
+
+    def test_cancel(self, installed_home):
+        """Declining the confirmation removes nothing."""
+        result = CliRunner().invoke(cli, ["uninstall", "--all"], input="n\n")
+        assert "Uninstall cancelled" in result.output
+        assert _installed(installed_home, "claude") == ["lab-one", "lab-two", "sample-skill"]
+
+    def test_category_dry_run(self, installed_home):
+        """--category selects by repository category; --dry-run reports the bytes."""
+        result = CliRunner().invoke(
+            cli, ["uninstall", "--category", "lab", "--platform", "codex", "--dry-run"]
+        )
+        assert result.exit_code == 0
+        assert "Would uninstall skill 'lab-one'" in result.output
+        assert "sample-skill" not in result.output
+        assert "Would reclaim" in result.output
+        assert _installed(installed_home, "codex") == ["lab-one", "lab-two", "sample-skill"]
+
+    def test_all(self, installed_home):
+        """--all removes skills and commands and updates installed listings."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["uninstall", "--all", "--platform", "all", "--force"])
+        assert result.exit_code == 0
+        assert "Uninstalled 8 item(s)" in result.output
+        listing = runner.invoke(cli, ["list", "--source", "installed", "--platform", "all"])
+        assert "No items found" in listing.output
+
+    def test_not_found(self, installed_home):
+        """Unknown names abort."""
+        result = CliRunner().invoke(cli, ["uninstall", "missing", "--force"])
+        assert result.exit_code == 1
+        assert "'missing' not found in personal for claude" in result.output
@@ -0,0 +1,90 @@
+"""Tests for validate command."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from cli.config import Config
+from cli.main import cli
+
+
+@pytest.fixture
+def repo_home(temp_dir, mock_repository, monkeypatch):
+    """Point HOME at a temp dir with a config referencing the mock repository."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    Config(home / ".config" / "skillz" / "config.yaml").set_repository_path(mock_repository)
+    for name in ("bad-a", "bad-b"):
+        skill_dir = mock_repository / "skills" / name
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(f"---\nname: {name}\n---\n# Test\n")
+    return home
+
+
+class TestValidateCommand:
+    """Tests for skillz validate."""
+
+    def test_valid_items(self, repo_home):
+        """Valid items exit 0."""
+        result = CliRunner().invoke(cli, ["validate", "sample-skill", "sample-command"])
+        assert result.exit_code == 0
+        assert "Checked 2 of 2 item(s): 0 error(s)" in result.output
+
+    def test_repository_checkout(self, mock_repository, temp_dir, monkeypatch):
+        """Without a configured repository, the checkout being run in is validated."""
+        home = temp_dir / "home"
+        home.mkdir()
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.chdir(mock_repository / "skills")
+        result = CliRunner().invoke(cli, ["validate"])
+        assert result.exit_code == 0
+        assert "Checked 2 of 2 item(s): 0 error(s)" in result.output
+
+    def test_jsonl(self, repo_home):
+        """JSON Lines output has one issue per line and exits 1 on errors."""
+        result = CliRunner().invoke(cli, ["validate", "--format", "jsonl"])
+        assert result.exit_code == 1
+        issues = [json.loads(line) for line in result.output.splitlines()]
+        assert [(i["file"], i["rule"], i["line"]) for i in issues] == [
+            ("skills/bad-a/SKILL.md", "missing-field", 1),
+            ("skills/bad-b/SKILL.md", "missing-field", 1),
+        ]
+
+    def test_sarif(self, repo_home):
+        """SARIF output is one valid log with a result per issue."""
+        result = CliRunner().invoke(cli, ["validate", "--format", "sarif"])
+        log = json.loads(result.output)
+        [run] = log["runs"]
+        assert log["version"] == "2.1.0"
+        assert run["tool"]["driver"]["name"] == "skillz"
+        assert [r["ruleId"] for r in run["results"]] == ["missing-field", "missing-field"]
+        location = run["results"][0]["locations"][0]["physicalLocation"]
+        assert location["artifactLocation"]["uri"] == "skills/bad-a/SKILL.md"
+
+    def test_fail_fast(self, repo_home):
+        """--fail-fast stops after the first invalid item."""
+        result = CliRunner().invoke(cli, ["validate", "--fail-fast", "--format", "jsonl"])
+        assert result.exit_code == 1
+        assert len(result.output.splitlines()) == 1
+
+    def test_install_all_continues(self, repo_home):
+        """install --all skips invalid items and installs the rest."""
+        result = CliRunner().invoke(cli, ["install", "--all", "--platform", "codex"])
+        assert result.exit_code == 1
+        assert "Installed skill 'sample-skill'" in result.output
+        assert "Installed command 'sample-command'" in result.output
+        assert "Failed to install 2 item(s)" in result.output
+
+    def test_install_all_warnings(self, repo_home, mock_repository):
+        """install --all counts the lint warnings of installed items."""
+        skill_md = mock_repository / "skills" / "sample-skill" / "SKILL.md"
+        skill_md.write_text(skill_md.read_text() + "Run `scripts/missing.py`.\n")
+        result = CliRunner().invoke(cli, ["install", "--all", "--platform", "codex"])
+        assert "1 warning(s) in 1 installed item(s)" in result.output
+
+        result = CliRunner().invoke(
+            cli, ["--verbose", "install", "--all", "--platform", "codex", "--force"]
+        )
+        assert "Warning: Referenced path not found: scripts/missing.py" in result.output
@@ -157,3 +157,67 @@ model: invalid-model
 """)
         is_valid, errors = CommandValidator.validate_command_file(cmd_file)
         assert is_valid is False
+
+
+class TestIssues:
+    """Tests for structured validation issues."""
+
+    def test_issue_locations(self, temp_dir):
+        """Issues carry a rule ID and the line of the offending field."""
+        skill_dir = temp_dir / "bad-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\ndescription: Test\nname: Bad Skill\nallowed-tools: [Read, Fly]\n---\n# Test\n"
+        )
+        issues = SkillValidator.check_skill_directory(skill_dir)
+        assert [(i.rule, i.line) for i in issues] == [("invalid-name", 3), ("unknown-tool", 4)]
+        assert all(i.severity == "error" and i.file.endswith("SKILL.md") for i in issues)
+        assert SkillValidator.validate_skill_directory(skill_dir) == (
+            False,
+            [i.message for i in issues],
+        )
+
+    def test_empty_command_line(self, temp_dir):
+        """An empty command body is reported after the frontmatter."""
+        cmd_file = temp_dir / "empty.md"
+        cmd_file.write_text("---\ndescription: Test\n---\n")
+        [issue] = CommandValidator.check_command_file(cmd_file)
+        assert (issue.rule, issue.line) == ("empty-content", 4)
+
+
+class TestLinks:
+    """Tests for link and asset integrity checks."""
+
+    def test_links_resolve_against_skill(self, temp_dir):
+        """Relative links and code paths must exist in the skill directory."""
+        skill_dir = temp_dir / "linked-skill"
+        (skill_dir / "references").mkdir(parents=True)
+        (skill_dir / "references" / "guide.md").write_text("# Guide\n")
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: linked-skill\ndescription: Links\n---\n"
+            "See [the guide](references/guide.md#usage) and [docs](https://example.com).\n"
+            "See [missing](references/missing.md) and [up](../other/SKILL.md).\n"
+            "Run `scripts/run.py` or read `references/guide.md`.\n"
+            "```python\nf(result.x)\nopen('assets/data.csv')\n```\n"
+            "[ref]: ./references/gone%20away.md\n"
+        )
+        issues = SkillValidator.check_skill_directory(skill_dir)
+        assert [(i.rule, i.severity, i.line) for i in issues] == [
+            ("broken-link", "error", 6),
+            ("missing-asset", "warning", 7),
+            ("missing-asset", "warning", 10),
+            ("broken-link", "error", 12),
+        ]
+        assert issues[-1].message == "Broken link: ./references/gone%20away.md"
+        assert SkillValidator.validate_skill_directory(skill_dir)[0] is False
+
+    def test_warnings_keep_skill_valid(self, temp_dir):
+        """Missing code paths alone do not make a skill invalid."""
+        skill_dir = temp_dir / "code-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: code-skill\ndescription: Code\n---\nRun `scripts/setup.sh`.\n"
+        )
+        is_valid, errors = SkillValidator.validate_skill_directory(skill_dir)
+        assert is_valid is True
+        assert errors == ["Referenced path not found: scripts/setup.sh"]
@@ -0,0 +1,123 @@
+"""Tests for integrity verification of installed items."""
+
+import hashlib
+import json
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from cli import integrity
+from cli.config import Config
+from cli.core import Installer, SkillRepository
+from cli.integrity import MANIFEST, NONE, REPOSITORY, file_digest
+from cli.locations import install_locations
+from cli.main import cli
+
+
+@pytest.fixture
+def verify_home(temp_dir, mock_repository, monkeypatch):
+    """Install the mock repository for claude under a temp HOME."""
+    home = temp_dir / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.chdir(temp_dir)
+    config = Config(home / ".config" / "skillz" / "config.yaml")
+    config.set_repository_path(mock_repository)
+    with Installer(SkillRepository(mock_repository), config) as installer:
+        installer.install_all(platform="claude")
+        installer.installed()  # First listing records the install directories as scanned
+    return config
+
+
+def _verify(config, mock_repository, use_repository=False):
+    """Verify every installed item, keyed by name."""
+    with Installer(SkillRepository(mock_repository), config) as installer:
+        drifts = installer.verify(installer.installed(), use_repository=use_repository)
+    return {drift.record.name: drift for drift in drifts}
+
+
+class TestVerify:
+    """Tests for Installer.verify."""
+
+    def test_unchanged_files_not_hashed(self, verify_home, mock_repository, monkeypatch):
+        """Files with their installed size and mtime are not read."""
+
+        def fail(path):
+            raise AssertionError(f"hashed {path}")
+
+        monkeypatch.setattr(integrity, "file_digest", fail)
+        drifts = _verify(verify_home, mock_repository)
+        assert {name: (d.baseline, d.ok) for name, d in drifts.items()} == {
+            "sample-skill": (MANIFEST, True),
+            "sample-command": (MANIFEST, True),
+        }
+        assert drifts["sample-skill"].files == 1
+
+    def test_drift(self, verify_home, mock_repository):
+        """Modified, missing and added files are reported."""
+        skill = verify_home.get_skills_dir("personal", "claude") / "sample-skill"
+        (skill / "SKILL.md").write_text((skill / "SKILL.md").read_text() + "\nInjected\n")
+        (skill / "notes.md").write_text("extra")
+        (verify_home.get_commands_dir("personal", "claude") / "sample-command.md").unlink()
+
+        drifts = _verify(verify_home, mock_repository)
+        skill_drift = drifts["sample-skill"]
+        assert (skill_drift.modified, skill_drift.added, skill_drift.hashed) == (
+            ("SKILL.md",),
+            ("notes.md",),
+            1,
+        )
+        assert drifts["sample-command"].missing == ("sample-command.md",)
+
+    def test_touched_but_identical(self, verify_home, mock_repository):
+        """A file with a new mtime but the same content is hashed and passes."""
+        skill_md = verify_home.get_skills_dir("personal", "claude") / "sample-skill" / "SKILL.md"
+        skill_md.write_bytes(skill_md.read_bytes())
+        drift = _verify(verify_home, mock_repository)["sample-skill"]
+        assert drift.ok
+        assert drift.hashed == 1
+
+    def test_repository_baseline(self, verify_home, mock_repository):
+        """Items without a manifest are compared with the repository."""
+        skills_dir = verify_home.get_skills_dir("personal", "codex")
+        skills_dir.mkdir(parents=True)
+        shutil.copytree(mock_repository / "skills" / "sample-skill", skills_dir / "sample-skill")
+        orphan = skills_dir / "orphan"
+        orphan.mkdir()
+        (orphan / "SKILL.md").write_text("---\nname: orphan\ndescription: Gone\n---\n")
+
+        with Installer(SkillRepository(mock_repository), verify_home) as installer:
+            installer.state.reconcile_all(install_locations(verify_home, platforms=["codex"]))
+            drifts = installer.verify(installer.installed(platforms=["codex"]))
+        assert [(d.record.name, d.baseline, d.ok) for d in drifts] == [
+            ("orphan", NONE, False),
+            ("sample-skill", REPOSITORY, True),
+        ]
+
+    def test_file_digest(self, temp_dir):
+        """Digests are BLAKE2b of the whole file, across read buffers."""
+        path = temp_dir / "big.bin"
+        data = bytes(range(256)) * (integrity.BUFFER_SIZE // 256 + 3)
+        path.write_bytes(data)
+        assert file_digest(path) == hashlib.blake2b(data).hexdigest()
+
+
+class TestVerifyCommand:
+    """Tests for skillz verify."""
+
+    def test_clean(self, verify_home):
+        """An untouched install verifies without hashing."""
+        result = CliRunner().invoke(cli, ["verify"])
+        assert result.exit_code == 0
+        assert "Verified 2 item(s), 2 file(s) (0 hashed): 0 drifted" in result.output
+
+    def test_drift_exit_code_and_json(self, verify_home):
+        """Drift exits with status 1 and is listed in the JSON report."""
+        skill = verify_home.get_skills_dir("personal", "claude") / "sample-skill"
+        (skill / "SKILL.md").write_text("tampered")
+        result = CliRunner().invoke(cli, ["verify", "sample-*", "--format", "json"])
+        assert result.exit_code == 1
+        [report] = [r for r in json.loads(result.output) if r["status"] != "ok"]
+        assert report["name"] == "sample-skill"
+        assert report["modified"] == ["SKILL.md"]